@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Load test for NewsScraperPipeline against the local mock API.
+
+Pushes synthetic items through the real pipeline and reports throughput,
+per-item latency and back-pressure (how far processing falls behind the
+offered item rate). Nothing is sent to the production backend or Telegram:
+the pipeline's state (outbox, circuit breakers, corpus) lives in a temporary
+state directory that is removed afterwards, and Redis is not used.
+
+Usage:
+    python load_test_pipeline.py --items 300 --rate 20 --latency-ms 120 --failure-rate 0.05
+    python load_test_pipeline.py --api-url http://127.0.0.1:8765   # already running mock
+"""
+
+import json
+import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+import mock_api_server
+
+PROJECT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'news_scraper_group1')
+
+FILLER_WORDS = [
+    "այսօր", "նախարարը", "հայտարարել", "հանդիպման", "ընթացքում", "քննարկվել",
+    "հարցեր", "որոնք", "վերաբերում", "ծրագրին", "տարվա", "ընթացքում", "նաև",
+    "նշել", "որ", "աշխատանքները", "շարունակվում", "են", "համաձայն", "տվյալների",
+]
+
+
+def build_items(count, keywords, match_ratio, duplicate_ratio, seed):
+    """Synthetic items; a share of them repeat earlier links to hit the 400 duplicate path"""
+    rng = random.Random(seed)
+    items = []
+    for index in range(count):
+        if items and rng.random() < duplicate_ratio:
+            items.append(dict(rng.choice(items)))
+            continue
+        words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(60, 200))]
+        if keywords and rng.random() < match_ratio:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        link = f"https://loadtest.local/news/{seed}-{index}"
+        items.append({
+            'title': f"Փորձնական հոդված #{index}",
+            'link': link,
+            'source_url': link,
+            'content': " ".join(words),
+            'scraped_time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        })
+    return items
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def run(args):
+    server = None
+    api_url = args.api_url
+    if not api_url:
+        backend = mock_api_server.backend_from_args(args)
+        server, api_url = mock_api_server.start_in_thread(host='127.0.0.1', port=0, backend=backend)
+        print(f"🧪 Mock API սկսվեց՝ {api_url}")
+
+    # Pipeline-ը կարդում է այս փոփոխականները __init__-ում
+    os.environ['API_BASE_URL'] = api_url
+    # Outbox records carry no API URL: whatever stays in the real state directory would be
+    # posted to the production backend by the next monitor run. Nothing listens on port 1,
+    # so every store falls back to files in the temporary directory (no dedup markers or
+    # keyword snapshot in the real Redis either).
+    state_dir = tempfile.mkdtemp(prefix='news-loadtest-')
+    os.environ['NEWS_MONITOR_STATE_DIR'] = state_dir
+    os.environ['REDIS_URL'] = 'redis://127.0.0.1:1/0'
+    os.environ['TELEGRAM_API_URL'] = api_url
+    os.environ.setdefault('TELEGRAM_BOT_TOKEN', 'loadtest')
+    os.environ.setdefault('TELEGRAM_CHAT_ID', 'loadtest')
+
+    try:
+        sys.path.insert(0, PROJECT_PATH)
+        from news_scraper.pipelines import NewsScraperPipeline
+
+        logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+        spider = SimpleNamespace(
+            name='loadtest',
+            new_articles=0,
+            duplicate_articles=0,
+            logger=logging.getLogger('loadtest'),
+        )
+
+        pipeline = NewsScraperPipeline()
+        keywords = [kw['word'] for kw in pipeline.fallback_keywords]
+        items = build_items(args.items, keywords, args.match_ratio, args.duplicate_ratio, args.seed)
+
+        if hasattr(pipeline, 'open_spider'):
+            pipeline.open_spider(spider)
+
+        latencies = []
+        max_lag = 0.0
+        started = time.perf_counter()
+        for index, item in enumerate(items):
+            # Offered load: item N "arrives" at N / rate seconds; lag shows back-pressure
+            if args.rate:
+                arrival = started + index / args.rate
+                now = time.perf_counter()
+                if now < arrival:
+                    time.sleep(arrival - now)
+                max_lag = max(max_lag, time.perf_counter() - arrival)
+            item_started = time.perf_counter()
+            pipeline.process_item(dict(item), spider)
+            latencies.append(time.perf_counter() - item_started)
+        processing_done = time.perf_counter()
+
+        pipeline.close_spider(spider)
+        finished = time.perf_counter()
+
+        elapsed = processing_done - started
+        report = {
+            'api_url': api_url,
+            'items': len(items),
+            'elapsed_s': round(elapsed, 3),
+            'close_spider_s': round(finished - processing_done, 3),
+            'throughput_items_per_s': round(len(items) / elapsed, 2) if elapsed else 0,
+            'latency_ms': {
+                'p50': round(percentile(latencies, 0.50) * 1000, 1),
+                'p95': round(percentile(latencies, 0.95) * 1000, 1),
+                'p99': round(percentile(latencies, 0.99) * 1000, 1),
+                'max': round(max(latencies) * 1000, 1) if latencies else 0,
+            },
+            'offered_rate_per_s': args.rate or None,
+            'max_lag_s': round(max_lag, 3) if args.rate else None,
+            'spider_new_articles': spider.new_articles,
+            'spider_duplicate_articles': spider.duplicate_articles,
+        }
+        if server:
+            report['mock_api'] = server.backend.stats()
+            server.shutdown()
+            server.server_close()
+
+        print("📊 Pipeline load test արդյունք:")
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return report
+    finally:
+        shutil.rmtree(state_dir, ignore_errors=True)
+
+
+def main():
+    parser = mock_api_server.build_arg_parser()
+    parser.description = "Push synthetic items through NewsScraperPipeline against a mock API"
+    parser.add_argument('--api-url', default='', help="use an already running mock API instead of starting one")
+    parser.add_argument('--items', type=int, default=200)
+    parser.add_argument('--rate', type=float, default=0, help="offered items per second (0 = as fast as possible)")
+    parser.add_argument('--match-ratio', type=float, default=0.5, help="share of items containing a keyword")
+    parser.add_argument('--duplicate-ratio', type=float, default=0.1, help="share of items repeating an earlier link")
+    parser.add_argument('--seed', type=int, default=1)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the backend API (https://beackkayq.onrender.com).
+
+Implements the endpoints the monitor and the pipeline talk to, so that the
+pipeline can be load tested without touching production data:
+
+    GET    /api/keywords/            (ETag; 304 for a matching If-None-Match)
+    GET    /api/articles/
+    POST   /api/articles/            (201, or 400 "already exists" for duplicate links)
+    DELETE /api/articles/cleanup/?before_date=<ISO>
+    POST   /bot<token>/sendMessage   (Telegram stand-in)
+    GET    /mock/stats/              (request counters)
+
+Usage:
+    python mock_api_server.py --port 8765 --latency-ms 150 --failure-rate 0.05
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_KEYWORDS = [
+    "Հայաստան", "Երևան", "Նիկոլ Փաշինյան", "Կառավարություն", "Պատգամավոր",
+    "Բանակ", "Սահման", "Տնտեսություն", "Կրթություն", "Առողջապահություն",
+]
+
+
+class MockBackend:
+    """In-memory state shared by all request handler threads"""
+
+    def __init__(self, keywords=None, latency_ms=0, jitter_ms=0, failure_rate=0.0,
+                 failure_status=503, hang_rate=0.0, hang_seconds=15):
+        self.lock = threading.Lock()
+        self.keywords = [
+            {"id": index, "word": word, "is_active": True}
+            for index, word in enumerate(keywords or DEFAULT_KEYWORDS, start=1)
+        ]
+        self.articles = {}
+        self.telegram_messages = []
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.counters = {}
+
+    def count(self, name):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def simulate_network(self):
+        """Apply configured latency and decide whether to inject a failure"""
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000.0)
+        if self.hang_rate and random.random() < self.hang_rate:
+            self.count('injected_hangs')
+            time.sleep(self.hang_seconds)
+        if self.failure_rate and random.random() < self.failure_rate:
+            self.count('injected_failures')
+            return True
+        return False
+
+    def save_article(self, data):
+        link = data.get('link')
+        if not link or not data.get('title'):
+            return 400, {"detail": "title and link are required"}
+        with self.lock:
+            if link in self.articles:
+                return 400, {"link": ["news article with this link already exists."]}
+            article = dict(data)
+            article['id'] = len(self.articles) + 1
+            article['created_at'] = datetime.now().isoformat()
+            self.articles[link] = article
+            return 201, article
+
+    def cleanup(self, before_date):
+        try:
+            cutoff = datetime.fromisoformat(before_date.replace('Z', '+00:00'))
+        except (AttributeError, ValueError):
+            return 400, {"error": "Invalid date format"}
+        with self.lock:
+            stale = [
+                link for link, article in self.articles.items()
+                if datetime.fromisoformat(article['created_at']) < cutoff.replace(tzinfo=None)
+            ]
+            for link in stale:
+                del self.articles[link]
+        return 200, {
+            "deleted_count": len(stale),
+            "message": f"Successfully deleted {len(stale)} old articles"
+        }
+
+    def stats(self):
+        with self.lock:
+            return {
+                "articles": len(self.articles),
+                "telegram_messages": len(self.telegram_messages),
+                "counters": dict(self.counters),
+            }
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    backend = None  # set by make_server()
+    quiet = True
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            return None
+
+    def _route(self, method):
+        url = urlparse(self.path)
+        path = url.path.rstrip('/') + '/'
+        # Telegram token-ը չենք պահում counter-ների մեջ
+        self.backend.count(f"{method} {'/bot/sendMessage/' if path.startswith('/bot') else path}")
+
+        if path == '/mock/stats/':
+            return self._send_json(200, self.backend.stats())
+
+        if self.backend.simulate_network():
+            return self._send_json(self.backend.failure_status, {"detail": "injected failure"})
+
+        if method == 'GET' and path in ('/', '/api/', '/health/', '/status/'):
+            return self._send_json(200, {"status": "ok", "mock": True})
+        if method == 'GET' and path == '/api/keywords/':
+            with self.backend.lock:
+                keywords = list(self.backend.keywords)
+            etag = '"%s"' % hashlib.sha1(json.dumps(keywords, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            return self._send_json(200, keywords, {'ETag': etag})
+        if method == 'GET' and path == '/api/articles/':
+            with self.backend.lock:
+                articles = list(self.backend.articles.values())
+            return self._send_json(200, articles)
+        if method == 'POST' and path == '/api/articles/':
+            data = self._read_json()
+            if data is None:
+                return self._send_json(400, {"detail": "invalid JSON"})
+            return self._send_json(*self.backend.save_article(data))
+        if method == 'DELETE' and path == '/api/articles/cleanup/':
+            before_date = parse_qs(url.query).get('before_date', [None])[0]
+            if not before_date:
+                return self._send_json(400, {"error": "before_date parameter required"})
+            return self._send_json(*self.backend.cleanup(before_date))
+        if method == 'POST' and path.startswith('/bot') and path.endswith('/sendMessage/'):
+            data = self._read_json() or {}
+            with self.backend.lock:
+                self.backend.telegram_messages.append(data)
+            return self._send_json(200, {"ok": True, "result": {"message_id": len(self.backend.telegram_messages)}})
+
+        return self._send_json(404, {"detail": "Not found."})
+
+    def do_GET(self):
+        self._route('GET')
+
+    def do_POST(self):
+        self._route('POST')
+
+    def do_DELETE(self):
+        self._route('DELETE')
+
+
+def make_server(host='127.0.0.1', port=8765, backend=None, quiet=True):
+    """Create (but do not start) a mock API server bound to host:port"""
+    handler = type('BoundMockAPIHandler', (MockAPIHandler,), {
+        'backend': backend or MockBackend(),
+        'quiet': quiet,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.backend = handler.backend
+    return server
+
+
+def start_in_thread(**kwargs):
+    """Start a mock server in a daemon thread; returns (server, base_url)"""
+    server = make_server(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, name='mock-api', daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Local mock of the news backend API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0, help="fixed latency added to every request")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="random extra latency (0..jitter)")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="share of requests answered with --failure-status")
+    parser.add_argument('--failure-status', type=int, default=503)
+    parser.add_argument('--hang-rate', type=float, default=0.0, help="share of requests that stall for --hang-seconds")
+    parser.add_argument('--hang-seconds', type=float, default=15)
+    parser.add_argument('--keywords', default='', help="comma separated keyword list (default: fallback keywords)")
+    parser.add_argument('--verbose', action='store_true', help="log every request")
+    return parser
+
+
+def backend_from_args(args):
+    keywords = [word.strip() for word in args.keywords.split(',') if word.strip()] or None
+    return MockBackend(
+        keywords=keywords,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+    )
+
+
+def main():
+    args = build_arg_parser().parse_args()
+    server = make_server(args.host, args.port, backend_from_args(args), quiet=not args.verbose)
+    print(f"🧪 Mock API աշխատում է՝ http://{args.host}:{args.port}")
+    print(f"   latency={args.latency_ms}ms jitter={args.jitter_ms}ms failure_rate={args.failure_rate} hang_rate={args.hang_rate}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 Mock API վիճակագրություն: {json.dumps(server.backend.stats(), ensure_ascii=False)}")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
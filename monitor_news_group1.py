@@ -18,6 +18,24 @@ print("🔍 Debug: All imports completed")
 # Memory optimization imports
 import gc
 import psutil
+import redis
+import traceback
+
+# Shared helpers live in the Scrapy project package (no Scrapy import needed for these)
+SCRAPY_PROJECT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'news_scraper_group1')
+if SCRAPY_PROJECT_PATH not in sys.path:
+    sys.path.insert(0, SCRAPY_PROJECT_PATH)
+from news_scraper.circuit_breaker import CircuitBreakerRegistry
+from news_scraper.budgets import CycleDeadline, RunCostStore, TimeoutBudgets, cycle_order
+from news_scraper.corpus import article_corpus
+from news_scraper.health import OK, TIMEOUT, SpiderHealth
+from news_scraper.keyword_feed import KeywordFeed
+from news_scraper.leader import LeaderElection, Maintenance
+from news_scraper.manifest import check_manifest
+from news_scraper.outbox import Outbox
+from news_scraper.schedule import SpiderSchedule
+from news_scraper.storage import redis_client
+from news_scraper.zygote import CrawlZygote, ZygoteError, supported as zygote_supported
 
 def cleanup_memory():
     """Memory cleanup function"""
@@ -44,6 +62,8 @@ class NewsMonitorAPI:
             'Content-Type': 'application/json',
             'User-Agent': 'NewsMonitor/1.0'
         })
+        # Same persisted circuit state as the pipeline, so a dead backend is not hit every cycle
+        self.breakers = CircuitBreakerRegistry()
         
     def test_connection(self):
         """API-ի կապի ստուգում"""
@@ -76,6 +96,10 @@ class NewsMonitorAPI:
     
     def cleanup_old_articles(self, days_to_keep):
         """Հին հոդվածների մաքրում API-ի միջոցով"""
+        breaker = self.breakers.get('cleanup')
+        if not breaker.allow_request():
+            print("⛔ API cleanup բաց թողնված (circuit-ը բաց է)")
+            return 0
         try:
             cleanup_date = (datetime.now() - timedelta(days=days_to_keep)).isoformat()
             print(f"🧹 Փորձում ենք մաքրել հոդվածները {cleanup_date} ամսաթվից առաջ...")
@@ -98,6 +122,7 @@ class NewsMonitorAPI:
                     )
                     
                     if response.status_code == 200:
+                        breaker.record_success()
                         data = response.json()
                         deleted_count = data.get('deleted_count', 0)
                         print(f"✅ Հաջողությամբ մաքրվեց {deleted_count} հոդված")
@@ -114,54 +139,51 @@ class NewsMonitorAPI:
                     continue
             
             print("❌ Ոչ մի endpoint չաշխատեց")
+            breaker.record_failure()
             return 0
             
         except Exception as e:
             print(f"❌ API cleanup exception: {e}")
+            breaker.record_failure()
             return 0
-    
-    def get_keywords(self):
-        """Բանալի բառերի ստացում API-ից"""
-        try:
-            print(f"🔍 Փորձում ենք ստանալ բանալի բառեր...")
-            
-            # Փորձում ենք տարբեր endpoint-ներ
-            endpoints_to_try = [
-                f"{self.api_base_url}/api/keywords/",
-                f"{self.api_base_url}/api/keywords",
-                f"{self.api_base_url}/keywords/",
-                f"{self.api_base_url}/keywords"
-            ]
-            
-            for endpoint in endpoints_to_try:
-                try:
-                    print(f"🔗 Փորձում ենք endpoint՝ {endpoint}")
-                    response = self.session.get(endpoint, timeout=10)
-                    
-                    if response.status_code == 200:
-                        keywords = response.json()
-                        print(f"✅ Ստացվեց {len(keywords)} բանալի բառ")
-                        return keywords
-                    elif response.status_code == 404:
-                        print(f"⚠️ Endpoint չի գտնվել՝ {endpoint}")
-                        continue
-                    else:
-                        print(f"❌ API keywords error: {response.status_code} - {response.text}")
-                        continue
-                        
-                except requests.exceptions.RequestException as e:
-                    print(f"⚠️ Network error {endpoint}: {e}")
-                    continue
-            
-            print("❌ Ոչ մի keywords endpoint չաշխատեց")
-            return []
-            
-        except Exception as e:
-            print(f"❌ API keywords exception: {e}")
-            return []
 
-def run_scrapy_with_reactor_fix(spider_name, scrapy_project_path):
-    """Run scrapy with reactor signal handling fix"""
+def backfill_new_keywords(added, snapshot):
+    """Run keywords added in the backend against the recent-article corpus (news_scraper/corpus.py)"""
+    corpus = article_corpus()
+    if not corpus:
+        return
+    queued = corpus.backfill(added, Outbox(), snapshot['keywords'])
+    print(f"🔎 Նոր բանալի բառեր ({', '.join(added)})՝ corpus-ից outbox ուղարկվեց {queued} հոդված")
+
+def cleanup_task(api_client, days_to_keep):
+    """Maintenance task: delete the backend's old articles"""
+    deleted_count = api_client.cleanup_old_articles(days_to_keep)
+    if deleted_count > 0:
+        print(f"🗑️ ԽՈՒՄԲ 1 - API-ի միջոցով մաքրվել է {deleted_count} հին հոդված")
+    return deleted_count
+
+def run_maintenance(maintenance):
+    """Run the due global tasks if this worker is the leader (news_scraper/leader.py)"""
+    try:
+        ran = maintenance.run_due()
+    except redis.RedisError as e:
+        print(f"⚠️ Maintenance-ը բաց թողնված (Redis-ի սխալ): {e}")
+        return
+    except Exception as e:
+        # A bug in a task, not a Redis outage: keep the traceback
+        print(f"❌ Maintenance task-ի սխալ: {e}")
+        traceback.print_exc()
+        return
+    if ran:
+        print(f"👑 {maintenance.election.worker_id} (leader) կատարեց՝ {', '.join(ran)}")
+
+# Warm zygote process shared by all spider runs (see news_scraper/zygote.py)
+crawl_zygote = None
+
+def run_scrapy_with_reactor_fix(spider_name, scrapy_project_path, timeout=120):
+    """Run scrapy with reactor signal handling fix (spider_name may be a batch list)"""
+    spider_names = [spider_name] if isinstance(spider_name, str) else list(spider_name)
+    spider_name = ', '.join(spider_names)
     try:
         # Set environment variables to fix reactor issues
         env = dict(os.environ)
@@ -175,16 +197,38 @@ def run_scrapy_with_reactor_fix(spider_name, scrapy_project_path):
             'PYTHONWARNINGS': 'ignore'
         })
         
-        # Use simple scrapy crawl command with environment variables
-        result = subprocess.run([
-            sys.executable, '-m', 'scrapy', 'crawl', spider_name
-        ], 
-            cwd=scrapy_project_path,
-            capture_output=True,
-            text=True,
-            timeout=120,  # 2 minutes per spider
-            env=env
-        )
+        result = None
+        # Zygote mode: fork the spider from a warm process that already imported Scrapy
+        if zygote_supported():
+            global crawl_zygote
+            if crawl_zygote is None:
+                crawl_zygote = CrawlZygote(scrapy_project_path, env)
+            try:
+                if not crawl_zygote.alive():
+                    info = crawl_zygote.start()
+                    print(f"🧬 Crawl zygote-ը պատրաստ է ({info['mode']}, pid {info['pid']}, {info['modules']} module, {info['preload_seconds']} վրկ)")
+                try:
+                    result = crawl_zygote.run(spider_names, timeout=timeout)
+                finally:
+                    if crawl_zygote.retired_reason:
+                        print(f"♻️ Crawl zygote-ը փոխարինվում է ({crawl_zygote.retired_reason})")
+            except ZygoteError as zygote_error:
+                # Raised only before the crawl started; a hung or dead run comes back as its result
+                print(f"⚠️ Zygote-ի սխալ, գործարկում ենք առանձին process-ով: {zygote_error}")
+
+        if result is None:
+            # Use simple scrapy crawl command with environment variables
+            command = [sys.executable, '-m', 'scrapy', 'crawl', spider_names[0]]
+            if len(spider_names) > 1:
+                # `scrapy crawl` takes one spider; the zygote module's runner takes a batch
+                command = [sys.executable, '-m', 'news_scraper.zygote', 'crawl', *spider_names]
+            result = subprocess.run(command, 
+                cwd=scrapy_project_path,
+                capture_output=True,
+                text=True,
+                timeout=timeout,  # the batch's budget (news_scraper/budgets.py)
+                env=env
+            )
         
         # Print full error details for debugging
         if result.returncode != 0:
@@ -198,6 +242,9 @@ def run_scrapy_with_reactor_fix(spider_name, scrapy_project_path):
         
         return result
         
+    except subprocess.TimeoutExpired:
+        # crawl_batch reports it (and the health registry counts it as a timeout)
+        raise
     except Exception as reactor_error:
         print(f"❌ Scrapy crawl failed: {reactor_error}")
         # Return a mock result to prevent crashes
@@ -208,45 +255,215 @@ def run_scrapy_with_reactor_fix(spider_name, scrapy_project_path):
         mock_result.stderr = f"Scrapy crawl failed: {reactor_error}"
         return mock_result
 
+def crawl_batch(batch, scrapy_project_path, health=None, budgets=None):
+    """Run one batch of spiders and print the interesting lines of their output.
+
+    Returns {spider: outcome} from the health registry (news_scraper/health.py), or None without one
+    """
+    spider_name = ', '.join(batch)
+    started = time.time()
+    timed_out = False
+    timeout = batch_timeout(budgets, batch)
+    print(f"🕷️ ԽՈՒՄԲ 1 - Սկսվում է սարդը՝ {spider_name}")
+    print(f"🔍 Debug: Spider {spider_name} start time: {datetime.now().strftime('%H:%M:%S')}, timeout {timeout:.0f} վրկ")
+
+    try:
+        result = run_scrapy_with_reactor_fix(batch, scrapy_project_path, timeout)
+
+        if result.returncode == 0:
+            # Extract key info from output
+            lines = result.stdout.split('\n')
+            found_output = False
+            for line in lines:
+                if any(keyword in line for keyword in ['📊 ԱՄՓՈՓՈՒՄ', '✅ Բանալի բառ գտնվեց', '💾 Նոր հոդված', '🔄 Կրկնություն', '📄 Հոդված', '🔍 Գտնված', '📰 Գտնվել է', '✅ Բանալի բառ գտնվեց', '❌ Բանալի բառ չգտնվեց']):
+                    print(f"    ԽՈՒՄԲ 1 - {line.strip()}")
+                    found_output = True
+
+            if not found_output:
+                print(f"    ԽՈՒՄԲ 1 - {spider_name}: Ոչ մի հոդված չի գտնվել")
+                # Show first few lines of stdout for debugging
+                if result.stdout:
+                    print(f"    ԽՈՒՄԲ 1 - {spider_name} stdout preview: {result.stdout[:300]}...")
+
+            # Show stderr if there are any errors
+            if result.stderr:
+                print(f"    ԽՈՒՄԲ 1 - {spider_name} stderr: {result.stderr[:200]}...")
+
+            print(f"✅ ԽՈՒՄԲ 1 - {spider_name} ավարտված")
+        else:
+            # Print full error details
+            print(f"❌ ԽՈՒՄԲ 1 - {spider_name} սխալ (return code: {result.returncode})")
+            if result.stdout:
+                print(f"📄 STDOUT: {result.stdout}")
+            if result.stderr:
+                print(f"❌ STDERR: {result.stderr}")
+
+            # If it's a critical error, skip this spider for this cycle
+            error_msg = result.stderr if result.stderr else "Unknown error"
+            if "Could not find spider class" in error_msg or "ImportError" in error_msg:
+                print(f"⚠️ ԽՈՒՄԲ 1 - {spider_name} բաց թողնված այս ցիկլում")
+
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        print(f"⏰ ԽՈՒՄԲ 1 - {spider_name} timeout ({timeout:.0f} վրկ)")
+        print(f"🔍 Debug: Spider {spider_name} took too long, skipping...")
+    except Exception as e:
+        print(f"❌ ԽՈՒՄԲ 1 - {spider_name} սխալ: {e}")
+
+    outcomes = None
+    if health is not None:
+        try:
+            outcomes = health.record_batch(batch, started, timed_out)
+        except Exception as e:
+            print(f"⚠️ Spider-ների առողջությունը չհաջողվեց թարմացնել: {e}")
+        for name, outcome in (outcomes or {}).items():
+            if outcome != OK:
+                print(f"🩺 ԽՈՒՄԲ 1 - {name}: {outcome}")
+
+    if budgets is not None:
+        # Spiders cut off at the timeout get a longer one next time; the others are back to normal
+        if timed_out:
+            killed = [name for name in batch if outcomes is None or outcomes.get(name) == TIMEOUT]
+        else:
+            killed = []
+        budgets.timed_out(killed)
+        budgets.completed([name for name in batch if name not in killed])
+    return outcomes
+
+def batch_timeout(budgets, batch):
+    """Timeout of a batch from its spiders' run-time history (news_scraper/budgets.py)"""
+    if budgets is None:
+        return 120
+    try:
+        return budgets.batch_timeout(batch)
+    except Exception as e:
+        print(f"⚠️ Run-time պատմությունը չհաջողվեց կարդալ: {e}")
+        return budgets.default
+
+def runnable_spiders(health, spiders):
+    """The spiders not in quarantine; the quarantined ones are listed with their retry time"""
+    if health is None:
+        return list(spiders)
+    try:
+        runnable, quarantined = health.split(spiders)
+    except Exception as e:
+        print(f"⚠️ Spider-ների առողջությունը չհաջողվեց կարդալ: {e}")
+        return list(spiders)
+    for name, record in sorted(quarantined.items()):
+        retry = datetime.fromtimestamp(record['retry_at']).strftime('%H:%M')
+        print(f"🚑 {name} կարանտինում է ({record['bad_runs']} անհաջող գործարկում, վերջինը՝ {record['last_outcome']}), հաջորդ փորձը՝ {retry}")
+    return runnable
+
+def ordered_spiders(health, budgets, spiders, deferred):
+    """Priority order of the cycle from run costs and health (news_scraper/budgets.py)"""
+    try:
+        costs = budgets.store.load(list(spiders))
+        records = health.store.load(list(spiders)) if health else {}
+    except Exception as e:
+        print(f"⚠️ Կայքերի պատմությունը չհաջողվեց կարդալ, հերթականությունը՝ առանց դրա: {e}")
+        costs, records = {}, {}
+    return cycle_order(spiders, costs, records, deferred)
+
+def print_health_summary(health):
+    """One line per spider whose last run was bad"""
+    if health is None:
+        return
+    try:
+        unhealthy = health.unhealthy()
+    except Exception as e:
+        print(f"⚠️ Spider-ների առողջությունը չհաջողվեց կարդալ: {e}")
+        return
+    if not unhealthy:
+        print("🩺 Բոլոր spider-ները առողջ են")
+        return
+    print(f"🩺 Խնդրահարույց spider-ներ՝ {len(unhealthy)}")
+    now = time.time()
+    for name, record in sorted(unhealthy.items(), key=lambda pair: -pair[1]['bad_runs']):
+        counts = ', '.join(f"{kind}×{record[kind]}" for kind in ('failed', 'empty', 'timeout') if record.get(kind))
+        status = f"կարանտին մինչև {datetime.fromtimestamp(record['retry_at']).strftime('%H:%M')}" if record.get('retry_at', 0) > now else "գործարկվում է"
+        print(f"   • {name}: {record['bad_runs']} անընդմեջ ({counts}), {status}")
+
+def run_coordinated(schedule, maintenance, health, budgets, batch_size, scrapy_project_path):
+    """Claim due spiders from the shared Redis schedule and crawl them (CRAWL_COORDINATION=redis)"""
+    # Renewed while the batch runs; after a worker dies its spiders come back within this time
+    lease_seconds = int(os.environ.get('CRAWL_LEASE_SECONDS', 180))
+    while True:
+        run_maintenance(maintenance)
+
+        try:
+            batch = schedule.claim(batch_size, lease_seconds)
+        except Exception as e:
+            print(f"⚠️ Ընդհանուր schedule-ը (Redis) անհասանելի է: {e}")
+            time.sleep(5)
+            continue
+        if not batch:
+            time.sleep(min(max(schedule.next_due_in(), 2), 30))
+            continue
+
+        print(f"🎫 {schedule.worker_id} վերցրեց՝ {', '.join(batch)}")
+        runnable = runnable_spiders(health, batch)
+        # A quarantined spider keeps its slot: skipped now, checked again next interval
+        skipped = [name for name in batch if name not in runnable]
+        if skipped:
+            schedule.complete(skipped)
+        if not runnable:
+            continue
+        batch = runnable
+        try:
+            with schedule.hold(batch, lease_seconds):
+                crawl_batch(batch, scrapy_project_path, health, budgets)
+        except BaseException:
+            # Not finished: free the spiders for another worker right away
+            schedule.release(batch)
+            raise
+        schedule.complete(batch)
+
+def select_spider_group(spiders, group_index):
+    """This worker's share of the spiders, from the partition_spiders.py assignment.
+
+    None if the assignment cannot be used: crawling everything instead would make every
+    misconfigured worker crawl the whole site list
+    """
+    groups_file = os.environ.get('SPIDER_GROUPS_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spider_groups.json'))
+    try:
+        with open(groups_file, 'r', encoding='utf-8') as f:
+            groups = json.load(f)['groups']
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Spider խմբերը չհաջողվեց կարդալ ({groups_file}): {e}")
+        return None
+    if not 0 <= group_index < len(groups):
+        print(f"❌ SPIDER_GROUP={group_index}, բայց {groups_file}-ում կա {len(groups)} խումբ")
+        return None
+
+    assigned = {name for group in groups for name in group['spiders']}
+    loads = [group.get('cost_seconds', 0) for group in groups]
+    members = set(groups[group_index]['spiders'])
+    # Sites added after the partition go to the least loaded group (same answer on every worker)
+    average_cost = sum(loads) / max(1, len(assigned))
+    for name in sorted(set(spiders) - assigned):
+        lightest = loads.index(min(loads))
+        loads[lightest] += average_cost
+        if lightest == group_index:
+            members.add(name)
+    selected = [name for name in spiders if name in members]
+    expected = groups[group_index].get('expected_cycle_seconds')
+    print(f"🧩 Spider խումբ {group_index}/{len(groups)}՝ {len(selected)} spider (սպասվող ցիկլ ~{expected} վրկ)")
+    return selected
+
 def get_spiders_list(scrapy_project_path):
-    """Get list of available spiders by scanning spider files directly"""
+    """Get list of available spiders from the site registry (news_scraper/sites.py)"""
     spiders = []
     
-    # Method 1: Direct file scanning (most reliable)
-    spiders_dir = os.path.join(scrapy_project_path, 'news_scraper', 'spiders')
-    print(f"🔍 Ստուգում ենք spiders պանակը՝ {spiders_dir}")
-    
-    if os.path.exists(spiders_dir):
-        try:
-            for filename in os.listdir(spiders_dir):
-                if filename.endswith('.py') and filename != '__init__.py':
-                    spider_file = os.path.join(spiders_dir, filename)
-                    print(f"📄 Գտնված spider ֆայլ՝ {filename}")
-                    
-                    # Try to extract spider name from file
-                    try:
-                        with open(spider_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            # Look for name = 'spider_name' pattern
-                            import re
-                            name_matches = re.findall(r"name\s*=\s*['\"]([^'\"]+)['\"]", content)
-                            if name_matches:
-                                spider_name = name_matches[0]
-                                spiders.append(spider_name)
-                                print(f"✅ Գտնված spider՝ {spider_name}")
-                            else:
-                                # Fallback: use filename without .py
-                                spider_name = filename[:-3]
-                                if spider_name not in ['__init__', 'base']:
-                                    spiders.append(spider_name)
-                                    print(f"✅ Fallback spider՝ {spider_name}")
-                    except Exception as e:
-                        print(f"⚠️ Չհաջողվեց կարդալ {filename}: {e}")
-                        
-        except Exception as e:
-            print(f"❌ Spiders պանակի սկանավորման սխալ: {e}")
-    else:
-        print(f"❌ Spiders պանակը գոյություն չունի՝ {spiders_dir}")
+    # Method 1: Site registry - every spider is one SITES entry (no Scrapy import needed)
+    print(f"🔍 Ստուգում ենք կայքերի ռեեստրը՝ {os.path.join(scrapy_project_path, 'news_scraper', 'sites.py')}")
+    try:
+        if scrapy_project_path not in sys.path:
+            sys.path.insert(0, scrapy_project_path)
+        from news_scraper.sites import SITES
+        spiders = list(SITES)
+        print(f"✅ Ռեեստրում գտնված spider-ներ՝ {len(spiders)}")
+    except Exception as e:
+        print(f"❌ Կայքերի ռեեստրի ընթերցման սխալ: {e}")
     
     # Method 2: Try Scrapy's spider loader as fallback (only if Method 1 failed)
     if not spiders:
@@ -267,38 +484,8 @@ def get_spiders_list(scrapy_project_path):
                 'PYTHONWARNINGS': 'ignore'
             })
             
-            # Simpler approach without using deprecated modules
-            result = subprocess.run([
-                sys.executable, '-W', 'ignore', '-c', f'''
-import warnings
-warnings.filterwarnings("ignore")
-
-import sys
-import os
-sys.path.insert(0, "{scrapy_project_path}")
-
-try:
-    import importlib.util
-    import glob
-    
-    spider_files = glob.glob("{spiders_dir}/*.py")
-    for spider_file in spider_files:
-        if not spider_file.endswith("__init__.py"):
-            with open(spider_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if 'class' in content and 'Spider' in content:
-                    import re
-                    names = re.findall(r"name\\s*=\\s*['\\""]([^'\\"\"]+)['\\""]", content)
-                    if names:
-                        print(names[0])
-                    else:
-                        basename = os.path.basename(spider_file)[:-3]
-                        if basename not in ['__init__', 'base']:
-                            print(basename)
-except Exception as subprocess_error:
-    print(f"Error: {{subprocess_error}}", file=sys.stderr)
-    sys.exit(1)
-'''],
+            result = subprocess.run(
+                [sys.executable, '-W', 'ignore', '-m', 'scrapy', 'list'],
                 cwd=scrapy_project_path,
                 capture_output=True,
                 text=True,
@@ -316,16 +503,6 @@ except Exception as subprocess_error:
         except Exception as e:
             print(f"❌ Scrapy loader սխալ: {e}")
     
-    # Method 3: Hardcoded fallback for common spider names
-    if not spiders:
-        print("🔄 Փորձում ենք ստանդարտ spider անուններ...")
-        common_spiders = ['asbarez', 'aravot', 'news_am', 'panorama', 'hetq']
-        for spider_name in common_spiders:
-            spider_file = os.path.join(spiders_dir, f'{spider_name}.py')
-            if os.path.exists(spider_file):
-                spiders.append(spider_name)
-                print(f"✅ Ստանդարտ spider գտնված՝ {spider_name}")
-    
     return list(set(spiders))  # Remove duplicates
 
 def check_project_structure(scrapy_project_path):
@@ -402,34 +579,27 @@ def main():
     
     # Test API connection
     api_connected = api_client.test_connection()
-    if api_connected:
-        try:
-            keywords = api_client.get_keywords()
-            print(f"✅ API կապ հաստատված, բանալի բառեր՝ {len(keywords)}")
-            print(f"🔍 Keywords: {[kw.get('word', '') for kw in keywords]}")
-        except Exception as e:
-            print(f"⚠️ API keywords սխալ՝ {e}")
-            keywords = []
-    else:
+    if not api_connected:
         print("⚠️ API կապի խնդիր, շարունակում ենք Scrapy-ով...")
-        keywords = []
-    
-    # Fallback keywords if API is not available
-    if not keywords:
-        print("📝 Օգտագործում ենք fallback բանալի բառեր...")
-        keywords = [
-            {"word": "Հայաստան", "is_active": True},
-            {"word": "Երևան", "is_active": True},
-            {"word": "Նիկոլ Փաշինյան", "is_active": True},
-            {"word": "Կառավարություն", "is_active": True},
-            {"word": "Պատգամավոր", "is_active": True},
-            {"word": "Բանակ", "is_active": True},
-            {"word": "Սահման", "is_active": True},
-            {"word": "Տնտեսություն", "is_active": True},
-            {"word": "Կրթություն", "is_active": True},
-            {"word": "Առողջապահություն", "is_active": True}
-        ]
-        print(f"✅ Fallback բանալի բառեր՝ {len(keywords)}")
+
+    # Global maintenance runs on one worker at a time (Redis leader lock), on its own schedule
+    cleanup_interval_minutes = int(os.environ.get('CLEANUP_INTERVAL_MINUTES', 60))
+    election = LeaderElection(redis_client(), int(os.environ.get('LEADER_LEASE_SECONDS', 600)))
+    maintenance = Maintenance(election)
+    maintenance.add('cleanup', cleanup_interval_minutes * 60, lambda: cleanup_task(api_client, days_to_keep))
+    print(f"👑 Maintenance (cleanup ամեն {cleanup_interval_minutes} րոպե)՝ ընթացիկ leader՝ {election.leader() or 'չկա'}")
+
+    # The only keyword fetcher: polls the API (ETag) and publishes snapshots that the crawl
+    # processes swap in (news_scraper/keyword_feed.py)
+    keyword_feed = KeywordFeed(api_base_url, redis_client(), on_added=backfill_new_keywords)
+    snapshot = keyword_feed.refresh()
+    if snapshot:
+        print(f"✅ Բանալի բառեր v{snapshot['version']}՝ {len(snapshot['keywords'])}")
+        print(f"🔍 Keywords: {snapshot['keywords']}")
+    else:
+        print("📝 Բանալի բառեր դեռ չկան, pipeline-ը կօգտագործի fallback բանալի բառեր")
+    keyword_feed.start()
+    print(f"🔑 Բանալի բառերը թարմացվում են ամեն {keyword_feed.interval:.0f} վրկ")
 
     # Set up Scrapy environment for GROUP 1
     scrapy_project_path = os.path.join(os.path.dirname(__file__), 'news_scraper_group1')
@@ -468,70 +638,79 @@ def main():
     
     print(f"✅ ԽՈՒՄԲ 1 - Գտնված սարդեր՝ {', '.join(spiders)}")
 
+    # Crawls load spiders through the manifest; a module SITES does not name would never run
+    manifest_problems = check_manifest()
+    for problem in manifest_problems:
+        print(f"⚠️ Spider manifest: {problem}")
+    if not manifest_problems:
+        print("✅ Spider manifest-ը համապատասխանում է spiders պանակին")
+
+    # Balanced groups (partition_spiders.py); a shared Redis schedule makes them unnecessary
+    spider_group = os.environ.get('SPIDER_GROUP')
+    if spider_group and os.environ.get('CRAWL_COORDINATION', 'local') != 'redis':
+        spiders = select_spider_group(spiders, int(spider_group)) if spider_group.isdigit() else None
+        if spiders is None:
+            print(f"❌ ԽՈՒՄԲ 1 - SPIDER_GROUP={spider_group} հնարավոր չէ կիրառել, գործարկեք `python partition_spiders.py` կամ ուղղեք SPIDER_GROUP-ը։ Ելք։")
+            sys.exit(1)
+
+    # Sites crawled together in one process (CONCURRENT_REQUESTS* in settings.py keep each site polite)
+    batch_size = max(1, int(os.environ.get('CRAWL_BATCH_SIZE', 4)))
+    print(f"🔀 Միաժամանակ գործարկվող spider-ներ՝ {batch_size}")
+
+    # Several identical workers: spiders are claimed from a shared Redis schedule with leases
+    schedule = None
+    if os.environ.get('CRAWL_COORDINATION', 'local') == 'redis':
+        coordination_client = redis_client()
+        if coordination_client:
+            schedule = SpiderSchedule(coordination_client, interval_minutes * 60)
+            removed = schedule.sync(spiders)
+            print(f"🤝 Ընդհանուր schedule (Redis), worker՝ {schedule.worker_id}; ընթացիկ lease-ներ՝ {len(schedule.leases())}")
+            if removed:
+                print(f"🗑️ Schedule-ից հանվեցին՝ {', '.join(removed)}")
+        else:
+            print("⚠️ CRAWL_COORDINATION=redis, բայց Redis չկա, աշխատում ենք տեղական ցիկլով")
+
+    # Consecutive failures per spider; persistently failing sites are retried with backoff
+    health = None
+    if os.environ.get('SPIDER_HEALTH_ENABLED', '1') != '0':
+        health = SpiderHealth(redis_client())
+        print(f"🩺 Կարանտին {health.quarantine_after} անընդմեջ անհաջող գործարկումից հետո (backoff՝ {health.backoff / 60:.0f} րոպեից)")
+
+    # Per-spider timeouts from their run-time history, and a deadline for a whole cycle
+    budgets = TimeoutBudgets(RunCostStore(redis_client()))
+    cycle_deadline_minutes = float(os.environ.get('CRAWL_CYCLE_DEADLINE_MINUTES', 15))
+    print(f"⏱️ Timeout-ները՝ p{budgets.percent:.0f} + {budgets.headroom:.0%} ({budgets.minimum:.0f}-{budgets.maximum:.0f} վրկ), ցիկլի deadline՝ {cycle_deadline_minutes:g} րոպե")
+    deferred = []
+
     cycle_count = 0
     
     try:
+        if schedule:
+            run_coordinated(schedule, maintenance, health, budgets, batch_size, scrapy_project_path)
         while True:
             cycle_count += 1
             print(f"\n🔄 ԽՈՒՄԲ 1 - Ցիկլ #{cycle_count} - {datetime.now().strftime('%H:%M:%S')}")
             
-            # Cleanup old articles via API (only if API is connected)
-            if api_connected:
-                deleted_count = api_client.cleanup_old_articles(days_to_keep)
-                if deleted_count > 0:
-                    print(f"🗑️ ԽՈՒՄԲ 1 - API-ի միջոցով մաքրվել է {deleted_count} հին հոդված")
-                else:
-                    print("⚠️ API cleanup բաց թողնված (կապ չկա)")
+            # Cleanup old articles via API when due, on the leader only (the 'cleanup' circuit
+            # skips it while the API is down)
+            run_maintenance(maintenance)
 
-            # Run each spider with reactor fix
-            for spider_name in spiders:
-                print(f"🕷️ ԽՈՒՄԲ 1 - Սկսվում է սարդը՝ {spider_name}")
-                print(f"🔍 Debug: Spider {spider_name} start time: {datetime.now().strftime('%H:%M:%S')}")
-                
-                try:
-                    result = run_scrapy_with_reactor_fix(spider_name, scrapy_project_path)
-                    
-                    if result.returncode == 0:
-                        # Extract key info from output
-                        lines = result.stdout.split('\n')
-                        found_output = False
-                        for line in lines:
-                            if any(keyword in line for keyword in ['📊 ԱՄՓՈՓՈՒՄ', '✅ Բանալի բառ գտնվեց', '💾 Նոր հոդված', '🔄 Կրկնություն', '📄 Հոդված', '🔍 Գտնված', '📰 Գտնվել է', '✅ Բանալի բառ գտնվեց', '❌ Բանալի բառ չգտնվեց']):
-                                print(f"    ԽՈՒՄԲ 1 - {line.strip()}")
-                                found_output = True
-                        
-                        if not found_output:
-                            print(f"    ԽՈՒՄԲ 1 - {spider_name}: Ոչ մի հոդված չի գտնվել")
-                            # Show first few lines of stdout for debugging
-                            if result.stdout:
-                                print(f"    ԽՈՒՄԲ 1 - {spider_name} stdout preview: {result.stdout[:300]}...")
-                        
-                        # Show stderr if there are any errors
-                        if result.stderr:
-                            print(f"    ԽՈՒՄԲ 1 - {spider_name} stderr: {result.stderr[:200]}...")
-                        
-                        print(f"✅ ԽՈՒՄԲ 1 - {spider_name} ավարտված")
-                    else:
-                        # Print full error details
-                        print(f"❌ ԽՈՒՄԲ 1 - {spider_name} սխալ (return code: {result.returncode})")
-                        if result.stdout:
-                            print(f"📄 STDOUT: {result.stdout}")
-                        if result.stderr:
-                            print(f"❌ STDERR: {result.stderr}")
-                        
-                        # If it's a critical error, skip this spider for this cycle
-                        error_msg = result.stderr if result.stderr else "Unknown error"
-                        if "Could not find spider class" in error_msg or "ImportError" in error_msg:
-                            print(f"⚠️ ԽՈՒՄԲ 1 - {spider_name} բաց թողնված այս ցիկլում")
-                        
-                except subprocess.TimeoutExpired:
-                    print(f"⏰ ԽՈՒՄԲ 1 - {spider_name} timeout (2 րոպե)")
-                    print(f"🔍 Debug: Spider {spider_name} took too long, skipping...")
-                except Exception as e:
-                    print(f"❌ ԽՈՒՄԲ 1 - {spider_name} սխալ: {e}")
-                    # Continue with next spider instead of crashing
-                    continue
+            # Run spiders in batches: sites in one batch crawl concurrently, one download slot each.
+            # Priority order (deferred, healthy, productive first); what does not fit in the
+            # cycle deadline goes first next cycle
+            cycle_spiders = ordered_spiders(health, budgets, runnable_spiders(health, spiders), deferred)
+            deadline = CycleDeadline(cycle_deadline_minutes * 60)
+            deferred = []
+            for start in range(0, len(cycle_spiders), batch_size):
+                batch = cycle_spiders[start:start + batch_size]
+                # The first batch always runs, so a cycle never defers everything
+                if start and not deadline.allows(budgets.expected(batch)):
+                    deferred = cycle_spiders[start:]
+                    print(f"⏭️ ԽՈՒՄԲ 1 - Ցիկլի deadline-ը մոտ է, հաջորդ ցիկլին են տեղափոխվում՝ {', '.join(deferred)}")
+                    break
+                crawl_batch(batch, scrapy_project_path, health, budgets)
 
+            print_health_summary(health)
             print(f"✅ ԽՈՒՄԲ 1 - Ցիկլ #{cycle_count} ավարտված")
             print(f"😴 ԽՈՒՄԲ 1 - Հաջորդ ստուգումը՝ {interval_minutes} րոպեից...")
             
@@ -0,0 +1,125 @@
+# Crawl time budgets
+#
+# Every batch used to get the same 120 s timeout - far more than a 10-second site needs
+# when it hangs, and now and then too little for a heavy one. RunCostRecorder
+# (extensions.py) keeps the last RUN_TIME_WINDOW run times of each spider ('recent' in
+# spider_costs). TimeoutBudgets turns them into a timeout per spider:
+#
+#   CRAWL_TIMEOUT_PERCENTILE (95) of the recent run times * (1 + CRAWL_TIMEOUT_HEADROOM)
+#   + CRAWL_TIMEOUT_PADDING, within CRAWL_TIMEOUT_MIN..CRAWL_TIMEOUT_MAX
+#
+# With fewer than CRAWL_TIMEOUT_MIN_SAMPLES runs the spider gets CRAWL_TIMEOUT_SECONDS. A
+# batch gets the largest timeout of its spiders. A killed run leaves no run time behind, so
+# a spider that hit its timeout has it doubled (up to the maximum) until a run completes: a
+# site that got slower grows into a new budget instead of being killed every cycle.
+#
+# CycleDeadline bounds a whole monitor cycle (CRAWL_CYCLE_DEADLINE_MINUTES). Sites are taken
+# in priority order and a batch whose typical run time no longer fits is deferred with
+# everything after it instead of starting, so the trim always drops the tail of the order.
+# cycle_order derives the priority from the stored history: sites deferred by the previous
+# cycle first (nothing waits more than one cycle), then healthy before those whose last run
+# was bad, then by yield - items of the last run per second of average run time - with sites
+# that have no history yet up front. A SITES 'priority' (higher first, default 0) overrides it.
+
+import math
+import os
+import time
+
+from news_scraper.sites import SITES
+from news_scraper.storage import StateStore
+
+COSTS_REDIS_KEY = 'spider_costs'
+
+
+class RunCostStore(StateStore):
+    """Per-spider run cost: {spider: {'runs', 'duration', 'duration_max', 'recent', 'bytes', 'items', 'updated'}}"""
+
+    redis_key = COSTS_REDIS_KEY
+    file_name = 'spider_costs.json'
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+class TimeoutBudgets:
+    def __init__(self, store):
+        self.store = store
+        self.default = float(os.environ.get('CRAWL_TIMEOUT_SECONDS', 120))
+        self.minimum = float(os.environ.get('CRAWL_TIMEOUT_MIN', 30))
+        self.maximum = float(os.environ.get('CRAWL_TIMEOUT_MAX', 300))
+        self.percent = float(os.environ.get('CRAWL_TIMEOUT_PERCENTILE', 95))
+        self.headroom = float(os.environ.get('CRAWL_TIMEOUT_HEADROOM', 0.5))
+        self.padding = float(os.environ.get('CRAWL_TIMEOUT_PADDING', 15))
+        self.min_samples = int(os.environ.get('CRAWL_TIMEOUT_MIN_SAMPLES', 5))
+        # Spiders killed at their timeout since their last complete run: {spider: factor}
+        self.extended = {}
+
+    def timeout(self, name, record=None):
+        """Seconds a run of this spider may take"""
+        recent = (record or {}).get('recent') or []
+        if len(recent) < self.min_samples:
+            budget = self.default
+        else:
+            budget = percentile(recent, self.percent) * (1 + self.headroom) + self.padding
+        budget *= self.extended.get(name, 1)
+        return min(max(budget, self.minimum), self.maximum)
+
+    def batch_timeout(self, batch):
+        """The largest timeout of the batch's spiders (they crawl together)"""
+        records = self.store.load(list(batch))
+        return max(self.timeout(name, records.get(name)) for name in batch)
+
+    def expected(self, batch):
+        """Typical run time of the batch: its slowest spider's average (the default timeout's half without one)"""
+        records = self.store.load(list(batch))
+        durations = [records[name]['duration'] for name in batch if name in records]
+        return max(durations) if durations else self.default / 2
+
+    def timed_out(self, batch):
+        for name in batch:
+            self.extended[name] = min(self.extended.get(name, 1) * 2, 16)
+
+    def completed(self, batch):
+        for name in batch:
+            self.extended.pop(name, None)
+
+
+class CycleDeadline:
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.started = time.monotonic()
+
+    def remaining(self):
+        return self.seconds - (time.monotonic() - self.started)
+
+    def allows(self, expected):
+        """True if a run of about expected seconds still ends within the deadline (always without one)"""
+        return not self.seconds or self.remaining() >= expected
+
+
+def site_yield(record):
+    """Items per second of run time from a spider_costs record (None without history)"""
+    if not record or not record.get('duration'):
+        return None
+    return record.get('items', 0) / record['duration']
+
+
+def cycle_order(spiders, costs=None, health=None, deferred=()):
+    """Crawl order for a cycle from spider_costs and spider_health records ({spider: record})"""
+    costs = costs or {}
+    health = health or {}
+
+    def key(name):
+        rate = site_yield(costs.get(name))
+        return (
+            -SITES.get(name, {}).get('priority', 0),
+            name not in deferred,
+            bool(health.get(name, {}).get('bad_runs')),
+            rate is not None,
+            -(rate or 0),
+        )
+
+    return sorted(spiders, key=key)
@@ -0,0 +1,137 @@
+# Circuit breaker for backend API operations
+#
+# closed    - requests go through; consecutive failures are counted
+# open      - requests are refused until retry_at; delay doubles on every failed probe
+# half_open - one probe request is allowed; success closes, failure re-opens
+#
+# State is kept per operation ('keywords', 'save', 'telegram', 'cleanup'...) and persisted
+# to a JSON file, so the next spider subprocess does not hammer a backend that is down. The
+# monitor, zygote children and crawl processes share the file: a change re-reads it under a
+# file lock and writes back only the changed breaker.
+
+import fcntl
+import logging
+import os
+import threading
+import time
+
+from news_scraper.storage import load_json, save_json_atomic, state_path
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=3, base_delay=30, max_delay=900, on_change=None, state=None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.on_change = on_change
+        self.logger = logging.getLogger(__name__)
+
+        state = state or {}
+        self.state = state.get('state', CLOSED)
+        self.failures = state.get('failures', 0)
+        self.open_count = state.get('open_count', 0)
+        self.retry_at = state.get('retry_at', 0)
+        self.probe_in_flight = False
+
+    def to_dict(self):
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'open_count': self.open_count,
+            'retry_at': self.retry_at,
+        }
+
+    @property
+    def is_open(self):
+        return self.state == OPEN and time.time() < self.retry_at
+
+    def allow_request(self):
+        """True if the operation may be attempted now"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if time.time() < self.retry_at:
+                return False
+            self._transition(HALF_OPEN)
+        # half-open: only a single probe at a time
+        if self.probe_in_flight:
+            return False
+        self.probe_in_flight = True
+        return True
+
+    def record_success(self):
+        self.probe_in_flight = False
+        if self.state != CLOSED or self.failures:
+            self.failures = 0
+            self.open_count = 0
+            self.retry_at = 0
+            self._transition(CLOSED)
+
+    def record_failure(self):
+        self.probe_in_flight = False
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.open_count += 1
+            delay = min(self.max_delay, self.base_delay * (2 ** (self.open_count - 1)))
+            self.retry_at = time.time() + delay
+            self._transition(OPEN)
+            self.logger.warning(f"⛔ Circuit '{self.name}' բաց է {delay:.0f} վրկ ({self.failures} անընդմեջ սխալ)")
+        elif self.on_change:
+            self.on_change(self)
+
+    def _transition(self, new_state):
+        old_state = self.state
+        self.state = new_state
+        if old_state != new_state:
+            if new_state == CLOSED:
+                self.logger.info(f"✅ Circuit '{self.name}' փակվեց (API-ն կրկին աշխատում է)")
+            elif new_state == HALF_OPEN:
+                self.logger.info(f"🔎 Circuit '{self.name}' half-open, փորձնական հարցում...")
+        if self.on_change:
+            self.on_change(self)
+
+
+class CircuitBreakerRegistry:
+    """Per-operation breakers sharing one persisted state file"""
+
+    def __init__(self, path=None, failure_threshold=None, base_delay=None, max_delay=None):
+        self.path = path or state_path('circuit_breakers.json')
+        self.failure_threshold = failure_threshold or int(os.environ.get('API_CIRCUIT_FAILURE_THRESHOLD', 3))
+        self.base_delay = base_delay or float(os.environ.get('API_CIRCUIT_BASE_DELAY', 30))
+        self.max_delay = max_delay or float(os.environ.get('API_CIRCUIT_MAX_DELAY', 900))
+        self._saved = load_json(self.path, {}) or {}
+        self.breakers = {}
+        # The outbox drainer thread records save/telegram outcomes concurrently
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        if name not in self.breakers:
+            self.breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=self.failure_threshold,
+                base_delay=self.base_delay,
+                max_delay=self.max_delay,
+                on_change=self._persist,
+                state=self._saved.get(name),
+            )
+        return self.breakers[name]
+
+    def _persist(self, breaker):
+        try:
+            with self._lock, open(f"{self.path}.lock", 'w') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                # Other processes' breakers as they are now, with only this one replaced
+                saved = load_json(self.path, {}) or {}
+                saved[breaker.name] = breaker.to_dict()
+                save_json_atomic(self.path, saved)
+                self._saved = saved
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"⚠️ Circuit state-ը չհաջողվեց պահպանել: {e}")
+
+    def summary(self):
+        return {name: breaker.state for name, breaker in self.breakers.items()}
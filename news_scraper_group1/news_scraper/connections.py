@@ -0,0 +1,150 @@
+# Connection reuse across spider runs
+#
+# Scrapy gives every crawler its own HTTP connection pool, closed when the spider closes, and
+# its DNS cache never expires. Polling the same ~70 hosts every cycle then repeats DNS, TCP
+# and TLS handshakes for small listing pages.
+#
+# - PersistentHTTPDownloadHandler: one keep-alive pool per process, shared by all crawlers and
+#   kept open when a spider closes. In the resident crawl mode (news_scraper/zygote.py) the
+#   process lives across polls, so the next poll of a site reuses the open connection; idle
+#   connections are dropped after CONNECTION_POOL_IDLE_TIMEOUT.
+# - TTLCachingResolver: DNS answers cached for DNSCACHE_TTL seconds (at most DNSCACHE_SIZE hosts)
+#   and written to state/dns_cache.json, so they also survive between forked runs. The file is
+#   written when the reactor shuts down, and at most every DNS_SAVE_INTERVAL seconds in between
+#   (the resident zygote's reactor runs for hours).
+
+import logging
+import time
+
+from twisted.internet import defer
+from twisted.internet.base import ThreadedResolver
+from twisted.web.client import HTTPConnectionPool
+
+from scrapy.core.downloader.handlers.http11 import HTTP11DownloadHandler
+from scrapy.resolver import CachingThreadedResolver
+
+from news_scraper.storage import load_json, save_json_atomic, state_path
+
+logger = logging.getLogger(__name__)
+
+
+class CountingConnectionPool(HTTPConnectionPool):
+    """HTTPConnectionPool that counts new vs reused connections"""
+
+    def __init__(self, reactor, persistent=True):
+        super().__init__(reactor, persistent)
+        self.opened = 0
+        self.reused = 0
+
+    def getConnection(self, key, endpoint):
+        if self._connections.get(key):
+            self.reused += 1
+        else:
+            self.opened += 1
+        return super().getConnection(key, endpoint)
+
+
+# The process-wide pool (created with the first handler, after the reactor is installed)
+_shared_pool = None
+
+
+def shared_pool(reactor, settings):
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = CountingConnectionPool(reactor, persistent=True)
+        _shared_pool._factory.noisy = False
+        _shared_pool.cachedConnectionTimeout = settings.getint('CONNECTION_POOL_IDLE_TIMEOUT')
+    _shared_pool.maxPersistentPerHost = max(
+        _shared_pool.maxPersistentPerHost, settings.getint('CONCURRENT_REQUESTS_PER_DOMAIN')
+    )
+    return _shared_pool
+
+
+class PersistentHTTPDownloadHandler(HTTP11DownloadHandler):
+    def __init__(self, settings, crawler=None):
+        super().__init__(settings, crawler)
+        from twisted.internet import reactor
+
+        # Replace the per-crawler pool (still empty) with the process-wide one
+        self._pool = shared_pool(reactor, settings)
+
+    def close(self):
+        # Keep idle connections for the next run; they expire after cachedConnectionTimeout.
+        # http and https handlers share the pool - report the counters once.
+        counters = (self._pool.opened, self._pool.reused)
+        if counters != getattr(self._pool, 'reported', None):
+            self._pool.reported = counters
+            logger.info(f"🔌 HTTP կապեր՝ {counters[0]} նոր, {counters[1]} կրկին օգտագործված")
+        return defer.succeed(None)
+
+
+# host -> [address, expires_at]; shared by all resolvers of the process
+_dns_entries = {}
+_dns_dirty = False
+_dns_saved_at = 0.0
+
+DNS_SAVE_INTERVAL = 60
+
+
+class TTLCachingResolver(CachingThreadedResolver):
+    """CachingThreadedResolver whose answers expire after DNSCACHE_TTL and persist across runs"""
+
+    def __init__(self, reactor, cache_size, timeout, ttl):
+        super().__init__(reactor, cache_size, timeout)
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self.enabled = bool(cache_size and ttl)
+        self.file_path = state_path('dns_cache.json')
+
+    @classmethod
+    def from_crawler(cls, crawler, reactor):
+        if crawler.settings.getbool('DNSCACHE_ENABLED'):
+            cache_size = crawler.settings.getint('DNSCACHE_SIZE')
+        else:
+            cache_size = 0
+        return cls(reactor, cache_size, crawler.settings.getfloat('DNS_TIMEOUT'),
+                   crawler.settings.getint('DNSCACHE_TTL'))
+
+    def install_on_reactor(self):
+        global _dns_saved_at
+        if self.enabled:
+            if not _dns_entries:
+                now = time.time()
+                saved = load_json(self.file_path, {}) or {}
+                _dns_entries.update({host: entry for host, entry in saved.items() if entry[1] > now})
+                _dns_saved_at = now
+            self.reactor.addSystemEventTrigger('before', 'shutdown', self.save)
+        super().install_on_reactor()
+
+    def getHostByName(self, name, timeout=None):
+        entry = _dns_entries.get(name) if self.enabled else None
+        if entry and entry[1] > time.time():
+            return defer.succeed(entry[0])
+        # Same timeout override as CachingThreadedResolver (DNS_TIMEOUT)
+        d = ThreadedResolver.getHostByName(self, name, (self.timeout,))
+        if self.enabled:
+            d.addCallback(self._remember, name)
+        return d
+
+    def _remember(self, address, name):
+        global _dns_dirty
+        now = time.time()
+        _dns_entries[name] = [address, now + self.ttl]
+        while len(_dns_entries) > self.cache_size:
+            _dns_entries.pop(next(iter(_dns_entries)))
+        _dns_dirty = True
+        if now - _dns_saved_at >= DNS_SAVE_INTERVAL:
+            self.save()
+        return address
+
+    def save(self):
+        """Write the cache to state/dns_cache.json if it changed since the last write"""
+        global _dns_dirty, _dns_saved_at
+        if not _dns_dirty:
+            return
+        _dns_dirty = False
+        _dns_saved_at = time.time()
+        try:
+            save_json_atomic(self.file_path, _dns_entries)
+        except OSError as e:
+            logger.warning(f"⚠️ DNS cache-ը չհաջողվեց պահել: {e}")
@@ -0,0 +1,169 @@
+# Local corpus of recently crawled articles, for keyword backfill
+#
+# A keyword added in the backend used to apply only to articles crawled after it. Every
+# article that passes the content checks is now also kept in state/corpus.sqlite3 (content
+# zlib-compressed, normalized text indexed with SQLite FTS5) for DAYS_TO_KEEP_ARTICLES days,
+# whether it matched a keyword or not. When KeywordFeed publishes a list with new words, the
+# monitor runs backfill(): unsent articles matching a new word go to the outbox, and from
+# there through the normal save + Telegram path. Without FTS5 the candidates are scanned.
+#
+#   python -m news_scraper.corpus backfill "Գյումրի"    # manual backfill of one keyword
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+from news_scraper.storage import state_path
+from news_scraper.text_normalization import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    link TEXT UNIQUE NOT NULL,
+    title TEXT,
+    content BLOB,
+    scraped_time TEXT,
+    normalized TEXT,
+    spider TEXT,
+    added REAL,
+    sent INTEGER DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS articles_added ON articles(added);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(normalized, content='articles', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, normalized) VALUES (new.id, new.normalized);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, normalized) VALUES ('delete', old.id, old.normalized);
+END;
+"""
+
+
+class ArticleCorpus:
+    def __init__(self, path=None, days_to_keep=None):
+        self.path = path or state_path('corpus.sqlite3')
+        self.max_age = 86400 * float(days_to_keep or os.environ.get('DAYS_TO_KEEP_ARTICLES', 7))
+        self.lock = threading.Lock()
+        # Spider, pipeline and monitor processes share the file; WAL lets them read while one writes
+        self.db = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(SCHEMA)
+        try:
+            self.db.executescript(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False
+        self.prune()
+
+    def add(self, link, title, content, scraped_time, normalized, spider=None):
+        """Keep a cleaned article; an already stored link is left as it is"""
+        with self.lock:
+            self.db.execute(
+                'INSERT OR IGNORE INTO articles (link, title, content, scraped_time, normalized, spider, added)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (link, title, zlib.compress((content or '').encode('utf-8')), scraped_time, normalized, spider,
+                 time.time()),
+            )
+
+    def mark_sent(self, link):
+        """The article went to the outbox (it is in the backend or on its way there)"""
+        with self.lock:
+            self.db.execute('UPDATE articles SET sent = 1 WHERE link = ?', (link,))
+
+    def prune(self):
+        with self.lock:
+            deleted = self.db.execute('DELETE FROM articles WHERE added < ?', (time.time() - self.max_age,)).rowcount
+        if deleted:
+            logger.info(f"🧹 Corpus-ից հեռացվեց {deleted} հին հոդված")
+
+    def candidates(self, matcher):
+        """Unsent rows that may match one of the matcher's keywords (FTS prefix query per keyword)"""
+        cutoff = time.time() - self.max_age
+        with self.lock:
+            if not self.fts:
+                return self.db.execute(
+                    'SELECT link, title, content, scraped_time, normalized FROM articles WHERE sent = 0 AND added >= ?',
+                    (cutoff,)).fetchall()
+            rows = {}
+            for stems in matcher.stems.values():
+                query = ' AND '.join(f'"{token}"*' for token in stems)
+                for row in self.db.execute(
+                        'SELECT a.link, a.title, a.content, a.scraped_time, a.normalized FROM articles_fts'
+                        ' JOIN articles a ON a.id = articles_fts.rowid'
+                        ' WHERE articles_fts MATCH ? AND a.sent = 0 AND a.added >= ?', (query, cutoff)):
+                    rows[row[0]] = row
+            return list(rows.values())
+
+    def backfill(self, words, outbox, keywords=None):
+        """Queue unsent articles matching any of the new words; returns how many were queued.
+
+        keywords - the whole current list, so a queued article carries every keyword it matches
+        """
+        new_matcher = KeywordMatcher(words)
+        if not new_matcher:
+            return 0
+        all_matcher = KeywordMatcher(keywords) if keywords else new_matcher
+        queued = 0
+        for link, title, content, scraped_time, normalized in self.candidates(new_matcher):
+            if not new_matcher.search(normalized):
+                continue
+            outbox.append({
+                'title': title,
+                'link': link,
+                'source_url': link,
+                'content': zlib.decompress(content).decode('utf-8'),
+                'scraped_time': scraped_time or '',
+                'keywords': all_matcher.matches(normalized),
+            })
+            self.mark_sent(link)
+            queued += 1
+        return queued
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+# One corpus connection per process
+_corpus = None
+_corpus_lock = threading.Lock()
+
+
+def article_corpus():
+    """Shared ArticleCorpus, or None when CORPUS_ENABLED=0 or the database cannot be opened"""
+    global _corpus
+    if os.environ.get('CORPUS_ENABLED', '1') == '0':
+        return None
+    with _corpus_lock:
+        if _corpus is None:
+            try:
+                _corpus = ArticleCorpus()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Corpus-ը չհաջողվեց բացել: {e}")
+                return None
+        return _corpus
+
+
+def main(argv):
+    if len(argv) < 2 or argv[0] != 'backfill':
+        print('usage: python -m news_scraper.corpus backfill <keyword> [<keyword> ...]')
+        return 2
+    from news_scraper.outbox import Outbox
+
+    corpus = ArticleCorpus()
+    queued = corpus.backfill(argv[1:], Outbox())
+    print(f"📦 Outbox-ում ավելացվեց {queued} հոդված ({', '.join(argv[1:])})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,179 @@
+# Date parsing for listing and article pages
+#
+# The sites print dates as ISO strings, "19.10.2026 14:30", "19 հոկտեմբերի, 2026",
+# "հոկտեմբերի 19, 2026", "5 րոպե առաջ", "երեկ 14:30", a bare "14:30" or a Unix timestamp -
+# in Armenian, Russian or English. parse_date() turns any of these into an aware datetime
+# (dates without a zone are Armenian time). Patterns are compiled once and the text -> parse
+# result is memoized; relative forms are cached unresolved and applied to "now" on each call.
+# No Scrapy imports.
+
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+ARMENIA_TZ = timezone(timedelta(hours=4))
+
+# Month stems (nominative, genitive and abbreviated forms all start with one of these)
+MONTH_STEMS = {
+    # Armenian, plus the standard abbreviations
+    'հունվար': 1, 'փետրվար': 2, 'մարտ': 3, 'ապրիլ': 4, 'մայիս': 5, 'հունիս': 6,
+    'հուլիս': 7, 'օգոստոս': 8, 'սեպտեմբեր': 9, 'հոկտեմբեր': 10, 'նոյեմբեր': 11, 'դեկտեմբեր': 12,
+    'հնվ': 1, 'փտվ': 2, 'մրտ': 3, 'ապր': 4, 'մյս': 5, 'հնս': 6,
+    'հլս': 7, 'օգս': 8, 'սպտ': 9, 'հկտ': 10, 'նյմ': 11, 'դկտ': 12,
+    # Short forms used by the news sites ("12 հոկտ. 2025"). Longest stems are tried first, so
+    # 'հունվ' (January) wins over 'հուն' (June), and the full month names over both.
+    'հունվ': 1, 'փետր': 2, 'մայ': 5, 'հուն': 6, 'հուլ': 7, 'օգ': 8, 'սեպտ': 9, 'հոկտ': 10,
+    'նոյ': 11, 'դեկ': 12,
+    # Russian
+    'янв': 1, 'фев': 2, 'мар': 3, 'апр': 4, 'мая': 5, 'май': 5, 'июн': 6,
+    'июл': 7, 'авг': 8, 'сен': 9, 'окт': 10, 'ноя': 11, 'дек': 12,
+    # English
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+_MONTH = '(' + '|'.join(sorted(MONTH_STEMS, key=len, reverse=True)) + r')\w*\.?'
+
+UNIT_SECONDS = {
+    'վայրկյան': 1, 'րոպե': 60, 'ժամ': 3600, 'օր': 86400, 'շաբաթ': 7 * 86400, 'ամիս': 30 * 86400,
+    'сек': 1, 'мин': 60, 'час': 3600, 'дн': 86400, 'день': 86400, 'недел': 7 * 86400, 'месяц': 30 * 86400,
+    'second': 1, 'sec': 1, 'minute': 60, 'min': 60, 'hour': 3600, 'day': 86400, 'week': 7 * 86400,
+    'month': 30 * 86400,
+}
+_UNIT = '(' + '|'.join(sorted(UNIT_SECONDS, key=len, reverse=True)) + r')\w*'
+
+DAY_WORDS = {'այսօր': 0, 'сегодня': 0, 'today': 0, 'երեկ': 1, 'вчера': 1, 'yesterday': 1}
+JUST_NOW = ('հենց նոր', 'только что', 'just now')
+
+ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?(?:Z|[+-]\d{2}:?\d{2})?')
+TIMESTAMP_RE = re.compile(r'^\d{10}(?:\d{3})?$')
+TIME_RE = re.compile(r'\b(\d{1,2}):(\d{2})\b')
+NUMERIC_RE = re.compile(r'\b(\d{1,2})[./-](\d{1,2})[./-](\d{4}|\d{2})\b')
+YMD_SLASH_RE = re.compile(r'\b(\d{4})[./](\d{1,2})[./](\d{1,2})\b')
+DAY_MONTH_RE = re.compile(r'\b(\d{1,2})\s*' + _MONTH + r'[\s,]*(\d{4})?', re.IGNORECASE)
+MONTH_DAY_RE = re.compile(_MONTH + r'\s+(\d{1,2})\b(?:[\s,]*(\d{4}))?', re.IGNORECASE)
+AGO_RE = re.compile(r'(\d+)\s*' + _UNIT + r'\s*(?:առաջ|назад|ago)', re.IGNORECASE)
+DAY_WORD_RE = re.compile('(' + '|'.join(DAY_WORDS) + ')', re.IGNORECASE)
+
+
+def _month(stem):
+    return MONTH_STEMS[stem.lower()]
+
+
+def _time(text):
+    match = TIME_RE.search(text)
+    if match and int(match.group(1)) < 24 and int(match.group(2)) < 60:
+        return int(match.group(1)), int(match.group(2))
+    return 0, 0
+
+
+def _year(value):
+    year = int(value)
+    return year + 2000 if year < 100 else year
+
+
+@lru_cache(maxsize=4096)
+def _parse(text):
+    """Parse result independent of "now": ('at', datetime) | ('ago', seconds) |
+    ('day', days_back, hour, minute) | ('clock', hour, minute) | ('no_year', month, day, hour, minute) | None"""
+    text = ' '.join(text.split())
+    lowered = text.lower()
+    if not text:
+        return None
+
+    if TIMESTAMP_RE.match(text):
+        seconds = int(text[:10])
+        return 'at', datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+    match = ISO_RE.search(text)
+    if match:
+        try:
+            parsed = datetime.fromisoformat(match.group(0).replace('Z', '+00:00'))
+            return 'at', parsed if parsed.tzinfo else parsed.replace(tzinfo=ARMENIA_TZ)
+        except ValueError:
+            pass
+
+    if any(phrase in lowered for phrase in JUST_NOW):
+        return 'ago', 0
+    match = AGO_RE.search(lowered)
+    if match:
+        return 'ago', int(match.group(1)) * UNIT_SECONDS[match.group(2).lower()]
+
+    hour, minute = _time(text)
+    try:
+        match = YMD_SLASH_RE.search(text)
+        if match:
+            year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+            return 'at', datetime(year, month, day, hour, minute, tzinfo=ARMENIA_TZ)
+        match = NUMERIC_RE.search(text)
+        if match:
+            day, month, year = int(match.group(1)), int(match.group(2)), _year(match.group(3))
+            return 'at', datetime(year, month, day, hour, minute, tzinfo=ARMENIA_TZ)
+        match = DAY_MONTH_RE.search(text)
+        if match:
+            day, month = int(match.group(1)), _month(match.group(2))
+            if match.group(3):
+                return 'at', datetime(int(match.group(3)), month, day, hour, minute, tzinfo=ARMENIA_TZ)
+            return 'no_year', month, day, hour, minute
+        match = MONTH_DAY_RE.search(text)
+        if match:
+            month, day = _month(match.group(1)), int(match.group(2))
+            if match.group(3):
+                return 'at', datetime(int(match.group(3)), month, day, hour, minute, tzinfo=ARMENIA_TZ)
+            return 'no_year', month, day, hour, minute
+    except ValueError:
+        return None
+
+    match = DAY_WORD_RE.search(lowered)
+    if match:
+        return 'day', DAY_WORDS[match.group(1)], hour, minute
+    match = TIME_RE.fullmatch(text)
+    if match and (hour, minute) == (int(match.group(1)), int(match.group(2))):
+        return 'clock', hour, minute
+    return None
+
+
+def parse_date(text, now=None):
+    """Aware datetime for a date/time string from a site, or None if it is not recognised"""
+    if not text or not isinstance(text, str):
+        return None
+    result = _parse(text.strip())
+    if result is None:
+        return None
+    now = now or datetime.now(ARMENIA_TZ)
+    local_now = now.astimezone(ARMENIA_TZ)
+    kind = result[0]
+    if kind == 'at':
+        return result[1]
+    if kind == 'ago':
+        return now - timedelta(seconds=result[1])
+    if kind == 'day':
+        day = local_now - timedelta(days=result[1])
+        return day.replace(hour=result[2], minute=result[3], second=0, microsecond=0)
+    if kind == 'clock':
+        # A bare time on a listing is today's, unless that is still in the future
+        parsed = local_now.replace(hour=result[1], minute=result[2], second=0, microsecond=0)
+        return parsed - timedelta(days=1) if parsed > local_now + timedelta(hours=1) else parsed
+    if kind == 'no_year':
+        _, month, day, hour, minute = result
+        try:
+            parsed = local_now.replace(month=month, day=day, hour=hour, minute=minute, second=0, microsecond=0)
+            if parsed > local_now + timedelta(days=1):
+                parsed = parsed.replace(year=parsed.year - 1)
+        except ValueError:
+            return None
+        return parsed
+    return None
+
+
+def normalize_date(text):
+    """ISO 8601 form of a site's date string; the original text if it cannot be parsed"""
+    parsed = parse_date(text)
+    return parsed.isoformat() if parsed else text
+
+
+def is_recent(text, max_age, now=None):
+    """False only for a recognised date older than max_age (a timedelta); unknown dates count as recent"""
+    parsed = parse_date(text, now)
+    if parsed is None:
+        return True
+    return (now or datetime.now(ARMENIA_TZ)) - parsed <= max_age
@@ -0,0 +1,55 @@
+# Compact "already processed" markers in Redis
+#
+# Every checked article used to get its own key, "processed_<spider>:<32-hex md5>", with a
+# 7-day SETEX. On a small managed Redis the per-key overhead (key object, expiry entry)
+# dwarfs the one-byte value, and tens of thousands of keys expire one by one.
+#
+# DedupStore keeps one Redis set per site and UTC day, "<cache_prefix>day:<YYYYMMDD>", whose
+# members are the first 8 bytes of the md5. A bucket expires as a whole, ttl after its day
+# ends. A lookup checks the last buckets covering ttl in one pipelined round trip. The
+# per-article keys written before the switch are still checked in the same pipeline until they
+# expire on their own.
+
+import hashlib
+import time
+
+DAY = 86400
+
+
+class DedupStore:
+    def __init__(self, client, prefix, ttl):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        # Enough daily buckets to cover ttl, plus the current partial day
+        self.buckets = -(-ttl // DAY) + 1
+        self.expiry_set = set()
+
+    @staticmethod
+    def digest(source):
+        return hashlib.md5(source.encode()).digest()
+
+    def _bucket(self, day):
+        return f"{self.prefix}day:{time.strftime('%Y%m%d', time.gmtime(day * DAY))}"
+
+    def seen(self, source):
+        """True if source was marked within ttl (one pipelined round trip)"""
+        digest = self.digest(source)
+        today = int(time.time() // DAY)
+        pipe = self.client.pipeline(transaction=False)
+        for day in range(today, today - self.buckets, -1):
+            pipe.sismember(self._bucket(day), digest[:8])
+        # Per-article key of the previous format
+        pipe.exists(f"{self.prefix}{digest.hex()}")
+        return any(pipe.execute())
+
+    def mark(self, source):
+        today = int(time.time() // DAY)
+        bucket = self._bucket(today)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.sadd(bucket, self.digest(source)[:8])
+        if bucket not in self.expiry_set:
+            # The whole bucket goes ttl after its day ends
+            pipe.expireat(bucket, (today + 1) * DAY + self.ttl)
+            self.expiry_set.add(bucket)
+        pipe.execute()
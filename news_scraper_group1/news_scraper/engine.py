@@ -0,0 +1,662 @@
+# Generic site spider
+#
+# Every site in news_scraper/sites.py is crawled by the same parse -> parse_article flow that
+# the per-site spiders used to copy: listing page -> listing snapshot / Redis cache check ->
+# article page -> title, content, date -> keyword check -> NewsScraperItem. A site definition
+# only holds its selectors, limits and stop lists. Stop lists are compiled into one regex per
+# rule kind when the spider class is built, not re-scanned word by word for every fragment.
+#
+# Sites that need more than data (custom start requests, pagination, page-specific checks)
+# subclass SiteSpider in their own module and override the hooks below.
+
+import logging
+import os
+import random
+import re
+from datetime import datetime, timedelta
+
+import scrapy
+
+from news_scraper.corpus import article_corpus
+from news_scraper.dates import ARMENIA_TZ, is_recent, normalize_date
+from news_scraper.dedup import DedupStore
+from news_scraper.items import NewsScraperItem
+from news_scraper.keyword_feed import keyword_source
+from news_scraper.listing_snapshots import ListingSnapshotStore
+from news_scraper.storage import redis_client
+from news_scraper.structured_data import extract_structured
+from news_scraper.text_normalization import normalize_text
+
+CACHE_TTL = 604800  # 7 days, like the per-site spiders
+
+# Links whose listing date is older than this are not downloaded (listing 'max_age_hours'; 0 = off)
+LISTING_MAX_AGE_HOURS = float(os.environ.get('LISTING_MAX_AGE_HOURS', 72))
+
+DEFAULT_TITLE_SELECTORS = [
+    "h1::text",
+    "meta[property='og:title']::attr(content)",
+    "title::text",
+]
+
+# Tokens of inline scripts, styles and markup that leak into page text
+CODE_MARKERS = [
+    'function', 'var ', 'let ', 'const ', 'if(', 'for(', 'while(', 'return ', 'this.', 'typeof', 'instanceof',
+    'undefined', 'document.', 'window.', 'console.', 'getElementById', 'querySelector', 'addEventListener',
+    'onclick', 'onload', 'jQuery', '$(', 'color:', 'background:', 'margin:', 'padding:', 'border:', 'width:',
+    'height:', 'display:', 'position:', 'px;', 'em;', 'rem;', '%;', '!important', 'rgba(', 'rgb(', 'hover:',
+    '<div', '</div>', '<span', '</span>', '<p>', '</p>', '<a', '</a>', '<img', '<br>', '<ul>', '<li>', 'class=',
+    'id=', 'href=', 'src=', '{', '}', '[];', '();', '=>', '&&', '||', '===', '!==', '+=', 'try{', 'catch(',
+    'throw new',
+]
+
+DEFAULT_DATE_SELECTORS = [
+    'time::attr(datetime)',
+    'time::text',
+    '.date::text',
+    '.publish-date::text',
+    '.post-date::text',
+]
+
+# A JSON-LD articleBody shorter than this is treated as a teaser and the page selectors are used
+STRUCTURED_MIN_BODY = 200
+
+_CODE_SYMBOLS = re.compile(r'[{}();,=+\-*/<>!&|^~]')
+_SYMBOLS = re.compile(r'[^\w\s]')
+
+logger = logging.getLogger(__name__)
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def _union(words, template='{}', escape=True, flags=re.IGNORECASE):
+    """One compiled alternation for a word list; whitespace-only entries are dropped"""
+    words = [w for w in _as_list(words) if w and w.strip()]
+    if not words:
+        return None
+    # Longest first so a phrase wins over its own prefix
+    words = sorted(set(words), key=len, reverse=True)
+    body = '|'.join(re.escape(w) if escape else f'(?:{w})' for w in words)
+    return re.compile(template.format(f'(?:{body})'), flags)
+
+
+class TextFilter:
+    """Compiled stop list for titles or content fragments.
+
+    Rule keys (all optional):
+      min_length / max_length  - bounds on the stripped text length
+      min_words                - minimum number of whitespace separated words
+      contains                 - skip if any phrase occurs (case-insensitive)
+      contains_case            - same, case-sensitive
+      prefixes / suffixes      - skip if the text starts / ends with any of them (case-insensitive)
+      exact                    - skip if the whole text equals one of them (case-insensitive)
+      requires                 - skip unless at least one of them occurs (case-insensitive)
+      patterns                 - raw regexes, skip on any match (case-insensitive)
+      skip_digits              - skip text that is only digits
+      short_digits             - skip text shorter than N with a digit or one of . : - (dates, times)
+      end_markers              - stop reading fragments at the first one containing any (case-sensitive)
+      max_special_ratio        - skip if too many non-alphanumeric characters (code, markup)
+      max_symbol_ratio         - same, but any character that is not a letter, digit, _ or space
+                                 counts (punctuation included)
+      min_alnum_ratio          - skip if too few alphanumeric characters
+      max_punct_ratio          - skip if mostly punctuation
+      skip_upper               - skip all-caps text longer than 10 characters
+      short_upper              - skip all-caps text shorter than N (headings, navigation)
+      skip_code                - skip script / style / markup leftovers (two CODE_MARKERS or many symbols)
+    """
+
+    def __init__(self, rules=None):
+        rules = rules or {}
+        self.min_length = rules.get('min_length', 0)
+        self.max_length = rules.get('max_length')
+        self.min_words = rules.get('min_words', 0)
+        self.contains = _union(rules.get('contains'))
+        self.contains_case = _union(rules.get('contains_case'), flags=0)
+        self.prefixes = _union(rules.get('prefixes'), template='^{}')
+        self.suffixes = _union(rules.get('suffixes'), template='{}$')
+        self.exact = {w.lower() for w in _as_list(rules.get('exact'))}
+        self.requires = _union(rules.get('requires'))
+        self.patterns = _union(rules.get('patterns'), escape=False)
+        self.skip_digits = rules.get('skip_digits', False)
+        self.short_digits = rules.get('short_digits', 0)
+        self.end_markers = _union(rules.get('end_markers'), flags=0)
+        self.max_special_ratio = rules.get('max_special_ratio')
+        self.max_symbol_ratio = rules.get('max_symbol_ratio')
+        self.min_alnum_ratio = rules.get('min_alnum_ratio')
+        self.max_punct_ratio = rules.get('max_punct_ratio')
+        self.skip_upper = rules.get('skip_upper', False)
+        self.short_upper = rules.get('short_upper', 0)
+        self.code_markers = _union(CODE_MARKERS, flags=0) if rules.get('skip_code') else None
+
+    def ends(self, text):
+        """True if the text marks the end of the article body (related news, comments...)"""
+        return self.end_markers is not None and bool(self.end_markers.search(text))
+
+    def rejects(self, text):
+        """True if the (stripped) text should be dropped"""
+        length = len(text)
+        if length < self.min_length or (self.max_length and length > self.max_length):
+            return True
+        if self.min_words and len(text.split()) < self.min_words:
+            return True
+        if self.skip_digits and text.isdigit():
+            return True
+        if self.short_digits and length < self.short_digits and any(c.isdigit() or c in '.:-' for c in text):
+            return True
+        if text.lower() in self.exact:
+            return True
+        if self.requires is not None and not self.requires.search(text):
+            return True
+        for regex in (self.contains, self.contains_case, self.prefixes, self.suffixes, self.patterns):
+            if regex is not None and regex.search(text):
+                return True
+        if self.max_special_ratio is not None:
+            special = sum(1 for c in text if not c.isalnum() and c not in ' .,!?;:-')
+            if special / length > self.max_special_ratio:
+                return True
+        if self.max_symbol_ratio is not None:
+            if len(_SYMBOLS.findall(text)) > length * self.max_symbol_ratio:
+                return True
+        if self.min_alnum_ratio is not None:
+            if sum(1 for c in text if c.isalnum()) / length < self.min_alnum_ratio:
+                return True
+        if self.max_punct_ratio is not None:
+            if sum(1 for c in text if c in '.,!?;:-()[]{}') / length > self.max_punct_ratio:
+                return True
+        if self.skip_upper and length > 10 and text.isupper():
+            return True
+        if self.short_upper and length < self.short_upper and text.isupper():
+            return True
+        if self.code_markers is not None and length >= 10:
+            if len(set(self.code_markers.findall(text))) >= 2:
+                return True
+            if len(_CODE_SYMBOLS.findall(text)) > length * 0.3:
+                return True
+        return False
+
+
+class SiteRules:
+    """A site definition with its stop lists and title rewrites compiled"""
+
+    def __init__(self, site):
+        listing = site.get('listing', {})
+        article = site.get('article', {})
+        self.listing = listing
+        self.listing_fallback = listing.get('fallback')
+        self.article = article
+        self.listing_title = TextFilter(listing.get('title_rules'))
+        self.fallback_title = TextFilter((self.listing_fallback or {}).get('title_rules'))
+        self.link = TextFilter(listing.get('link_rules'))
+        self.fallback_link = TextFilter((self.listing_fallback or {}).get('link_rules'))
+        self.title = TextFilter(article.get('title_rules'))
+        self.title_strip = _union(article.get('title_strip'), escape=False)
+        self.content = TextFilter(article.get('clean'))
+        fallback_clean = article.get('fallback_clean')
+        self.fallback_content = TextFilter(fallback_clean) if fallback_clean is not None else self.content
+        later_clean = article.get('later_clean')
+        self.later_content = TextFilter(later_clean) if later_clean is not None else None
+
+
+def select(selector, query):
+    """CSS query, or XPath for queries starting with ./ or //"""
+    if query.startswith(('./', '//')):
+        return selector.xpath(query)
+    return selector.css(query)
+
+
+def first(selector, queries):
+    """First non-empty stripped value of the given CSS / XPath queries"""
+    for query in queries:
+        for value in select(selector, query).getall():
+            if value and value.strip():
+                return value.strip()
+    return None
+
+
+class SiteSpider(scrapy.Spider):
+    """Spider driven by one entry of news_scraper.sites.SITES"""
+
+    site = {}
+    rules = None
+    label = None
+    cache_prefix = None
+    cache_key = 'url_title'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.redis_client = redis_client()
+        if self.redis_client:
+            self.logger.info("🔴 Redis կապակցված է")
+        else:
+            self.logger.warning("🔴 Redis չկա, կաշխատի առանց cache")
+
+        # Processed-article markers: per-day buckets of 8-byte hashes (news_scraper/dedup.py)
+        self.dedup = DedupStore(self.redis_client, self.cache_prefix, CACHE_TTL) if self.redis_client else None
+
+        # Recently crawled articles, kept for keyword backfill (news_scraper/corpus.py)
+        self.corpus = article_corpus()
+
+        # Ordered link list from the previous poll of each listing page
+        self.listing_snapshots = ListingSnapshotStore(self.name, self.redis_client)
+
+        # Shared keyword snapshot (news_scraper/keyword_feed.py): no API call per spider, and a
+        # new keyword list is swapped in while the spider runs
+        self.keyword_source = keyword_source()
+        keywords = self.keyword_source.keywords
+        self.logger.info(f"🔑 Բանալի բառեր v{self.keyword_source.version}: {', '.join(keywords) if keywords else 'Չկա (բոլոր հոդվածները)'}")
+
+        # Statistics
+        self.processed_articles = 0
+        self.new_articles = 0
+        self.cached_skips = 0
+        self.duplicate_articles = 0
+        self.stale_skips = 0
+
+    def inc_stat(self, key):
+        # Spiders built outside a crawler (tests, scripts) have no stats collector
+        if getattr(self, 'crawler', None):
+            self.crawler.stats.inc_value(key, spider=self)
+
+    # Redis cache
+
+    def _cache_source(self, url, title):
+        return url if self.cache_key == 'url' else f"{url}:{title}"
+
+    def is_article_processed(self, url, title):
+        """Check if article was already processed using Redis cache"""
+        if not self.dedup:
+            return False
+        try:
+            return self.dedup.seen(self._cache_source(url, title))
+        except Exception:
+            return False
+
+    def mark_article_handled(self, response):
+        """An article page was parsed: cache entry plus the listing snapshot"""
+        # Cache entry uses the listing title so the listing-page check finds it next time
+        self.mark_article_processed(response.url, response.meta.get('listing_title', ""))
+        self.listing_snapshots.mark_handled(response.meta.get('listing_url'), response.meta.get('listing_link'))
+
+    def mark_article_processed(self, url, title):
+        """Mark article as processed in Redis cache (expire in 7 days)"""
+        if not self.dedup:
+            return
+        try:
+            self.dedup.mark(self._cache_source(url, title))
+        except Exception as e:
+            self.logger.warning(f"⚠️ Cache-ում նշելը չհաջողվեց: {e}")
+
+    @property
+    def keywords(self):
+        return self.keyword_source.keywords or []
+
+    @property
+    def keyword_matcher(self):
+        return self.keyword_source.matcher
+
+    def article_contains_keyword(self, article_text, normalized=False):
+        """Keyword check on raw text, or on text already passed through normalize_text()"""
+        if not article_text:
+            return False
+        if not self.keyword_matcher:  # If no keywords, scrape all articles
+            return True
+        return self.keyword_matcher.search(article_text if normalized else normalize_text(article_text))
+
+    # Listing page
+
+    def select_articles(self, response, listing):
+        """Article nodes of a listing page: first selector with hits, or all of them combined"""
+        selectors = _as_list(listing.get('articles'))
+        if listing.get('combine'):
+            articles = []
+            for selector in selectors:
+                articles.extend(response.css(selector))
+            return articles
+        for selector in selectors:
+            articles = response.css(selector)
+            if articles:
+                return list(articles)
+        return []
+
+    def listing_entries(self, response):
+        """Yield (url, listing title, request meta) for the article links of a listing page"""
+        listing = self.rules.listing
+        title_filter, link_filter = self.rules.listing_title, self.rules.link
+        # Listing yield per run, for the monitor's health checks (RunOutcomeRecorder)
+        self.inc_stat('listing/pages')
+        articles = self.select_articles(response, listing)
+        if not articles and self.rules.listing_fallback:
+            listing = self.rules.listing_fallback
+            title_filter, link_filter = self.rules.fallback_title, self.rules.fallback_link
+            articles = self.select_articles(response, listing)
+            self.logger.info(f"🔍 Fallback selector-ով գտնվել է {len(articles)} հղում")
+
+        sort_by = _as_list(listing.get('sort_by'))
+        if sort_by:
+            dated = [(article, first(article, sort_by) or "") for article in articles]
+            if any(date for _, date in dated):
+                dated.sort(key=lambda pair: pair[1], reverse=True)
+                articles = [article for article, _ in dated]
+
+        limit = listing.get('limit', 10)
+        if not listing.get('limit_after_filter'):
+            articles = articles[:limit]
+        self.logger.info(f"📰 Գտնվել է {len(articles)} հոդված (սահմանափակված {limit}-ով)")
+
+        date_queries = _as_list(listing.get('date'))
+        link_queries = _as_list(listing.get('link', 'a::attr(href)'))
+        title_queries = _as_list(listing.get('title', 'a::text'))
+        exclude = listing.get('exclude')
+        same_site = listing.get('same_site')
+        site_domains = self.allowed_domains or []
+        seen_urls = set()
+        emitted = 0
+        for article in articles:
+            if exclude and article.css(exclude):
+                continue
+            link = first(article, link_queries)
+            title = first(article, title_queries) if title_queries else None
+            if not link or (listing.get('require_title', True) and not title):
+                continue
+            url = response.urljoin(link)
+            if link_filter.rejects(url) or (title and title_filter.rejects(title)):
+                continue
+            if same_site and not any(domain in url for domain in site_domains):
+                continue
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            meta = {key: first(article, _as_list(query)) for key, query in listing.get('meta', {}).items()}
+            if date_queries:
+                meta['listing_date'] = first(article, date_queries)
+            self.inc_stat('listing/entries')
+            yield url, title or "", meta
+            emitted += 1
+            if emitted >= limit:
+                break
+
+    def parse(self, response):
+        for url, title, meta in self.listing_entries(response):
+            # Links already on this listing at the previous poll were handled then
+            if self.listing_snapshots.seen(response.url, url):
+                if self.listing_snapshots.should_stop(response.url):
+                    break
+                continue
+            # Pinned / featured old articles are dropped without downloading them
+            if not self.listing_recent(meta):
+                self.stale_skips += 1
+                self.listing_snapshots.mark_handled(response.url, url)
+                self.logger.debug(f"⏳ Հին հղում listing-ում ({self.listing_date(meta)}): {url}")
+                continue
+            # Check Redis cache first
+            if self.is_article_processed(url, title):
+                self.cached_skips += 1
+                self.listing_snapshots.mark_handled(response.url, url)
+                continue
+            meta['listing_title'] = title
+            # parse_article puts the link into the listing snapshot; a failed download does not
+            meta['listing_url'] = response.url
+            meta['listing_link'] = url
+            yield self.article_request(url, meta)
+        yield from self.follow_pages(response)
+
+    def listing_date(self, meta):
+        """Date text of a listing entry: the listing 'date' selectors, else the article's date_meta keys"""
+        for key in ['listing_date'] + _as_list(self.rules.article.get('date_meta')):
+            if meta.get(key):
+                return meta[key]
+        return None
+
+    def listing_recent(self, meta):
+        """False for a listing entry dated older than max_age_hours; undated entries are kept"""
+        max_age = self.rules.listing.get('max_age_hours', LISTING_MAX_AGE_HOURS)
+        date_text = self.listing_date(meta)
+        if not max_age or not date_text:
+            return True
+        return is_recent(date_text, timedelta(hours=max_age))
+
+    def article_request(self, url, meta):
+        return scrapy.Request(url, callback=self.parse_article, meta=meta)
+
+    def follow_pages(self, response):
+        """Pagination hook; the sites only read the first listing page"""
+        return []
+
+    # Article page
+
+    def clean_title(self, title):
+        if not title:
+            return None
+        title = title.strip()
+        if self.rules.title_strip is not None:
+            title = self.rules.title_strip.sub('', title).strip()
+        for separator in _as_list(self.rules.article.get('title_split')):
+            if separator in title:
+                title = title.split(separator)[0].strip()
+        return title or None
+
+    def structured_data(self, response):
+        """JSON-LD / <head> meta fields of the page, read once per response ('structured_data': False opts out)"""
+        if self.rules.article.get('structured_data', True) is False:
+            return {}
+        if '_structured_data' not in response.meta:
+            response.meta['_structured_data'] = extract_structured(response)
+        return response.meta['_structured_data']
+
+    def structured_hit(self, field):
+        self.inc_stat(f'structured_data/{field}')
+
+    def extract_title(self, response):
+        """Structured headline, else the first title candidate that survives the site's title rules"""
+        article = self.rules.article
+        if article.get('prefer_listing_title') and response.meta.get('listing_title'):
+            return response.meta['listing_title']
+        headline = self.clean_title(self.structured_data(response).get('headline'))
+        if headline and not self.rules.title.rejects(headline):
+            self.structured_hit('headline')
+            return headline
+        for query in article.get('title', DEFAULT_TITLE_SELECTORS):
+            for candidate in response.css(query).getall():
+                title = self.clean_title(candidate)
+                if title and not self.rules.title.rejects(title):
+                    return title
+        return None
+
+    def content_parts(self, response):
+        """Raw text fragments: the site's container, then its content tiers, in order"""
+        article = self.rules.article
+        min_parts = article.get('min_parts', 1)
+        for query in _as_list(article.get('container')):
+            container = response.css(query)
+            if not container:
+                continue
+            for inner in _as_list(article.get('container_content', 'p::text')):
+                parts = container.css(inner).getall()
+                if len(parts) >= min_parts:
+                    return parts, self.rules.content
+            break
+        parts = []
+        for query in _as_list(article.get('content', ['p::text'])):
+            parts = response.css(query).getall()
+            if len(parts) >= min_parts:
+                return parts[:article.get('tier_parts')], self.rules.content
+        # Nothing substantial: the last (broadest) tier, with the fallback stop list
+        return parts, self.rules.fallback_content
+
+    def clean_content(self, parts, text_filter):
+        article = self.rules.article
+        max_parts = article.get('max_parts')
+        stop_at = article.get('stop_at')  # (parts, characters) - enough text collected
+        later = self.rules.later_content  # only for fragments after the first (teasers of other news)
+        cleaned = []
+        for index, part in enumerate(parts):
+            text = part.strip() if part else ''
+            if not text:
+                continue
+            if text_filter.ends(text):
+                break
+            if text_filter.rejects(text):
+                continue
+            if index and later is not None and later.rejects(text):
+                continue
+            if article.get('unique_parts') and text in cleaned:
+                continue
+            cleaned.append(text)
+            if max_parts and len(cleaned) >= max_parts:
+                break
+            if stop_at and len(cleaned) >= stop_at[0] and len("\n".join(cleaned)) > stop_at[1]:
+                break
+        return article.get('join', "\n").join(cleaned)
+
+    def extract_content(self, response):
+        # JSON-LD articleBody through the same paragraph filters; teaser-sized bodies fall through
+        body = self.structured_data(response).get('article_body')
+        if body:
+            content = self.clean_content(body.splitlines(), self.rules.content)
+            min_length = max(self.rules.article.get('min_content_length', 0), STRUCTURED_MIN_BODY)
+            if len(content) >= min_length and len(content.split()) >= self.rules.article.get('min_words', 0):
+                self.structured_hit('article_body')
+                return content
+        parts, text_filter = self.content_parts(response)
+        return self.clean_content(parts, text_filter)
+
+    def extract_date(self, response):
+        """Publication date as ISO 8601 when it can be parsed (news_scraper.dates), else the site's text"""
+        article = self.rules.article
+        for key in _as_list(article.get('date_meta')):
+            if response.meta.get(key):
+                return normalize_date(response.meta[key])
+        published = self.structured_data(response).get('date_published')
+        if published:
+            self.structured_hit('date_published')
+            return normalize_date(published)
+        date_text = first(response, article.get('date', DEFAULT_DATE_SELECTORS)) or response.meta.get('listing_date')
+        return normalize_date(date_text) if date_text else datetime.now(ARMENIA_TZ).isoformat()
+
+    def accept_article(self, title, content):
+        """Content quality gate; False drops the article (it stays cached as checked)"""
+        article = self.rules.article
+        min_length = article.get('min_content_length', 0)
+        if min_length and len(content.strip()) < min_length:
+            self.logger.info(f"❌ Շատ կարճ բովանդակություն ({len(content.strip())} նիշ): {(title or 'Անանուն')[:50]}...")
+            return False
+        min_words = article.get('min_words', 0)
+        if min_words and len(content.split()) < min_words:
+            self.logger.info(f"❌ Շատ քիչ բառեր ({len(content.split())} բառ): {(title or 'Անանուն')[:50]}...")
+            return False
+        return True
+
+    def parse_article(self, response):
+        self.processed_articles += 1
+        listing_title = response.meta.get('listing_title', "")
+
+        title = self.extract_title(response)
+        content = self.extract_content(response)
+        self.mark_article_handled(response)
+        if not self.accept_article(title, content):
+            return
+        scraped_time = self.extract_date(response)
+
+        # Clean title for display
+        display_title = title[:60] + "..." if title and len(title) > 60 else title or "Անանուն հոդված"
+
+        # Normalized once; the pipeline's keyword matcher reuses it from the item
+        normalized_text = normalize_text(f"{title or listing_title} {content}")
+        if self.corpus:
+            self.corpus.add(response.url, title or listing_title, content, scraped_time, normalized_text, self.name)
+        meta_texts = [response.meta.get(key) for key in _as_list(self.rules.article.get('keyword_meta'))]
+        if (self.article_contains_keyword(normalized_text, normalized=True)
+                or any(self.article_contains_keyword(text) for text in meta_texts)):
+            self.logger.info(f"✅ Բանալի բառ գտնվեց: {display_title}")
+            self.new_articles += 1
+
+            item = NewsScraperItem()
+            item['title'] = title or listing_title or f'Article from {response.url.split("/")[-1]}'
+            item['link'] = response.url
+            item['source_url'] = response.url
+            item['content'] = content
+            item['scraped_time'] = scraped_time
+            item['normalized_text'] = normalized_text
+            yield item
+        else:
+            self.logger.info(f"❌ Բանալի բառ չգտնվեց: {display_title}")
+
+    def closed(self, reason):
+        """Called when spider finishes"""
+        self.listing_snapshots.flush(reason)
+        self.logger.info(f"""
+📊 ԱՄՓՈՓՈՒՄ {self.label or self.name.upper()}:
+   • Ստուգված հոդվածներ: {self.processed_articles}
+   • Նոր հոդվածներ: {self.new_articles}
+   • Կրկնվող հոդվածներ: {self.duplicate_articles}
+   • Cache-ից բաց թողնված: {self.cached_skips}
+   • Հին (listing-ի ամսաթվով) բաց թողնված: {self.stale_skips}
+   • Սկրիպտի աշխատանքը: ✅ Ավարտված
+        """.strip())
+
+
+# Referers for sites that block a client sending the same headers on every request
+REFERERS = [
+    'https://www.google.com/',
+    'https://www.facebook.com/',
+    'https://www.bing.com/',
+    'https://duckduckgo.com/',
+    'https://t.me/',
+    'https://www.youtube.com/',
+]
+
+
+def rotating_headers(user_agents):
+    """Browser request headers with a random user agent and referer"""
+    return {
+        'User-Agent': random.choice(user_agents),
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+        'Accept-Language': 'hy-AM,hy;q=0.9,en;q=0.8,ru;q=0.7',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'DNT': '1',
+        'Cache-Control': 'max-age=0',
+        'Referer': random.choice(REFERERS),
+    }
+
+
+def site_attributes(name, site):
+    """Class attributes of the spider for one SITES entry"""
+    attrs = {
+        'name': name,
+        'allowed_domains': list(site['allowed_domains']),
+        'start_urls': list(site['start_urls']),
+        'site': site,
+        'rules': SiteRules(site),
+        'label': site.get('label', name.upper()),
+        'cache_prefix': site.get('cache_prefix', f"processed_{name}:"),
+        'cache_key': site.get('cache_key', 'url_title'),
+    }
+    if site.get('settings'):
+        attrs['custom_settings'] = dict(site['settings'])
+    return attrs
+
+
+def build_spider_class(name, site, module):
+    """Create the spider class for a SITES entry that needs no code of its own"""
+    attrs = site_attributes(name, site)
+    attrs['__module__'] = module
+    attrs['__doc__'] = f"Spider for {attrs['label']}"
+    return type(site.get('class_name', f"{name.title()}Spider"), (SiteSpider,), attrs)
+
+
+def site_spider(name):
+    """Class decorator for SiteSpider subclasses: fill in the SITES entry called name"""
+    from news_scraper.sites import SITES
+
+    def decorate(cls):
+        for key, value in site_attributes(name, SITES[name]).items():
+            setattr(cls, key, value)
+        return cls
+    return decorate
@@ -0,0 +1,197 @@
+# Project extensions
+#
+# ThrottleMemory - persists what AutoThrottle learned about each site between runs.
+# Every spider run is a fresh process, and a run is too short for AutoThrottle to converge
+# from AUTOTHROTTLE_START_DELAY. At spider close the final delay and latency statistics of
+# each download slot (one per domain) are saved to Redis, or to state/throttle_state.json
+# without Redis. The next run starts each slot from the saved delay. AutoThrottle keeps
+# adjusting from there, within DOWNLOAD_DELAY..AUTOTHROTTLE_MAX_DELAY.
+#
+# RunCostRecorder - keeps a running average of each spider's run time and downloaded bytes
+# (Redis hash "spider_costs" or state/spider_costs.json), plus its last RUN_TIME_WINDOW run
+# times. partition_spiders.py uses it to split the sites into balanced monitor groups, the
+# monitor to size each spider's timeout (news_scraper/budgets.py).
+#
+# RunOutcomeRecorder - saves what each run saw (close reason, listing pages parsed, article
+# links found on them, errors) to "spider_runs". The monitor turns it into the spider's health
+# and quarantines sites that keep failing (news_scraper/health.py).
+
+import logging
+import os
+import time
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+from news_scraper.budgets import RunCostStore
+from news_scraper.health import SpiderRunStore
+from news_scraper.storage import StateStore, redis_client
+
+THROTTLE_REDIS_KEY = 'throttle_state'
+
+
+class ThrottleStateStore(StateStore):
+    """Per-slot throttle state: {slot: {'delay', 'latency', 'latency_max', 'samples', 'updated'}}"""
+
+    redis_key = THROTTLE_REDIS_KEY
+    file_name = 'throttle_state.json'
+
+    def default_max_age_hours(self):
+        return os.environ.get('THROTTLE_MEMORY_MAX_AGE_HOURS', 72)
+
+
+class ThrottleMemory:
+    # Weight of this run's mean latency in the stored running average
+    LATENCY_WEIGHT = 0.3
+
+    def __init__(self, crawler, store):
+        self.crawler = crawler
+        self.store = store
+        self.min_delay = crawler.settings.getfloat('DOWNLOAD_DELAY')
+        self.max_delay = crawler.settings.getfloat('AUTOTHROTTLE_MAX_DELAY')
+        self.saved = {}
+        self.seeded = set()
+        self.observed = {}  # slot -> {'delay', 'latencies'}
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('AUTOTHROTTLE_ENABLED'):
+            raise NotConfigured
+        if os.environ.get('THROTTLE_MEMORY_ENABLED', '1') == '0':
+            raise NotConfigured
+        extension = cls(crawler, ThrottleStateStore(redis_client()))
+        crawler.signals.connect(extension.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(extension.request_reached_downloader, signal=signals.request_reached_downloader)
+        crawler.signals.connect(extension.response_downloaded, signal=signals.response_downloaded)
+        crawler.signals.connect(extension.spider_closed, signal=signals.spider_closed)
+        return extension
+
+    def spider_opened(self, spider):
+        # Slots are keyed by hostname, so the spider's domains (with and without www.) cover them
+        slots = set()
+        for domain in getattr(spider, 'allowed_domains', None) or []:
+            slots.update({domain, f"www.{domain}"})
+        self.saved = self.store.load(sorted(slots)) if slots else {}
+
+    def _slot(self, request):
+        key = request.meta.get('download_slot')
+        return key, self.crawler.engine.downloader.slots.get(key)
+
+    def request_reached_downloader(self, request, spider):
+        """Start a new slot from the delay learned in previous runs"""
+        key, slot = self._slot(request)
+        if slot is None or key in self.seeded:
+            return
+        self.seeded.add(key)
+        if key not in self.saved and key not in self.observed:
+            # Slot not covered by spider_opened (e.g. a CDN host) - look it up on first use
+            self.saved.update(self.store.load([key]))
+        state = self.saved.get(key)
+        if state:
+            slot.delay = min(max(self.min_delay, state['delay']), self.max_delay)
+            spider.logger.info(f"⏱️ {key}: սկսում ենք պահված delay-ից {slot.delay:.2f} վրկ (latency {state['latency']:.2f} վրկ)")
+
+    def response_downloaded(self, response, request, spider):
+        # Runs after AutoThrottle (later extension order), so slot.delay is already adjusted
+        key, slot = self._slot(request)
+        latency = request.meta.get('download_latency')
+        if slot is None or latency is None:
+            return
+        observed = self.observed.setdefault(key, {'delay': slot.delay, 'latencies': []})
+        observed['delay'] = slot.delay
+        observed['latencies'].append(latency)
+
+    def spider_closed(self, spider):
+        states = {}
+        for key, observed in self.observed.items():
+            latencies = observed['latencies']
+            mean_latency = sum(latencies) / len(latencies)
+            previous = self.saved.get(key)
+            if previous:
+                mean_latency = (1 - self.LATENCY_WEIGHT) * previous['latency'] + self.LATENCY_WEIGHT * mean_latency
+            states[key] = {
+                'delay': round(observed['delay'], 3),
+                'latency': round(mean_latency, 3),
+                'latency_max': round(max(latencies), 3),
+                'samples': (previous or {}).get('samples', 0) + len(latencies),
+                'updated': time.time(),
+            }
+        self.store.save(states)
+
+
+class RunCostRecorder:
+    """Records each spider's run time, downloaded bytes and items at close (running average)"""
+
+    # Weight of this run in the stored averages
+    WEIGHT = 0.3
+
+    def __init__(self, crawler, store):
+        self.crawler = crawler
+        self.store = store
+        self.started = None
+        self.window = int(os.environ.get('RUN_TIME_WINDOW', 20))
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if os.environ.get('RUN_COSTS_ENABLED', '1') == '0':
+            raise NotConfigured
+        extension = cls(crawler, RunCostStore(redis_client()))
+        crawler.signals.connect(extension.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(extension.spider_closed, signal=signals.spider_closed)
+        return extension
+
+    def spider_opened(self, spider):
+        self.started = time.monotonic()
+
+    def spider_closed(self, spider, reason):
+        # An interrupted run says nothing about the site's cost
+        if self.started is None or reason == 'shutdown':
+            return
+        stats = self.crawler.stats
+        duration = time.monotonic() - self.started
+        downloaded = stats.get_value('downloader/response_bytes', 0, spider=spider)
+        items = stats.get_value('item_scraped_count', 0, spider=spider)
+        previous = self.store.load([spider.name]).get(spider.name)
+        if previous:
+            weight = self.WEIGHT
+            duration_avg = (1 - weight) * previous['duration'] + weight * duration
+            bytes_avg = (1 - weight) * previous['bytes'] + weight * downloaded
+        else:
+            duration_avg, bytes_avg = duration, downloaded
+        self.store.save({spider.name: {
+            'runs': (previous or {}).get('runs', 0) + 1,
+            'duration': round(duration_avg, 2),
+            'duration_max': round(max(duration, (previous or {}).get('duration_max', 0)), 2),
+            'recent': ((previous or {}).get('recent', []) + [round(duration, 1)])[-self.window:],
+            'bytes': int(bytes_avg),
+            'items': items,
+            'updated': time.time(),
+        }})
+
+
+class RunOutcomeRecorder:
+    """Saves each run's close reason and listing yield for the monitor's health checks"""
+
+    def __init__(self, crawler, store):
+        self.crawler = crawler
+        self.store = store
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if os.environ.get('SPIDER_HEALTH_ENABLED', '1') == '0':
+            raise NotConfigured
+        extension = cls(crawler, SpiderRunStore(redis_client()))
+        crawler.signals.connect(extension.spider_closed, signal=signals.spider_closed)
+        return extension
+
+    def spider_closed(self, spider, reason):
+        stats = self.crawler.stats
+        self.store.save({spider.name: {
+            'reason': reason,
+            'listing_pages': stats.get_value('listing/pages', 0, spider=spider),
+            'listing_entries': stats.get_value('listing/entries', 0, spider=spider),
+            'errors': stats.get_value('log_count/ERROR', 0, spider=spider),
+            'items': stats.get_value('item_scraped_count', 0, spider=spider),
+            'updated': time.time(),
+        }})
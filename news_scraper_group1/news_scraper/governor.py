@@ -0,0 +1,53 @@
+# Memory governor for long-lived crawl workers
+#
+# A worker (the crawl zygote today, any pooled/in-process runner later) is retired after
+# a number of spider runs or once its RSS crosses a ceiling, whichever comes first. The
+# owner drains the worker between runs - nothing is in flight - and starts a fresh one,
+# so slow leaks and fragmentation never accumulate on the small Render instance.
+#
+# The RSS checked is the worker's own. In fork mode that is the zygote's RSS after the run:
+# each crawl's memory leaves with its child, which CRAWL_CHILD_MAX_RSS_MB bounds separately,
+# so a heavy batch does not retire a healthy warm zygote. In resident mode the crawl ran in
+# the worker, so the owner passes its peak RSS (ru_maxrss) and a spike released before the
+# sample still counts. psutil is only needed when sampling; no Scrapy imports.
+
+import os
+
+
+class WorkerGovernor:
+    def __init__(self, max_runs=None, max_rss_mb=None):
+        self.max_runs = int(max_runs if max_runs is not None else os.environ.get('CRAWL_WORKER_MAX_RUNS', 100))
+        self.max_rss_mb = float(max_rss_mb if max_rss_mb is not None else os.environ.get('CRAWL_WORKER_MAX_RSS_MB', 400))
+        self.runs = 0
+        self.last_rss_mb = 0.0
+
+    def reset(self):
+        """A fresh worker replaced the retired one"""
+        self.runs = 0
+        self.last_rss_mb = 0.0
+
+    def sample_rss(self, pid):
+        """RSS of the worker process in MB (0 if it cannot be read)"""
+        try:
+            import psutil
+            self.last_rss_mb = psutil.Process(pid).memory_info().rss / 1024 / 1024
+        except Exception:
+            self.last_rss_mb = 0.0
+        return self.last_rss_mb
+
+    def record_run(self, pid, peak_rss_mb=None):
+        """Count a finished run; return the reason to retire the worker, or None to keep it
+
+        peak_rss_mb is the worker's peak RSS when it ran the crawl itself (resident mode);
+        without it the worker's current RSS is sampled.
+        """
+        self.runs += 1
+        if peak_rss_mb is None:
+            rss_mb = self.sample_rss(pid)
+        else:
+            rss_mb = self.last_rss_mb = peak_rss_mb
+        if self.max_rss_mb and rss_mb > self.max_rss_mb:
+            return f"RSS {rss_mb:.0f} MB > {self.max_rss_mb:.0f} MB"
+        if self.max_runs and self.runs >= self.max_runs:
+            return f"{self.runs} runs"
+        return None
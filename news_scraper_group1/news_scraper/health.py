@@ -0,0 +1,111 @@
+# Spider health and quarantine
+#
+# A site that is down, or whose selectors no longer match, used to be crawled every cycle
+# anyway: it sat out the whole crawl timeout or failed the same fetches again, and the monitor
+# only printed the error. Now every run ends in one of four outcomes:
+#
+# - ok      - listing pages were parsed and yielded article links
+# - empty   - listing pages came back but no article link was found (broken selectors)
+# - failed  - no listing page could be parsed (site down, blocked) or the run crashed
+# - timeout - the run was killed at the crawl timeout before the spider closed
+#
+# The spider side (RunOutcomeRecorder in extensions.py) saves what each run saw at close
+# ("spider_runs"); the monitor classifies it and keeps the consecutive bad runs per spider
+# ("spider_health", Redis hash or state/spider_health.json, shared by the workers). After
+# SPIDER_QUARANTINE_AFTER bad runs in a row a spider is skipped until its retry time:
+# SPIDER_BACKOFF_MINUTES, doubling with every further bad run, up to SPIDER_BACKOFF_MAX_HOURS.
+# One good run clears the record.
+
+import os
+import time
+
+from news_scraper.storage import StateStore
+
+OK = 'ok'
+EMPTY = 'empty'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+
+
+class SpiderRunStore(StateStore):
+    """What the last run of each spider saw: {spider: {'reason', 'listing_pages', 'listing_entries', 'errors', 'items', 'updated'}}"""
+
+    redis_key = 'spider_runs'
+    file_name = 'spider_runs.json'
+
+
+class SpiderHealthStore(StateStore):
+    """{spider: {'bad_runs', 'last_outcome', 'failed', 'empty', 'timeout', 'retry_at', 'since', 'updated'}}"""
+
+    redis_key = 'spider_health'
+    file_name = 'spider_health.json'
+
+
+def classify(run, timed_out=False):
+    """Outcome of a run record saved by RunOutcomeRecorder (None: the spider never closed)"""
+    if not run or run.get('reason') != 'finished':
+        # Stopped by the crawl timeout, killed before closing, or crashed
+        return TIMEOUT if timed_out else FAILED
+    if not run.get('listing_pages'):
+        return FAILED
+    if not run.get('listing_entries'):
+        return EMPTY
+    return OK
+
+
+class SpiderHealth:
+    def __init__(self, client=None, quarantine_after=None, backoff_minutes=None, backoff_max_hours=None):
+        self.runs = SpiderRunStore(client)
+        self.store = SpiderHealthStore(client)
+        self.quarantine_after = int(quarantine_after or os.environ.get('SPIDER_QUARANTINE_AFTER', 3))
+        self.backoff = 60 * float(backoff_minutes or os.environ.get('SPIDER_BACKOFF_MINUTES', 10))
+        self.backoff_max = 3600 * float(backoff_max_hours or os.environ.get('SPIDER_BACKOFF_MAX_HOURS', 6))
+
+    def record_batch(self, batch, started, timed_out=False):
+        """Classify the runs of a finished batch and update the records; {spider: outcome}"""
+        runs = self.runs.load(batch)
+        outcomes = {}
+        for name in batch:
+            run = runs.get(name)
+            # A record older than the batch is from an earlier run: this one never closed
+            fresh = run if run and run.get('updated', 0) >= started else None
+            outcomes[name] = classify(fresh, timed_out)
+        self.record(outcomes)
+        return outcomes
+
+    def record(self, outcomes):
+        now = time.time()
+        records = self.store.load(list(outcomes))
+        updated = {}
+        for name, outcome in outcomes.items():
+            record = records.get(name)
+            if outcome == OK:
+                if record and record.get('bad_runs'):
+                    updated[name] = {'bad_runs': 0, 'last_outcome': OK, 'updated': now}
+                continue
+            record = dict(record or {})
+            record['bad_runs'] = record.get('bad_runs', 0) + 1
+            record[outcome] = record.get(outcome, 0) + 1
+            record['last_outcome'] = outcome
+            record.setdefault('since', now)
+            record['updated'] = now
+            extra = record['bad_runs'] - self.quarantine_after
+            if extra >= 0:
+                record['retry_at'] = now + min(self.backoff * 2 ** min(extra, 20), self.backoff_max)
+            updated[name] = record
+        self.store.save(updated)
+        return updated
+
+    def split(self, spiders):
+        """(runnable, {quarantined spider: record}) - a spider runs again once its retry time passes"""
+        now = time.time()
+        records = self.store.load(list(spiders))
+        quarantined = {
+            name: record for name, record in records.items()
+            if record.get('bad_runs', 0) >= self.quarantine_after and record.get('retry_at', 0) > now
+        }
+        return [name for name in spiders if name not in quarantined], quarantined
+
+    def unhealthy(self):
+        """{spider: record} for every spider whose last run was bad"""
+        return {name: record for name, record in self.store.load_all().items() if record.get('bad_runs')}
@@ -13,3 +13,5 @@ class NewsScraperItem(scrapy.Item):
     source_url = scrapy.Field()
     content = scrapy.Field()
     scraped_time = scrapy.Field()
+    # title + content through news_scraper.text_normalization.normalize_text (not sent to the API)
+    normalized_text = scrapy.Field()
@@ -0,0 +1,243 @@
+# Keyword distribution
+#
+# Every spider used to GET /api/keywords/ in its __init__ and the pipeline fetched the list
+# again for every item. Now one fetcher owns the API:
+#
+# - KeywordFeed (run by the monitor) polls /api/keywords/ every KEYWORDS_POLL_SECONDS with
+#   If-None-Match. When the list changes it publishes a versioned snapshot
+#   {'version', 'hash', 'etag', 'keywords', 'fetched'}: Redis key "keywords:snapshot" plus a
+#   message on the "keywords:updates" channel, and always state/keywords.json.
+# - KeywordSource (one per crawl process, shared by spiders and the pipeline) reads the
+#   snapshot and swaps in a recompiled KeywordMatcher when a newer version arrives - pushed
+#   over Redis pub/sub, or noticed from the file's mtime without Redis.
+#
+# A crawl that finds no snapshot, or one older than KEYWORDS_SNAPSHOT_MAX_AGE (the monitor is
+# not running), fetches once itself and publishes the result for the next process.
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import requests
+
+from news_scraper.circuit_breaker import CircuitBreakerRegistry
+from news_scraper.storage import load_json, redis_client, save_json_atomic, state_path
+from news_scraper.text_normalization import KeywordMatcher, keyword_words
+
+KEYWORDS_REDIS_KEY = 'keywords:snapshot'
+KEYWORDS_CHANNEL = 'keywords:updates'
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_path():
+    return state_path('keywords.json')
+
+
+def _digest(words):
+    return hashlib.sha1(json.dumps(words, ensure_ascii=False).encode()).hexdigest()
+
+
+def read_snapshot(client=None):
+    """Latest published snapshot (Redis first, then the shared file), or None"""
+    if client:
+        try:
+            raw = client.get(KEYWORDS_REDIS_KEY)
+            if raw:
+                return json.loads(raw)
+        except Exception as e:
+            logger.warning(f"⚠️ Keywords snapshot-ը Redis-ից չհաջողվեց կարդալ: {e}")
+    return load_json(snapshot_path())
+
+
+class KeywordFeed(threading.Thread):
+    """The single keyword fetcher: polls the API with ETag and publishes changed snapshots"""
+
+    def __init__(self, api_base_url=None, client=None, interval=None, breakers=None, on_added=None):
+        super().__init__(name='keyword-feed', daemon=True)
+        # on_added(new_words, snapshot) - called when a published list has words the previous lacked
+        self.on_added = on_added
+        self.api_base_url = (api_base_url or os.environ.get('API_BASE_URL', 'https://beackkayq.onrender.com')).rstrip('/')
+        self.client = client
+        self.interval = float(interval or os.environ.get('KEYWORDS_POLL_SECONDS', 30))
+        self.breaker = (breakers or CircuitBreakerRegistry()).get('keywords')
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'User-Agent': 'NewsMonitor/1.0'
+        })
+        self.snapshot = read_snapshot(client)
+        self.stopping = threading.Event()
+
+    def fetch(self):
+        """(keywords, etag) from the API; keywords is None when unchanged (304)"""
+        headers = {}
+        if self.snapshot and self.snapshot.get('etag'):
+            headers['If-None-Match'] = self.snapshot['etag']
+        for endpoint in (f"{self.api_base_url}/api/keywords/", f"{self.api_base_url}/api/keywords"):
+            try:
+                response = self.session.get(endpoint, headers=headers, timeout=10)
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"⚠️ Keywords network error {endpoint}: {e}")
+                continue
+            if response.status_code == 304:
+                return None, self.snapshot.get('etag')
+            if response.status_code == 200:
+                keywords = response.json()
+                if isinstance(keywords, dict):
+                    keywords = keywords.get('results', [])
+                return keywords, response.headers.get('ETag')
+            logger.warning(f"⚠️ API keywords error {endpoint}: {response.status_code}")
+        raise ConnectionError("no keywords endpoint answered")
+
+    def refresh(self):
+        """One poll; publishes a new snapshot if the list changed. Returns the current snapshot"""
+        if not self.breaker.allow_request():
+            return self.snapshot
+        try:
+            keywords, etag = self.fetch()
+        except Exception as e:
+            logger.warning(f"⚠️ Բանալի բառերը չհաջողվեց բեռնել: {e}")
+            self.breaker.record_failure()
+            return self.snapshot
+        self.breaker.record_success()
+        digest = _digest(keyword_words(keywords)) if keywords is not None else None
+        if keywords is None or (self.snapshot and self.snapshot.get('hash') == digest):
+            # Unchanged: only the freshness mark moves, no update message
+            self.snapshot.update(etag=etag, fetched=time.time())
+            self._store(self.snapshot)
+            return self.snapshot
+        self.publish(keywords, etag)
+        return self.snapshot
+
+    def publish(self, keywords, etag=None):
+        """Publish a new keyword list (also usable for a push from the backend)"""
+        words = keyword_words(keywords)
+        previous = self.snapshot
+        self.snapshot = {
+            'version': (self.snapshot or {}).get('version', 0) + 1,
+            'hash': _digest(words),
+            'etag': etag,
+            'keywords': words,
+            'fetched': time.time(),
+        }
+        self._store(self.snapshot, notify=True)
+        logger.info(f"🔑 Բանալի բառեր v{self.snapshot['version']}: {', '.join(words) if words else 'Չկա (բոլոր հոդվածները)'}")
+        added = [word for word in words if word not in (previous or {}).get('keywords', [])]
+        if previous and added and self.on_added:
+            try:
+                self.on_added(added, self.snapshot)
+            except Exception as e:
+                logger.warning(f"⚠️ Նոր բանալի բառերի մշակումը ձախողվեց: {e}")
+
+    def _store(self, snapshot, notify=False):
+        try:
+            save_json_atomic(snapshot_path(), snapshot)
+        except OSError as e:
+            logger.warning(f"⚠️ Keywords snapshot-ը չհաջողվեց պահել: {e}")
+        if self.client:
+            try:
+                self.client.set(KEYWORDS_REDIS_KEY, json.dumps(snapshot, ensure_ascii=False))
+                if notify:
+                    self.client.publish(KEYWORDS_CHANNEL, snapshot['version'])
+            except Exception as e:
+                logger.warning(f"⚠️ Keywords snapshot-ը Redis-ում չհաջողվեց հրապարակել: {e}")
+
+    def run(self):
+        while not self.stopping.wait(self.interval):
+            self.refresh()
+
+    def stop(self):
+        self.stopping.set()
+
+
+class KeywordSource:
+    """Crawler-side keywords: the latest snapshot and its compiled matcher, swapped atomically"""
+
+    def __init__(self, client=None, max_age=None, check_interval=2.0):
+        self.client = client
+        self.max_age = float(max_age or os.environ.get('KEYWORDS_SNAPSHOT_MAX_AGE', 600))
+        self.check_interval = check_interval
+        self.file_mtime = None
+        self.checked_at = 0
+        # (snapshot, matcher) - replaced as a whole, so readers never see a half-updated pair
+        self.state = (None, KeywordMatcher([]))
+        snapshot = read_snapshot(client)
+        if snapshot is None or time.time() - snapshot.get('fetched', 0) > self.max_age:
+            # Nobody is publishing: fetch once here and publish for the next process
+            snapshot = KeywordFeed(client=client).refresh()
+        self._swap(snapshot)
+        if client:
+            threading.Thread(target=self._listen, name='keyword-listener', daemon=True).start()
+
+    @property
+    def snapshot(self):
+        self._check_file()
+        return self.state[0]
+
+    @property
+    def matcher(self):
+        self._check_file()
+        return self.state[1]
+
+    @property
+    def keywords(self):
+        """Keyword list of the current snapshot; None if no snapshot could be obtained"""
+        snapshot = self.snapshot
+        return snapshot['keywords'] if snapshot else None
+
+    @property
+    def version(self):
+        snapshot = self.snapshot
+        return snapshot['version'] if snapshot else 0
+
+    def _swap(self, snapshot):
+        current = self.state[0]
+        if not snapshot or (current and snapshot.get('hash') == current.get('hash')):
+            return
+        self.state = (snapshot, KeywordMatcher(snapshot.get('keywords', [])))
+        if current:
+            logger.info(f"🔄 Բանալի բառերը թարմացվեցին v{current.get('version')} → v{snapshot.get('version')} ({len(self.state[1])} բառ)")
+
+    def _check_file(self):
+        # Without Redis, pick up a newer shared file at most every check_interval seconds
+        if self.client or time.monotonic() - self.checked_at < self.check_interval:
+            return
+        self.checked_at = time.monotonic()
+        try:
+            mtime = os.path.getmtime(snapshot_path())
+        except OSError:
+            return
+        if mtime != self.file_mtime:
+            self.file_mtime = mtime
+            self._swap(load_json(snapshot_path()))
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(KEYWORDS_CHANNEL)
+                # A version published while (re)subscribing is picked up here
+                self._swap(read_snapshot(self.client))
+                for message in pubsub.listen():
+                    if message.get('type') == 'message':
+                        self._swap(read_snapshot(self.client))
+            except Exception as e:
+                logger.warning(f"⚠️ Keywords pub/sub կապը ընդհատվեց: {e}")
+                time.sleep(5)
+
+
+# One source per process, shared by every spider and pipeline in it
+_source = None
+_source_lock = threading.Lock()
+
+
+def keyword_source():
+    global _source
+    with _source_lock:
+        if _source is None:
+            _source = KeywordSource(redis_client())
+        return _source
@@ -0,0 +1,111 @@
+# Leader election for global maintenance
+#
+# Every monitor group ran cleanup_old_articles - a DELETE over the whole articles table in the
+# backend - at the start of every two-minute cycle. Tasks like that now run on one worker only:
+#
+# - The leader holds "monitor:leader" (SET NX PX, value = worker id) and extends it each time it
+#   checks in. If it dies the lock expires after the lease and the next worker to check in
+#   takes over.
+# - Each task runs at most once per its own interval. The last run time is shared
+#   ("maintenance:last:<task>"), so a new leader does not repeat a task the old one just ran.
+#
+# Without Redis the worker is its own leader and the last runs are kept in
+# state/maintenance.json, so a restart does not rerun an hourly task either.
+
+import os
+import socket
+import time
+
+from news_scraper.storage import load_json, save_json_atomic, state_path
+
+LEADER_KEY = 'monitor:leader'
+LAST_RUN_PREFIX = 'maintenance:last:'
+
+# Extend the lock only if this worker still holds it
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderElection:
+    def __init__(self, client, lease_seconds, worker_id=None, key=LEADER_KEY):
+        self.client = client
+        self.key = key
+        self.lease_ms = int(lease_seconds * 1000)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.renew_script = client.register_script(RENEW_SCRIPT) if client else None
+        self.release_script = client.register_script(RELEASE_SCRIPT) if client else None
+
+    def is_leader(self):
+        """Take or extend the leader lock; True while this worker holds it"""
+        if not self.client:
+            return True
+        if self.renew_script(keys=[self.key], args=[self.worker_id, self.lease_ms]):
+            return True
+        return bool(self.client.set(self.key, self.worker_id, nx=True, px=self.lease_ms))
+
+    def leader(self):
+        """Worker id of the current leader (None if nobody holds the lock)"""
+        if not self.client:
+            return self.worker_id
+        return self.client.get(self.key)
+
+    def release(self):
+        """Step down, so another worker can take over without waiting for the lease"""
+        if self.client:
+            self.release_script(keys=[self.key], args=[self.worker_id])
+
+
+class Maintenance:
+    """Global tasks run by the leader, each at most once per its interval"""
+
+    def __init__(self, election):
+        self.election = election
+        self.client = election.client
+        self.tasks = []
+
+    def add(self, name, interval, func):
+        self.tasks.append((name, interval, func))
+
+    def _last_runs(self):
+        if self.client:
+            keys = [f"{LAST_RUN_PREFIX}{name}" for name, _, _ in self.tasks]
+            return {name: float(value or 0) for (name, _, _), value in zip(self.tasks, self.client.mget(keys))}
+        return load_json(state_path('maintenance.json'), {})
+
+    def _set_last_run(self, name, when):
+        if self.client:
+            # Kept a little longer than any interval would need, then it goes by itself
+            self.client.set(f"{LAST_RUN_PREFIX}{name}", when, ex=7 * 86400)
+            return
+        last_runs = load_json(state_path('maintenance.json'), {})
+        last_runs[name] = when
+        save_json_atomic(state_path('maintenance.json'), last_runs)
+
+    def due(self):
+        """Names of the tasks whose interval has passed (whoever the leader is)"""
+        now = time.time()
+        last_runs = self._last_runs()
+        return [name for name, interval, _ in self.tasks if now - last_runs.get(name, 0) >= interval]
+
+    def run_due(self):
+        """Run the due tasks if this worker is the leader; {task: result} of the ones that ran"""
+        due = self.due()
+        if not due or not self.election.is_leader():
+            return {}
+        results = {}
+        for name, _, func in self.tasks:
+            if name in due:
+                results[name] = func()
+                self._set_last_run(name, time.time())
+        return results
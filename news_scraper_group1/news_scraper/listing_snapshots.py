@@ -0,0 +1,117 @@
+# Incremental listing diff
+#
+# Keeps the ordered link list seen on each listing page at the previous poll. Links that were
+# already on the page last time were handled then, so the spider skips them without a cache
+# lookup. Past the first new link, a run of previously seen links ends the walk: pinned or
+# featured items above the new ones do not count. On a quiet site a poll costs one page parse
+# and no lookups.
+#
+# A link enters the snapshot only once it was handled: its article was parsed, or the Redis
+# cache or the listing date skipped it. A failed or dropped download stays out and is tried
+# again at the next poll. The snapshot is written only when the spider finishes normally.
+
+import hashlib
+import json
+import logging
+import os
+
+from news_scraper.storage import load_json, save_json_atomic, state_path
+
+
+class ListingSnapshotStore:
+    def __init__(self, spider_name, redis_client=None, max_links=None, stop_after_known=None, ttl=None):
+        self.spider_name = spider_name
+        self.redis_client = redis_client
+        self.enabled = os.environ.get('LISTING_DIFF_ENABLED', '1') != '0'
+        self.max_links = max_links or int(os.environ.get('LISTING_SNAPSHOT_MAX_LINKS', 200))
+        self.stop_after_known = stop_after_known or int(os.environ.get('LISTING_STOP_AFTER_KNOWN', 3))
+        self.ttl = ttl or 7 * 24 * 3600
+        self.file_path = state_path('listing_snapshots', f"{spider_name}.json")
+        self.previous = {}  # listing url -> set of links from the last poll
+        self.previous_order = {}  # listing url -> ordered links from the last poll
+        self.observed = {}  # listing url -> ordered links seen in this run
+        self.handled = {}  # listing url -> links of this run that were parsed or skipped
+        self.found_new = {}  # listing url -> a link missing from the previous poll was seen
+        self.consecutive_known = {}
+        self.known_skips = 0
+        self._file_snapshots = None
+        self.logger = logging.getLogger(__name__)
+
+    def _redis_key(self, listing_url):
+        return f"listing_snapshot:{self.spider_name}:{hashlib.md5(listing_url.encode()).hexdigest()}"
+
+    def _load(self, listing_url):
+        links = None
+        if self.redis_client:
+            try:
+                raw = self.redis_client.get(self._redis_key(listing_url))
+                links = json.loads(raw) if raw else []
+            except Exception as e:
+                self.logger.warning(f"⚠️ Listing snapshot-ը Redis-ից չհաջողվեց կարդալ: {e}")
+        if links is None:
+            if self._file_snapshots is None:
+                self._file_snapshots = load_json(self.file_path, {}) or {}
+            links = self._file_snapshots.get(listing_url, [])
+        self.previous_order[listing_url] = links
+        self.previous[listing_url] = set(links)
+        self.observed[listing_url] = []
+        self.handled[listing_url] = set()
+        self.found_new[listing_url] = False
+        self.consecutive_known[listing_url] = 0
+
+    def seen(self, listing_url, link):
+        """Record link in listing order; True if it was on this listing at the previous poll"""
+        if not self.enabled or not link:
+            return False
+        if listing_url not in self.observed:
+            self._load(listing_url)
+        observed = self.observed[listing_url]
+        if link not in observed:
+            observed.append(link)
+        if link in self.previous[listing_url]:
+            # Known links above the first new one are pinned / featured items, not the old tail
+            if self.found_new[listing_url]:
+                self.consecutive_known[listing_url] += 1
+            self.known_skips += 1
+            return True
+        self.found_new[listing_url] = True
+        self.consecutive_known[listing_url] = 0
+        return False
+
+    def mark_handled(self, listing_url, link):
+        """The link's article was parsed or deliberately skipped; it may go into the snapshot"""
+        if self.enabled and listing_url in self.handled:
+            self.handled[listing_url].add(link)
+
+    def should_stop(self, listing_url):
+        """True once a run of previously seen links follows a new one - the rest is old news"""
+        return self.consecutive_known.get(listing_url, 0) >= self.stop_after_known
+
+    def flush(self, reason='finished'):
+        """Persist this run's listings: handled and known links in listing order, then the unseen
+        tail of the old snapshot. A run that did not finish normally keeps the old snapshots"""
+        if not self.observed or reason != 'finished':
+            self.observed = {}
+            return
+        file_changed = False
+        for listing_url, observed in self.observed.items():
+            observed_set = set(observed)
+            keep = self.previous[listing_url] | self.handled[listing_url]
+            links = [link for link in observed if link in keep]
+            links += [link for link in self.previous_order.get(listing_url, []) if link not in observed_set]
+            links = links[:self.max_links]
+            if self.redis_client:
+                try:
+                    self.redis_client.setex(self._redis_key(listing_url), self.ttl, json.dumps(links))
+                    continue
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Listing snapshot-ը Redis-ում չհաջողվեց պահել: {e}")
+            if self._file_snapshots is None:
+                self._file_snapshots = load_json(self.file_path, {}) or {}
+            self._file_snapshots[listing_url] = links
+            file_changed = True
+        if file_changed:
+            save_json_atomic(self.file_path, self._file_snapshots)
+        if self.known_skips:
+            self.logger.info(f"📋 Listing diff: {self.known_skips} հղում բաց թողնվեց (եղել են նախորդ poll-ում)")
+        self.observed = {}
@@ -0,0 +1,54 @@
+# Spider manifest: spider name -> (module, class) taken from the site registry
+#
+# Scrapy's default SpiderLoader imports every module under news_scraper.spiders on each
+# `scrapy crawl`; news_scraper.spiderloader uses this manifest to import only the spider that
+# runs. The manifest is derived from SITES, so it cannot go stale for registry sites;
+# check_manifest() catches the hand-written modules it would miss. No Scrapy imports, so the
+# monitor can run the check at startup.
+
+import os
+import pkgutil
+import re
+
+from news_scraper.sites import SITES
+
+SPIDERS_PACKAGE = 'news_scraper.spiders'
+REGISTRY_MODULE = f'{SPIDERS_PACKAGE}.registry'
+SPIDERS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spiders')
+
+
+def spider_class_name(name, site):
+    return site.get('class_name', f"{name.title()}Spider")
+
+
+def spider_manifest():
+    """Spider name -> (module, class name) for every SITES entry"""
+    return {
+        name: (site.get('module', REGISTRY_MODULE), spider_class_name(name, site))
+        for name, site in SITES.items()
+    }
+
+
+def check_manifest():
+    """List of problems between SITES and the spiders package; empty when they agree"""
+    problems = []
+    modules = {f'{SPIDERS_PACKAGE}.{info.name}' for info in pkgutil.iter_modules([SPIDERS_DIR])}
+    referenced = {REGISTRY_MODULE}
+    for name, (module, class_name) in spider_manifest().items():
+        referenced.add(module)
+        if module not in modules:
+            problems.append(f"{name}: module {module} not found")
+            continue
+        if module == REGISTRY_MODULE:
+            continue
+        # Read the source instead of importing it: the point is not to load the spiders
+        path = os.path.join(SPIDERS_DIR, module.rsplit('.', 1)[1] + '.py')
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        if not re.search(rf'^class {re.escape(class_name)}\b', source, re.MULTILINE):
+            problems.append(f"{name}: class {class_name} not found in {module}")
+        if not re.search(rf"""@site_spider\(['"]{re.escape(name)}['"]\)""", source):
+            problems.append(f"{name}: {module} does not use @site_spider('{name}')")
+    for module in sorted(modules - referenced):
+        problems.append(f"{module}: not referenced from SITES, the spider loader never imports it")
+    return problems
@@ -3,7 +3,13 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
+import logging
+import zlib
+
 from scrapy import signals
+from scrapy.downloadermiddlewares.httpcompression import ACCEPTED_ENCODINGS, HttpCompressionMiddleware
+from scrapy.exceptions import IgnoreRequest, NotConfigured, StopDownload
+from scrapy.utils.httpobj import urlparse_cached
 
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
@@ -98,3 +104,194 @@ class NewsScraperDownloaderMiddleware:
 
     def spider_opened(self, spider):
         spider.logger.info("Spider opened: %s" % spider.name)
+
+
+class CompressionStatsMiddleware(HttpCompressionMiddleware):
+    """HttpCompressionMiddleware that negotiates every encoding this install can decode
+    (gzip, deflate; br with brotli, zstd with zstandard) and records wire vs decoded bytes per site"""
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        middleware = super().from_crawler(crawler)
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def process_request(self, request, spider):
+        # Replace any hard-coded value: never offer an encoding we cannot decode
+        request.headers['Accept-Encoding'] = b', '.join(ACCEPTED_ENCODINGS)
+
+    def process_response(self, request, response, spider):
+        if request.method == 'HEAD':
+            return response
+        # StreamGuard runs first and may have swapped a cut body for its decoded prefix;
+        # it leaves what actually came over the wire in the request meta
+        wire = request.meta.pop(StreamGuardMiddleware.WIRE_META_KEY, None)
+        if wire:
+            encoding, wire_bytes = wire['encoding'], wire['bytes']
+        else:
+            encoding = (response.headers.getlist('Content-Encoding') or [b'identity'])[-1].decode('latin-1').lower()
+            wire_bytes = len(response.body)
+        response = super().process_response(request, response, spider)
+        if self.stats:
+            host = urlparse_cached(request).hostname
+            self.stats.inc_value(f'compression/{host}/wire_bytes', wire_bytes, spider=spider)
+            self.stats.inc_value(f'compression/{host}/decoded_bytes', len(response.body), spider=spider)
+            self.stats.inc_value(f'compression/encoding/{encoding}', spider=spider)
+        return response
+
+    def spider_closed(self, spider):
+        if not self.stats:
+            return
+        stats = self.stats.get_stats(spider)
+        for key, wire_bytes in stats.items():
+            if not (key.startswith('compression/') and key.endswith('/wire_bytes')):
+                continue
+            host = key[len('compression/'):-len('/wire_bytes')]
+            decoded_bytes = stats.get(f'compression/{host}/decoded_bytes', 0)
+            ratio = decoded_bytes / wire_bytes if wire_bytes else 0
+            logging.getLogger(__name__).info(
+                f"📦 {host}: {wire_bytes / 1024:.0f} KB փոխանցված, {decoded_bytes / 1024:.0f} KB ապասեղմված (x{ratio:.1f})"
+            )
+
+
+class _BrotliStream:
+    def __init__(self):
+        import brotli
+        self._decompressor = brotli.Decompressor()
+
+    def decompress(self, data):
+        return self._decompressor.process(data)
+
+
+def stream_decoder(encoding):
+    """Incremental decoder for a Content-Encoding, or None if it cannot be decoded here"""
+    if encoding in (b'gzip', b'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == b'deflate':
+        return zlib.decompressobj()
+    try:
+        if encoding == b'br':
+            return _BrotliStream()
+        if encoding == b'zstd':
+            import zstandard
+            return zstandard.ZstdDecompressor().decompressobj()
+    except ImportError:
+        pass
+    return None
+
+
+class StreamGuardMiddleware:
+    """Bounds what is downloaded for a page while it streams in: non-HTML responses are dropped
+    right after the headers, bodies are cut at the site's max size or just after its end marker.
+
+    Per site: SITES[name]['download'] = {'max_bytes': ..., 'end_markers': {'listing': ..., 'article': ...}}.
+    Compressed bodies are decoded incrementally, so markers and sizes apply to the HTML itself;
+    only the decoded size and the marker-length tail are kept while streaming. A cut compressed
+    body is decoded once more from its wire prefix and reaches the spider already decoded.
+    """
+
+    META_KEY = 'stream_guard'
+    # {'encoding', 'bytes'} of a cut response as downloaded, for CompressionStatsMiddleware
+    WIRE_META_KEY = 'stream_guard_wire'
+
+    def __init__(self, crawler):
+        self.stats = crawler.stats
+        self.max_bytes = crawler.settings.getint('STREAM_GUARD_MAX_BYTES')
+        self.content_types = [value.encode() for value in crawler.settings.getlist('STREAM_GUARD_CONTENT_TYPES')]
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('STREAM_GUARD_ENABLED'):
+            raise NotConfigured
+        middleware = cls(crawler)
+        crawler.signals.connect(middleware.headers_received, signal=signals.headers_received)
+        crawler.signals.connect(middleware.bytes_received, signal=signals.bytes_received)
+        return middleware
+
+    def limits(self, request, spider):
+        """(max_bytes, end_marker) for this request; article pages are the parse_article requests"""
+        download = (getattr(spider, 'site', None) or {}).get('download', {})
+        kind = 'article' if getattr(request.callback, '__name__', None) == 'parse_article' else 'listing'
+        marker = download.get('end_markers', {}).get(kind)
+        return download.get('max_bytes', self.max_bytes), marker.encode('utf-8') if marker else None
+
+    def headers_received(self, headers, body_length, request, spider):
+        content_type = (headers.get('Content-Type') or b'').split(b';')[0].strip().lower()
+        if content_type and self.content_types and content_type not in self.content_types:
+            request.meta[self.META_KEY] = {'rejected': content_type.decode('latin-1')}
+            self.stats.inc_value('stream_guard/rejected_content_type', spider=spider)
+            raise StopDownload(fail=False)
+
+        max_bytes, marker = self.limits(request, spider)
+        state = {'max_bytes': max_bytes, 'marker': marker, 'received': 0, 'tail': b'',
+                 'expected': body_length, 'decoder': None, 'encoding': None}
+        encoding = (headers.get('Content-Encoding') or b'').strip().lower()
+        if encoding and encoding != b'identity':
+            state['encoding'] = encoding
+            state['decoder'] = stream_decoder(encoding)
+            if state['decoder'] is None:
+                # Cannot look inside and a cut body would not decode - leave it to DOWNLOAD_MAXSIZE
+                return
+        request.meta[self.META_KEY] = state
+
+    def bytes_received(self, data, request, spider):
+        state = request.meta.get(self.META_KEY)
+        if not state or 'rejected' in state or state.get('stopped'):
+            return
+        if state['decoder'] is not None:
+            try:
+                data = state['decoder'].decompress(data)
+            except Exception:
+                # Corrupt stream: stop guarding and let HttpCompressionMiddleware report it
+                request.meta.pop(self.META_KEY, None)
+                return
+        state['received'] += len(data)
+
+        reason = None
+        marker = state['marker']
+        if marker:
+            window = state['tail'] + data
+            if marker in window:
+                reason = 'end_marker'
+            state['tail'] = window[-(len(marker) - 1):] if len(marker) > 1 else b''
+        if not reason and state['max_bytes'] and state['received'] >= state['max_bytes']:
+            reason = 'max_bytes'
+        if reason:
+            state['stopped'] = reason
+            self.stats.inc_value(f'stream_guard/stopped/{reason}', spider=spider)
+            raise StopDownload(fail=False)
+
+    def process_response(self, request, response, spider):
+        # Runs before HttpCompressionMiddleware (higher order), on the body as downloaded
+        state = request.meta.pop(self.META_KEY, None)
+        if not state:
+            return response
+        if 'rejected' in state:
+            raise IgnoreRequest(f"Non-HTML response ({state['rejected']}): {request.url}")
+        if state.get('stopped'):
+            self.logger.debug(f"✂️ {request.url}: կարդացվել է {state['received']} բայթ ({state['stopped']})")
+            headers = response.headers
+            body = response.body
+            request.meta[self.WIRE_META_KEY] = {
+                'encoding': (headers.getlist('Content-Encoding') or [b'identity'])[-1].decode('latin-1').lower(),
+                'bytes': len(body),
+            }
+            if state['decoder'] is not None:
+                # A cut compressed stream would fail in HttpCompressionMiddleware - pass on its
+                # decoded prefix (the stream decoder accepts a truncated body)
+                headers = headers.copy()
+                del headers['Content-Encoding']
+                body = stream_decoder(state['encoding']).decompress(body)
+            # The last chunk can run past the limit (a whole small gzip page decodes at once)
+            end = body.find(state['marker']) if state['marker'] else -1
+            if end >= 0:
+                body = body[:end + len(state['marker'])]
+            body = body[:state['max_bytes'] or None]
+            response = response.replace(body=body, headers=headers)
+        return response
+
+    def process_exception(self, request, exception, spider):
+        # A failed download does not reach process_response; drop its decoder and tail
+        request.meta.pop(self.META_KEY, None)
+
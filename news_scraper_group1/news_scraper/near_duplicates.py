@@ -0,0 +1,152 @@
+# Cross-site near-duplicate detection (SimHash)
+#
+# Armenian outlets republish each other's stories almost verbatim. Each matched article gets
+# a 64-bit SimHash over word 2-shingles of its cleaned text. Fingerprints are indexed by eight
+# 8-bit bands, so any fingerprint within Hamming distance 7 shares at least one band and is
+# found with eight key lookups (one pipelined round trip). The index lives in Redis (shared by
+# all spider processes) with a time window; without Redis it falls back to an in-memory index
+# for the current process.
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+BANDS = 8
+BAND_BITS = 8
+BAND_MASK = (1 << BAND_BITS) - 1
+
+
+def shingles(text, size=2):
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < size:
+        return words
+    return [" ".join(words[index:index + size]) for index in range(len(words) - size + 1)]
+
+
+def simhash(text, size=2):
+    """64-bit SimHash fingerprint of text"""
+    weights = [0] * 64
+    for shingle in shingles(text, size):
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            if value >> bit & 1:
+                weights[bit] += 1
+            else:
+                weights[bit] -= 1
+    fingerprint = 0
+    for bit in range(64):
+        if weights[bit] > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count('1')
+
+
+def bands(fingerprint):
+    return [(index, fingerprint >> (index * BAND_BITS) & BAND_MASK) for index in range(BANDS)]
+
+
+class NearDuplicateIndex:
+    def __init__(self, redis_client=None, window_hours=None, max_distance=None, min_words=None):
+        self.redis_client = redis_client
+        self.window_seconds = int(float(window_hours or os.environ.get('NEAR_DUP_WINDOW_HOURS', 48)) * 3600)
+        self.max_distance = max_distance if max_distance is not None else int(os.environ.get('NEAR_DUP_MAX_DISTANCE', 6))
+        self.min_words = min_words or int(os.environ.get('NEAR_DUP_MIN_WORDS', 40))
+        self.memory_index = {}  # (band, value) -> {fingerprint_hex: entry}
+        self.logger = logging.getLogger(__name__)
+
+    def fingerprint(self, title, content):
+        """Fingerprint for an article, or None if the text is too short to compare reliably"""
+        text = f"{title or ''} {content or ''}"
+        if len(WORD_PATTERN.findall(text)) < self.min_words:
+            return None
+        return simhash(text)
+
+    def _band_key(self, band, value):
+        return f"near_dup:{band}:{value:02x}"
+
+    def _candidates(self, fingerprint):
+        """{fingerprint_hex: (entry, bucket)} for every fingerprint sharing a band"""
+        candidates = {}
+        if self.redis_client:
+            keys = [self._band_key(band, value) for band, value in bands(fingerprint)]
+            pipe = self.redis_client.pipeline()
+            for key in keys:
+                pipe.hgetall(key)
+            for key, result in zip(keys, pipe.execute()):
+                for fingerprint_hex, raw_entry in (result or {}).items():
+                    try:
+                        candidates[fingerprint_hex] = (json.loads(raw_entry), key)
+                    except ValueError:
+                        continue
+            return candidates
+        for band, value in bands(fingerprint):
+            for fingerprint_hex, entry in self.memory_index.get((band, value), {}).items():
+                candidates[fingerprint_hex] = (entry, (band, value))
+        return candidates
+
+    def find(self, fingerprint, link=None):
+        """Closest indexed article within max_distance (and the time window), or None"""
+        if fingerprint is None:
+            return None
+        now = time.time()
+        best = None
+        stale = []
+        for fingerprint_hex, (entry, bucket) in self._candidates(fingerprint).items():
+            if now - entry.get('ts', 0) > self.window_seconds:
+                stale.append((bucket, fingerprint_hex))
+                continue
+            if entry.get('link') == link:
+                continue
+            distance = hamming_distance(fingerprint, int(fingerprint_hex, 16))
+            if distance <= self.max_distance and (best is None or distance < best['distance']):
+                best = dict(entry, distance=distance)
+        self._prune(stale)
+        return best
+
+    def _prune(self, stale):
+        # Busy buckets keep getting their TTL refreshed, so old fields are dropped on read
+        if not stale:
+            return
+        if self.redis_client:
+            pipe = self.redis_client.pipeline()
+            for key, fingerprint_hex in stale:
+                pipe.hdel(key, fingerprint_hex)
+            pipe.execute()
+            return
+        for bucket, fingerprint_hex in stale:
+            self.memory_index.get(bucket, {}).pop(fingerprint_hex, None)
+
+    def add(self, fingerprint, link, title=''):
+        if fingerprint is None:
+            return
+        fingerprint_hex = f"{fingerprint:016x}"
+        entry = {'link': link, 'title': (title or '')[:200], 'ts': time.time()}
+        if self.redis_client:
+            raw_entry = json.dumps(entry, ensure_ascii=False)
+            pipe = self.redis_client.pipeline()
+            for band, value in bands(fingerprint):
+                key = self._band_key(band, value)
+                pipe.hset(key, fingerprint_hex, raw_entry)
+                pipe.expire(key, self.window_seconds)
+            pipe.execute()
+            return
+        for band, value in bands(fingerprint):
+            self.memory_index.setdefault((band, value), {})[fingerprint_hex] = entry
+
+    def record_repost(self, canonical_link, link):
+        """Remember that link republishes canonical_link (folded into the canonical record)"""
+        if not self.redis_client:
+            return
+        key = f"near_dup:reposts:{hashlib.md5(canonical_link.encode()).hexdigest()}"
+        pipe = self.redis_client.pipeline()
+        pipe.sadd(key, link)
+        pipe.expire(key, self.window_seconds)
+        pipe.execute()
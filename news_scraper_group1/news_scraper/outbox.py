@@ -0,0 +1,211 @@
+# Durable local outbox for matched articles
+#
+# The pipeline appends every matched article to segmented JSONL files first; a background
+# drainer uploads them in order and checkpoints (segment, byte offset) after each one.
+# Crawling no longer waits on the backend, and nothing is lost while the API is down -
+# whatever is not uploaded when a spider closes is picked up by the next run.
+#
+# One drainer per process (shared_drainer): every spider's pipeline uses it, and the last one to
+# close stops it. Across processes a file lock picks the drainer; the others keep retrying it.
+
+import fcntl
+import glob
+import json
+import logging
+import os
+import re
+import threading
+
+from news_scraper.storage import load_json, save_json_atomic, state_dir
+
+SEGMENT_PATTERN = re.compile(r'segment-(\d+)\.jsonl$')
+
+
+class Outbox:
+    def __init__(self, directory=None, segment_max_bytes=1024 * 1024):
+        self.directory = directory or os.path.join(state_dir(), 'outbox')
+        os.makedirs(self.directory, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.checkpoint_path = os.path.join(self.directory, 'checkpoint.json')
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _segment_path(self, number):
+        return os.path.join(self.directory, f"segment-{number:06d}.jsonl")
+
+    def segments(self):
+        """Existing segment numbers in order"""
+        numbers = []
+        for path in glob.glob(os.path.join(self.directory, 'segment-*.jsonl')):
+            match = SEGMENT_PATTERN.search(path)
+            if match:
+                numbers.append(int(match.group(1)))
+        return sorted(numbers)
+
+    def checkpoint(self):
+        data = load_json(self.checkpoint_path, {}) or {}
+        return data.get('segment', 0), data.get('offset', 0)
+
+    def append(self, record):
+        """Durably append one record (one JSON line) to the newest segment"""
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+        with self.lock:
+            segments = self.segments()
+            number = segments[-1] if segments else max(1, self.checkpoint()[0])
+            path = self._segment_path(number)
+            if os.path.exists(path) and os.path.getsize(path) >= self.segment_max_bytes:
+                number += 1
+                path = self._segment_path(number)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, line)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def pending(self):
+        """Yield (segment, end_offset, record) for everything after the checkpoint"""
+        checkpoint_segment, checkpoint_offset = self.checkpoint()
+        for number in self.segments():
+            if number < checkpoint_segment:
+                continue
+            offset = checkpoint_offset if number == checkpoint_segment else 0
+            try:
+                with open(self._segment_path(number), 'rb') as f:
+                    f.seek(offset)
+                    for raw_line in f:
+                        offset += len(raw_line)
+                        if not raw_line.endswith(b"\n"):
+                            # Partially written line from a crashed writer - stop here
+                            return
+                        try:
+                            record = json.loads(raw_line.decode('utf-8'))
+                        except ValueError:
+                            self.logger.warning(f"⚠️ Outbox-ում վնասված տող, բաց է թողնվում ({number}:{offset})")
+                            self.commit(number, offset)
+                            continue
+                        yield number, offset, record
+            except FileNotFoundError:
+                continue
+
+    def pending_count(self):
+        return sum(1 for _ in self.pending())
+
+    def commit(self, segment, offset):
+        """Checkpoint progress and remove segments that are fully uploaded"""
+        with self.lock:
+            save_json_atomic(self.checkpoint_path, {'segment': segment, 'offset': offset})
+            for number in self.segments():
+                if number < segment:
+                    try:
+                        os.remove(self._segment_path(number))
+                    except OSError:
+                        pass
+
+
+class OutboxDrainer(threading.Thread):
+    """Background thread uploading outbox records in order
+
+    upload(record) must return True when the record is done with (saved, duplicate or
+    rejected by the backend) and False when it should be retried later.
+    """
+
+    def __init__(self, outbox, upload, idle_interval=1.0, retry_interval=5.0, max_retry_interval=60.0):
+        super().__init__(name='outbox-drainer', daemon=True)
+        self.outbox = outbox
+        self.upload = upload
+        self.idle_interval = idle_interval
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.wakeup = threading.Event()
+        self.stopping = threading.Event()
+        self.uploaded = 0
+        self.logger = logging.getLogger(__name__)
+        self._lock_file = None
+
+    def notify(self):
+        """Wake the drainer after a new append"""
+        self.wakeup.set()
+
+    def _acquire_process_lock(self):
+        # Only one process drains the outbox at a time; others just append
+        if self._lock_file is None:
+            self._lock_file = open(os.path.join(self.outbox.directory, 'drain.lock'), 'w')
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def drain_once(self):
+        """Upload pending records; returns False if an upload failed"""
+        for segment, offset, record in self.outbox.pending():
+            try:
+                done = self.upload(record)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Outbox upload սխալ: {e}")
+                done = False
+            if not done:
+                return False
+            self.outbox.commit(segment, offset)
+            self.uploaded += 1
+        return True
+
+    def run(self):
+        if not self._acquire_process_lock():
+            self.logger.info("📦 Outbox-ը դատարկում է մեկ այլ պրոցես, կփորձենք նորից")
+            # The other process may finish first; take over then
+            while not self._acquire_process_lock():
+                if self.stopping.wait(self.retry_interval):
+                    return
+        retry_interval = self.retry_interval
+        while True:
+            ok = self.drain_once()
+            if self.stopping.is_set():
+                break
+            if ok:
+                retry_interval = self.retry_interval
+                self.wakeup.wait(self.idle_interval)
+            else:
+                self.wakeup.wait(retry_interval)
+                retry_interval = min(self.max_retry_interval, retry_interval * 2)
+            self.wakeup.clear()
+
+    def stop(self, timeout=30):
+        """Finish the current pass (bounded by timeout) and stop"""
+        self.stopping.set()
+        self.wakeup.set()
+        if self.is_alive():
+            self.join(timeout)
+        if self._lock_file and not self.is_alive():
+            self._lock_file.close()
+        return not self.is_alive()
+
+
+# The process's drainer, shared by every pipeline in it
+_drainer = None
+_drainer_users = 0
+_drainer_lock = threading.Lock()
+
+
+def shared_drainer(outbox, upload):
+    """The process-wide drainer, started by the first caller; pair every call with release_drainer()"""
+    global _drainer, _drainer_users
+    with _drainer_lock:
+        if _drainer is None:
+            _drainer = OutboxDrainer(outbox, upload)
+            _drainer.start()
+        _drainer_users += 1
+        return _drainer
+
+
+def release_drainer(timeout=30):
+    """Drop one user; the last one stops the drainer (bounded by timeout). True if it was the last"""
+    global _drainer, _drainer_users
+    with _drainer_lock:
+        _drainer_users -= 1
+        if _drainer_users > 0 or _drainer is None:
+            return False
+        drainer, _drainer = _drainer, None
+    drainer.stop(timeout=timeout)
+    return True
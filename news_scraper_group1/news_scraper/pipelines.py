@@ -5,10 +5,18 @@ import logging
 import requests
 import json
 import os
-import hashlib
-import redis
-from datetime import datetime
-from itemadapter import ItemAdapter
+
+from news_scraper.circuit_breaker import CircuitBreakerRegistry
+from news_scraper.corpus import article_corpus
+from news_scraper.keyword_feed import keyword_source
+from news_scraper.near_duplicates import NearDuplicateIndex
+from news_scraper.outbox import Outbox, release_drainer, shared_drainer
+from news_scraper.storage import redis_client
+from news_scraper.text_normalization import KeywordMatcher, keyword_words, normalize_text
+
+# Spiders open in this process by name: the shared drainer credits each upload to its spider
+OPEN_SPIDERS = {}
+
 
 class NewsScraperPipeline:
     def __init__(self):
@@ -19,8 +27,36 @@ class NewsScraperPipeline:
             'Content-Type': 'application/json',
             'User-Agent': 'NewsMonitor/1.0'
         })
-        self.api_working = True  # Track if API is working
-        
+
+        # Per-operation circuit breakers (save / telegram) instead of a sticky flag; keywords come
+        # from the shared snapshot, fetched by news_scraper.keyword_feed under its own breaker
+        self.breakers = CircuitBreakerRegistry()
+        for operation in ('save', 'telegram'):
+            self.breakers.get(operation)
+
+        # Matched articles go to the durable outbox first; the process's background drainer
+        # uploads them. The drainer has its own session - requests.Session is not shared across threads.
+        self.outbox = Outbox()
+        self.upload_session = requests.Session()
+        self.upload_session.headers.update(self.session.headers)
+        self.drainer = None
+        self.drain_timeout = float(os.environ.get('OUTBOX_DRAIN_TIMEOUT', 30))
+        self.queued_articles = 0
+        self.spider = None
+
+        # Cross-site re-posts are folded into the first copy (one API record, one notification)
+        self.near_duplicates = NearDuplicateIndex(redis_client())
+        self.folded_reposts = 0
+
+        # Compiled keyword stems, rebuilt when the fetched list changes
+        self._matcher = None
+        self._matcher_words = None
+
+        # Telegram settings (TELEGRAM_API_URL-ը թույլ է տալիս ուղղել դեպի local mock server)
+        self.telegram_api_url = os.environ.get('TELEGRAM_API_URL', 'https://api.telegram.org').rstrip('/')
+        self.telegram_bot_token = os.environ.get('TELEGRAM_BOT_TOKEN', "8151695933:AAGeY8Rgqz4_ERUATORGvdnimEvFQwHqdwc")
+        self.telegram_chat_id = os.environ.get('TELEGRAM_CHAT_ID', "-1002802141303")  # Monitor group ID
+
         # Fallback keywords if API is not available - match API format
         self.fallback_keywords = [
             {"id": 1, "word": "Հայաստան"},
@@ -35,201 +71,226 @@ class NewsScraperPipeline:
             {"id": 10, "word": "Առողջապահություն"}
         ]
 
+    def open_spider(self, spider):
+        """Join the process's outbox drainer; leftovers from earlier runs are uploaded first"""
+        self.spider = spider
+        OPEN_SPIDERS[spider.name] = spider
+        self.drainer = shared_drainer(self.outbox, self.upload_article)
+
+    def fetch_keywords(self):
+        """Current keyword snapshot (news_scraper/keyword_feed.py); the built-in list if there is none"""
+        keywords = keyword_source().keywords
+        if keywords is None:
+            self.logger.info("⚠️ Keywords snapshot չկա, օգտագործում ենք fallback")
+            return self.fallback_keywords
+        return keywords
+
+    def keyword_matcher(self, all_keywords):
+        """KeywordMatcher for the keyword list, recompiled only when the list changes"""
+        words = tuple(keyword_words(all_keywords))
+        if self._matcher is None or self._matcher_words != words:
+            self._matcher = KeywordMatcher(list(words))
+            self._matcher_words = words
+        return self._matcher
+
+    def match_keywords(self, item, all_keywords):
+        """Return the list of keywords found in the item's title and content"""
+        matcher = self.keyword_matcher(all_keywords)
+        self.logger.info(f"🔍 Ստուգվում են {len(matcher)} բանալի բառ հոդվածի մեջ...")
+
+        # Normalized by the spider; items from elsewhere are normalized here, once
+        article_text = item.get('normalized_text') or normalize_text(f"{item.get('title', '')} {item.get('content', '')}")
+        keywords = matcher.matches(article_text)
+        for keyword in keywords:
+            self.logger.info(f"✅ Բանալի բառ գտնվեց: '{keyword}'")
+
+        if keywords:
+            self.logger.info(f"🔑 Ընդամենը գտնվեց {len(keywords)} բանալի բառ: {', '.join(keywords)}")
+        else:
+            self.logger.info("❌ Բանալի բառեր չգտնվեցին")
+        return keywords
+
     def process_item(self, item, spider):
         try:
-            # Skip API calls if API is not working
-            if not self.api_working:
-                self.logger.info(f"🚫 API չի աշխատում, հոդվածը չի պահպանվում: {item['title'][:60]}...")
-                return item
-
             # Check if article already exists via API (skip if API not working)
             # Note: Check endpoints don't work, so we'll rely on save endpoint's duplicate detection
-            
-            # Get keywords via API with fallback
-            keywords = []
+
+            # Keywords from the shared snapshot, built-in list as fallback
             try:
-                # Try multiple endpoints for keywords
-                keyword_endpoints = [
-                    f"{self.api_base_url}/api/keywords/",
-                    f"{self.api_base_url}/api/keywords",
-                    f"{self.api_base_url}/keywords/",
-                    f"{self.api_base_url}/keywords"
-                ]
-                
-                all_keywords = []
-                for endpoint in keyword_endpoints:
-                    try:
-                        response = self.session.get(endpoint, timeout=10)
-                        if response.status_code == 200:
-                            all_keywords = response.json()
-                            self.logger.info(f"✅ Keywords ստացվեցին {endpoint}-ից")
-                            break
-                        elif response.status_code == 404:
-                            self.logger.warning(f"⚠️ Endpoint չի գտնվել՝ {endpoint}")
-                            continue
-                    except Exception as e:
-                        self.logger.warning(f"⚠️ Network error {endpoint}: {e}")
-                        continue
-                
-                # Use fallback keywords if API failed
-                if not all_keywords:
-                    self.logger.warning("⚠️ API keywords չաշխատեց, օգտագործում ենք fallback")
-                    all_keywords = self.fallback_keywords
-                    self.api_working = False
-                
-                # Handle API response format - extract results if it's a dictionary
-                if isinstance(all_keywords, dict) and 'results' in all_keywords:
-                    all_keywords = all_keywords['results']
-                    self.logger.info(f"✅ Extracted {len(all_keywords)} keywords from API response")
-                
-                # Match keywords in article
-                article_text = f"{item.get('title', '')} {item.get('content', '')}".lower()
-                self.logger.info(f"🔍 Ստուգվում են {len(all_keywords)} բանալի բառ հոդվածի մեջ...")
-                
-                # Debug: print first few keywords
-                if all_keywords and len(all_keywords) > 0:
-                    self.logger.info(f"🔍 Debug: First keyword: {all_keywords[0]}")
-                
-                # Check if all_keywords is a list of objects or just a list
-                if all_keywords and isinstance(all_keywords, list):
-                    if len(all_keywords) > 0 and isinstance(all_keywords[0], dict):
-                        # It's a list of objects with 'word' key
-                        for keyword_obj in all_keywords:
-                            keyword_lower = keyword_obj.get('word', '').lower().strip()
-                            if keyword_lower and keyword_lower in article_text:
-                                # Avoid duplicates
-                                if keyword_obj.get('word') not in keywords:
-                                    keywords.append(keyword_obj.get('word'))
-                                    self.logger.info(f"✅ Բանալի բառ գտնվեց: '{keyword_obj.get('word')}'")
-                    else:
-                        # It's a list of strings
-                        for keyword_str in all_keywords:
-                            keyword_lower = keyword_str.lower().strip()
-                            if keyword_lower and keyword_lower in article_text:
-                                # Avoid duplicates
-                                if keyword_str not in keywords:
-                                    keywords.append(keyword_str)
-                                    self.logger.info(f"✅ Բանալի բառ գտնվեց: '{keyword_str}'")
-                
-                if keywords:
-                    self.logger.info(f"🔑 Ընդամենը գտնվեց {len(keywords)} բանալի բառ: {', '.join(keywords)}")
-                else:
-                    self.logger.info("❌ Բանալի բառեր չգտնվեցին")
-                        
+                keywords = self.match_keywords(item, self.fetch_keywords())
             except Exception as e:
                 self.logger.warning(f"Keywords matching error: {e}")
-                self.api_working = False
                 return item
 
-            # Save article via API ONLY if keywords were found and API is working
-            if keywords and len(keywords) > 0 and self.api_working:
-                try:
-                    article_data = {
-                        'title': item['title'],
-                        'link': item['link'],
-                        'source_url': item.get('source_url', item['link']),
-                        'content': item.get('content', ''),
-                        'scraped_time': item.get('scraped_time', ''),
-                        'keywords': keywords
-                    }
-                    
-                    # Debug: print article data being sent
-                    self.logger.info(f"🔍 Debug: Sending article data: {article_data}")
-                    
-                    # Try multiple endpoints for saving articles
-                    save_endpoints = [
-                        f"{self.api_base_url}/api/articles/",
-                        f"{self.api_base_url}/api/articles",
-                        f"{self.api_base_url}/articles/",
-                        f"{self.api_base_url}/articles"
-                    ]
-                    
-                    article_saved = False
-                    for endpoint in save_endpoints:
-                        try:
-                            response = self.session.post(
-                                endpoint,
-                                json=article_data,
-                                timeout=10
-                            )
-                            
-                            if response.status_code == 201:
-                                spider.new_articles += 1
-                                self.logger.info(f"💾 Նոր հոդված պահպանվեց {len(keywords)} բանալի բառով: {item['title'][:60]}...")
-                                article_saved = True
-                                
-                                # Send Telegram notification directly via bot token
-                                try:
-                                    bot_token = "8151695933:AAGeY8Rgqz4_ERUATORGvdnimEvFQwHqdwc"
-                                    chat_id = "-1002802141303"  # Monitor group ID
-                                    
-                                    # Create message
-                                    message = f"📰 **Նոր հոդված գտնվեց!**\n\n"
-                                    message += f"**Վերնագիր:** {item['title']}\n"
-                                    message += f"**Հղում:** {item['link']}\n"
-                                    message += f"**Բանալի բառեր:** {', '.join(keywords)}"
-                                    
-                                    telegram_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-                                    telegram_data = {
-                                        'chat_id': chat_id,
-                                        'text': message,
-                                        'parse_mode': 'Markdown',
-                                        'disable_web_page_preview': False
-                                    }
-                                    
-                                    response = self.session.post(telegram_url, json=telegram_data, timeout=10)
-                                    if response.status_code == 200:
-                                        self.logger.info(f"📤 Telegram ծանուցում ուղարկվեց {len(keywords)} բանալի բառով")
-                                    else:
-                                        self.logger.warning(f"⚠️ Telegram error: {response.status_code}")
-                                        
-                                except Exception as e:
-                                    self.logger.warning(f"⚠️ Telegram ծանուցման սխալ: {e}")
-                                break
-                            elif response.status_code == 400:
-                                # Check if it's a duplicate article error
-                                try:
-                                    error_data = response.json()
-                                    if "already exists" in str(error_data) or "link already exists" in str(error_data):
-                                        spider.duplicate_articles += 1
-                                        self.logger.info(f"🔄 Հոդված արդեն գոյություն ունի: {item['title'][:60]}...")
-                                        article_saved = True  # Mark as "handled"
-                                        break
-                                    else:
-                                        self.logger.warning(f"API save error 400: {error_data}")
-                                        continue
-                                except:
-                                    self.logger.warning(f"API save error 400: {response.text[:200]}")
-                                    continue
-                            elif response.status_code == 404:
-                                continue
-                            else:
-                                self.logger.warning(f"API save error: {response.status_code}")
-                                continue
-                                
-                        except Exception as e:
-                            continue
-                    
-                    if not article_saved:
-                        self.logger.warning("⚠️ Ոչ մի save endpoint չաշխատեց")
-                        self.api_working = False
-                        
-                except Exception as e:
-                    self.logger.error(f"Error saving article via API: {e}")
-                    self.api_working = False
-            elif not keywords:
+            if not keywords:
                 self.logger.info(f"🚫 Հոդվածը չի պահպանվում - բանալի բառեր չգտնվեցին: {item['title'][:60]}...")
-            elif not self.api_working:
-                self.logger.info(f"🚫 Հոդվածը չի պահպանվում - API չի աշխատում: {item['title'][:60]}...")
-            
+                return item
+
+            # Handled here (queued or folded) - a later keyword backfill must not send it again
+            corpus = article_corpus()
+            if corpus:
+                corpus.mark_sent(item['link'])
+
+            article_data = {
+                'title': item['title'],
+                'link': item['link'],
+                'source_url': item.get('source_url', item['link']),
+                'content': item.get('content', ''),
+                'scraped_time': item.get('scraped_time', ''),
+                'keywords': keywords
+            }
+
+            # Near-duplicate of a story another site already published -> fold, don't re-send
+            fingerprint = self.near_duplicates.fingerprint(item.get('title'), item.get('content'))
+            original = self.near_duplicates.find(fingerprint, link=item['link'])
+            if original:
+                self.near_duplicates.record_repost(original['link'], item['link'])
+                self.folded_reposts += 1
+                spider.duplicate_articles += 1
+                self.logger.info(f"🔁 Վերահրապարակում (distance {original['distance']}), միացվեց {original['link']}-ին: {item['title'][:60]}...")
+                return item
+            self.near_duplicates.add(fingerprint, item['link'], item.get('title'))
+
+            # Queue for upload; the drainer saves it in order once the API is reachable.
+            # '_spider' stays in the outbox (stats), it is not sent
+            self.outbox.append(dict(article_data, _spider=spider.name))
+            self.queued_articles += 1
+            self.logger.info(f"📦 Հոդվածը ավելացվեց outbox-ում {len(keywords)} բանալի բառով: {item['title'][:60]}...")
+            if self.drainer:
+                self.drainer.notify()
+
         except Exception as e:
             spider.logger.error(f"Error processing article: {e}")
-            
+
         return item
 
+    def save_article(self, article_data, spider):
+        """POST the article; returns 'created', 'duplicate', 'rejected' or None if the API is unreachable.
+
+        spider may be None (its run is over, or the record came from a backfill) - nothing is counted then
+        """
+        breaker = self.breakers.get('save')
+        keywords = article_data['keywords']
+
+        self.logger.debug(f"🔍 Debug: Sending article data: {article_data}")
+
+        # Try multiple endpoints for saving articles
+        save_endpoints = [
+            f"{self.api_base_url}/api/articles/",
+            f"{self.api_base_url}/api/articles",
+            f"{self.api_base_url}/articles/",
+            f"{self.api_base_url}/articles"
+        ]
+
+        rejected = False
+        for endpoint in save_endpoints:
+            try:
+                response = self.upload_session.post(
+                    endpoint,
+                    json=article_data,
+                    timeout=10
+                )
+            except Exception as e:
+                continue
+
+            if response.status_code == 201:
+                breaker.record_success()
+                if spider:
+                    spider.new_articles += 1
+                self.logger.info(f"💾 Նոր հոդված պահպանվեց {len(keywords)} բանալի բառով: {article_data['title'][:60]}...")
+                self.send_telegram_notification(article_data)
+                return 'created'
+            elif response.status_code == 400:
+                # Check if it's a duplicate article error
+                try:
+                    error_data = response.json()
+                except ValueError:
+                    error_data = response.text[:200]
+                if "already exists" in str(error_data) or "link already exists" in str(error_data):
+                    breaker.record_success()
+                    if spider:
+                        spider.duplicate_articles += 1
+                    self.logger.info(f"🔄 Հոդված արդեն գոյություն ունի: {article_data['title'][:60]}...")
+                    return 'duplicate'
+                self.logger.warning(f"API save error 400: {error_data}")
+                rejected = True
+                continue
+            elif response.status_code == 404:
+                continue
+            else:
+                self.logger.warning(f"API save error: {response.status_code}")
+                continue
+
+        if rejected:
+            # Backend answered but refused the payload - not an availability problem
+            breaker.record_success()
+            return 'rejected'
+
+        self.logger.warning("⚠️ Ոչ մի save endpoint չաշխատեց")
+        breaker.record_failure()
+        return None
+
+    def send_telegram_notification(self, article_data):
+        """Send Telegram notification directly via bot token"""
+        breaker = self.breakers.get('telegram')
+        if not breaker.allow_request():
+            self.logger.info("⛔ Telegram circuit-ը բաց է, ծանուցումը բաց է թողնվում")
+            return False
+
+        keywords = article_data['keywords']
+        try:
+            bot_token = self.telegram_bot_token
+            chat_id = self.telegram_chat_id
+
+            # Create message
+            message = f"📰 **Նոր հոդված գտնվեց!**\n\n"
+            message += f"**Վերնագիր:** {article_data['title']}\n"
+            message += f"**Հղում:** {article_data['link']}\n"
+            message += f"**Բանալի բառեր:** {', '.join(keywords)}"
+
+            telegram_url = f"{self.telegram_api_url}/bot{bot_token}/sendMessage"
+            telegram_data = {
+                'chat_id': chat_id,
+                'text': message,
+                'parse_mode': 'Markdown',
+                'disable_web_page_preview': False
+            }
+
+            response = self.upload_session.post(telegram_url, json=telegram_data, timeout=10)
+            if response.status_code == 200:
+                breaker.record_success()
+                self.logger.info(f"📤 Telegram ծանուցում ուղարկվեց {len(keywords)} բանալի բառով")
+                return True
+            self.logger.warning(f"⚠️ Telegram error: {response.status_code}")
+            if response.status_code >= 500 or response.status_code == 429:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Telegram ծանուցման սխալ: {e}")
+            breaker.record_failure()
+        return False
+
+    def upload_article(self, article_data):
+        """Outbox drainer callback: True once the record is handled, False to retry later"""
+        if not self.breakers.get('save').allow_request():
+            return False
+        # Credited to the spider that queued it, while that spider is still running here
+        spider = OPEN_SPIDERS.get(article_data.get('_spider'))
+        payload = {key: value for key, value in article_data.items() if not key.startswith('_')}
+        return self.save_article(payload, spider) is not None
+
     def close_spider(self, spider):
-        """Called when spider closes"""
-        if not self.api_working:
-            self.logger.warning("⚠️ Spider ավարտվեց - API չի աշխատում")
+        """Called when spider closes - the last spider of the process gives the drainer a bounded time to flush"""
+        last = False
+        if self.drainer:
+            last = release_drainer(timeout=self.drain_timeout)
+            self.drainer = None
+        OPEN_SPIDERS.pop(spider.name, None)
+        pending = self.outbox.pending_count() if last else 0
+        if pending:
+            self.logger.warning(f"⚠️ Spider ավարտվեց - {pending} հոդված մնաց outbox-ում, կուղարկվի հաջորդ run-ում (circuits: {self.breakers.summary()})")
         else:
-            self.logger.info("🕷️ Spider finished - cleanup handled by main monitor") 
\ No newline at end of file
+            self.logger.info("🕷️ Spider finished - cleanup handled by main monitor")
+        if self.folded_reposts:
+            self.logger.info(f"🔁 Միացված վերահրապարակումներ: {self.folded_reposts}")
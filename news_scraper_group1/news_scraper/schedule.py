@@ -0,0 +1,131 @@
+# Shared crawl schedule for several identical monitor workers
+#
+# The sites were split into groups by hand (news_scraper_group1, one Render worker per group).
+# With CRAWL_COORDINATION=redis any number of workers share one schedule instead:
+#
+# - "crawl:schedule" is a sorted set spider -> next due time (unix seconds).
+# - A worker claims due spiders by taking "crawl:lease:<spider>" with SET NX EX and renews the
+#   lease while the batch runs (hold()), so however long zygote startup, the reply grace or a
+#   subprocess fallback takes, a spider is never run twice at the same time.
+# - When the run ends the worker moves the spider's due time one interval on and drops its
+#   lease. If the worker dies, the lease expires with the due time unchanged and the next
+#   worker that polls claims the spider.
+#
+# Adding a worker is enough to scale out; no site lists to rebalance.
+
+import contextlib
+import os
+import socket
+import threading
+import time
+
+SCHEDULE_KEY = 'crawl:schedule'
+LEASE_PREFIX = 'crawl:lease:'
+
+# Extend the lease only if this worker still holds it
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Delete the lease only if this worker still holds it
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class SpiderSchedule:
+    def __init__(self, client, interval, worker_id=None):
+        self.client = client
+        self.interval = interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.renew_script = client.register_script(RENEW_SCRIPT)
+        self.release_script = client.register_script(RELEASE_SCRIPT)
+        self.claimed_at = {}
+
+    def sync(self, spiders):
+        """Register the spiders (new ones are due now) and drop ones that no longer exist"""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zadd(SCHEDULE_KEY, {name: 0 for name in spiders}, nx=True)
+        pipe.zrange(SCHEDULE_KEY, 0, -1)
+        known = pipe.execute()[1]
+        removed = [name for name in known if name not in set(spiders)]
+        if removed:
+            self.client.zrem(SCHEDULE_KEY, *removed)
+        return removed
+
+    def claim(self, limit, lease_seconds):
+        """Up to limit due spiders, most overdue first, leased to this worker"""
+        now = time.time()
+        claimed = []
+        for name in self.client.zrangebyscore(SCHEDULE_KEY, '-inf', now, start=0, num=limit * 4):
+            if not self.client.set(f"{LEASE_PREFIX}{name}", self.worker_id, nx=True, ex=int(lease_seconds)):
+                continue
+            # Another worker may have finished it between the range read and the lease
+            score = self.client.zscore(SCHEDULE_KEY, name)
+            if score is None or score > now:
+                self.release([name])
+                continue
+            claimed.append(name)
+            self.claimed_at[name] = now
+            if len(claimed) >= limit:
+                break
+        return claimed
+
+    def complete(self, spiders):
+        """Schedule the next run one interval after this one was claimed and drop the leases"""
+        now = time.time()
+        self.client.zadd(SCHEDULE_KEY, {
+            name: self.claimed_at.pop(name, now) + self.interval for name in spiders
+        })
+        self.release(spiders)
+
+    def renew(self, spiders, lease_seconds):
+        """Extend this worker's leases; returns the spiders whose lease was lost"""
+        return [
+            name for name in spiders
+            if not self.renew_script(keys=[f"{LEASE_PREFIX}{name}"], args=[self.worker_id, int(lease_seconds)])
+        ]
+
+    @contextlib.contextmanager
+    def hold(self, spiders, lease_seconds):
+        """Keep renewing the spiders' leases (every third of the lease) until the block ends"""
+        done = threading.Event()
+
+        def keep():
+            while not done.wait(lease_seconds / 3):
+                try:
+                    self.renew(spiders, lease_seconds)
+                except Exception:
+                    # Redis hiccup: the next renewal still comes well before the lease ends
+                    continue
+
+        keeper = threading.Thread(target=keep, name='lease-keeper', daemon=True)
+        keeper.start()
+        try:
+            yield
+        finally:
+            done.set()
+            keeper.join()
+
+    def release(self, spiders):
+        for name in spiders:
+            self.release_script(keys=[f"{LEASE_PREFIX}{name}"], args=[self.worker_id])
+
+    def next_due_in(self):
+        """Seconds until the earliest spider is due (0 if one is due now)"""
+        first = self.client.zrange(SCHEDULE_KEY, 0, 0, withscores=True)
+        if not first:
+            return self.interval
+        return max(0.0, first[0][1] - time.time())
+
+    def leases(self):
+        """{spider: worker} for the runs in progress"""
+        keys = list(self.client.scan_iter(match=f"{LEASE_PREFIX}*"))
+        values = self.client.mget(keys) if keys else []
+        return {key[len(LEASE_PREFIX):]: value for key, value in zip(keys, values) if value}
@@ -0,0 +1,2778 @@
+# Site registry
+#
+# One entry per news site, keyed by spider name. news_scraper.spiders.registry builds a
+# SiteSpider (news_scraper/engine.py) class from every entry without a 'module'; entries with
+# a 'module' are bespoke SiteSpider subclasses that live in that spider module. No Scrapy
+# imports here, so the monitor can read the site list cheaply.
+#
+# Entry keys:
+#   class_name, label          - spider class name, name shown in the run summary
+#   priority                   - pins the crawl order within a monitor cycle (higher first,
+#                                default 0); within a priority the order comes from the run
+#                                history (budgets.cycle_order), and the last ones are deferred
+#                                when the cycle deadline is near
+#   allowed_domains, start_urls
+#   settings                   - custom_settings (only where a site differs from settings.py)
+#   cache_prefix, cache_key    - Redis key prefix (default "processed_<name>:"), 'url_title' or 'url'
+#   listing                    - articles (selectors, first with hits wins; combine=True joins
+#                                them), exclude, limit, link / title (selectors, first value wins),
+#                                require_title, title_rules / link_rules (engine.TextFilter rules),
+#                                same_site, sort_by, meta (name -> selectors), fallback (a listing
+#                                spec used when no articles were found), date (selectors; else the
+#                                article's date_meta keys) and max_age_hours (default
+#                                LISTING_MAX_AGE_HOURS): older entries are skipped without a download
+#   article                    - title (selectors), title_rules, title_strip (regexes), title_split,
+#                                prefer_listing_title, container / container_content, content
+#                                (selector tiers), min_parts, tier_parts (first N fragments of a
+#                                tier), clean / fallback_clean / later_clean (TextFilter rules;
+#                                later_clean skips the first fragment), max_parts, stop_at, join,
+#                                unique_parts, min_content_length,
+#                                min_words, date, date_meta, keyword_meta, structured_data (False
+#                                skips the JSON-LD / og: meta fast path)
+#   download                   - max_bytes (body cut-off, default STREAM_GUARD_MAX_BYTES) and
+#                                end_markers ({'listing': ..., 'article': ...}: stop reading once seen)
+
+# Shared stop lists
+
+SOCIAL = ['facebook', 'twitter', 'instagram', 'telegram', 'youtube', 'whatsapp']
+
+# Navigation / footer words used by the newday-style cleaners (newday, past, ...)
+COMMON_FRAGMENTS = [
+    # Navigation and UI elements
+    '•', '›', '»', '«', '‹', '→', '←', '↑', '↓', '▲', '▼', '◄', '►',
+    # Social media and sharing
+    'share', 'facebook', 'twitter', 'whatsapp', 'telegram', 'viber', 'linkedin',
+    'share on', 'follow us', 'subscribe', 'like us',
+    'կիսվել', 'տարածել', 'ուղարկել', 'պահպանել', 'տպել', 'print',
+    # Navigation terms
+    'գլխավոր', 'մենյու', 'բաժին', 'կատեգորիա', 'ետ', 'առաջ', 'հետ',
+    'home', 'menu', 'back', 'next', 'previous', 'continue', 'section', 'category',
+    # Footer elements
+    'copyright', '©', 'բոլոր իրավունքները', 'all rights reserved',
+    'կայքի իրավունքները', 'terms of use', 'privacy policy', 'legal',
+    # Ads and sponsored content
+    'advertisement', 'sponsored', 'реклама', 'գովազդ', 'promo',
+    # Common website elements
+    'read more', 'ավելին', 'continue reading', 'բացել', 'կարդալ ավելին',
+    'search', 'որոնում', 'login', 'մուտք', 'register', 'գրանցվել',
+    # Subscription and newsletter
+    'subscribe', 'բաժանորդագրություն', 'newsletter', 'email',
+    # Comments and feedback
+    'comment', 'մեկնաբանություն', 'feedback', 'reply', 'պատասխանել',
+    # Source attribution
+    'source:', 'աղբյուր:', 'منبع:', 'источник:', 'via:', 'from:',
+    # Armenian navigation terms
+    'կարդալ ավելին', 'շարունակել', 'կարդալ', 'դիտել',
+    'բոլոր նորությունները', 'այլ նորություններ', 'ամբողջական',
+    # Time/date fragments that are not content
+    'ժամ', 'րոպե', 'օր', 'ամիս', 'տարի', 'am', 'pm',
+    # Author and byline elements
+    'author:', 'հեղինակ:', 'by:', 'edited by:', 'խմբագիր:',
+    # Rating and voting
+    'rating', 'vote', 'գնահատել', 'քվեարկել',
+    # Tags and categories
+    'tags:', 'պիտակներ:', 'categories:', 'կատեգորիա:',
+    # Related articles
+    'related', 'հարակից', 'նմանատիպ', 'առնչվող',
+]
+
+COMMON_CLEAN = {
+    'min_length': 11,
+    'min_words': 3,
+    'skip_digits': True,
+    'prefixes': ['բաժին', 'մենյու', 'navigation', 'menu', 'home', 'գլխավոր', 'http://', 'https://',
+                 'click', 'կտտացնել', 'press', 'սեղմել', 'follow', 'subscribe', 'like', 'share'],
+    'suffixes': ['...', '→', '»', '›', 'more', 'ավելին'],
+}
+
+COMMON_TITLE_RULES = {
+    'prefixes': ['բաժին', 'մենյու', 'section', 'menu', 'home', 'գլխավոր'],
+    'suffixes': ['...', '→', '»', '›', 'more', 'ավելին'],
+}
+
+ARTICLE_TITLES = [
+    "h1.entry-title::text",
+    "h1.post-title::text",
+    "h1.article-title::text",
+    "h1.page-title::text",
+    ".entry-title::text",
+    ".post-title::text",
+    ".article-title::text",
+    ".page-title::text",
+    "article h1::text",
+    ".main-content h1::text",
+    ".content h1::text",
+    "h1::text",
+    "h2.entry-title::text",
+    "h2.post-title::text",
+    "h2::text",
+    "meta[property='og:title']::attr(content)",
+    "meta[name='title']::attr(content)",
+    "title::text",
+]
+
+# Navigation headings the pattern-based cleaners (iravaban, medianews, ...) refuse as titles
+NAV_TITLE_PATTERNS = [
+    r'^մենյու', r'^menu', r'^navigation', r'^nav', r'^բաժին', r'^section', r'^category', r'^կատեգորիա',
+    r'^գլխավոր', r'^home', r'^main', r'^սկիզբ', r'^search', r'^փնտրել', r'^որոնում', r'^login', r'^մուտք',
+    r'^գրանցում', r'^advertisement', r'^գովազդ', r'^contact', r'^կապ', r'^հետադարձ',
+]
+
+SHARE_TITLE_PATTERNS = [r'^share', r'^կիսվել', r'^follow', r'^հետևել']
+
+# Page chrome dropped by the pattern-based cleaners of medianews, noyantapan, slaq
+MEDIA_CONTENT_PATTERNS = [
+    # Social media and sharing
+    r'բաժանորդագր', r'subscribe', r'follow', r'հետևել', r'կիսվել', r'share', r'like', r'comment',
+    r'մեկնաբանություն', r'տպել', r'print', r'facebook', r'twitter', r'instagram', r'youtube',
+    r'telegram', r'whatsapp', r'linkedin', r'tiktok',
+    # Copyright
+    r'copyright', r'հեղինակային', r'բոլոր իրավունքները', r'all rights reserved', r'©',
+    # Navigation and UI
+    r'navigation', r'մենյու', r'menu', r'բաժին', r'կատեգորիա', r'category', r'tag', r'թագ',
+    r'read more', r'ավելին', r'continue', r'շարունակել', r'previous', r'next', r'նախորդ', r'հաջորդ',
+    r'back', r'forward', r'վերադառնալ',
+    # Ads and promotion
+    r'advertisement', r'գովազդ', r'sponsor', r'հովանավոր', r'անվճար', r'զեղչ', r'ակցիա',
+    # Contact, subscription, page chrome
+    r'contact', r'կապ', r'email', r'phone', r'հեռախոս', r'subscription', r'newsletter',
+    r'բաժանորդագրություն', r'footer', r'header', r'sidebar',
+    # Related content, comments, accounts
+    r'related', r'առնչվող', r'similar', r'նմանատիպ', r'see also', r'read also', r'տես նաև',
+    r'կարդա նաև', r'comments', r'feedback', r'հետադարձ', r'reply', r'պատասխան', r'login', r'մուտք',
+    r'register', r'գրանցվել',
+    # Search, filters, home
+    r'search', r'փնտրել', r'որոնում', r'filter', r'sort', r'տեսակավորել', r'ֆիլտր', r'home',
+    r'գլխավոր', r'սկիզբ', r'view all', r'տեսնել բոլորը', r'show more',
+    # Technical elements
+    r'loading', r'բեռնում', r'please wait', r'սպասել', r'error', r'սխալ', r'success',
+    r'հաջողություն',
+    # Links and URLs
+    r'http', r'www\.', r'\.com', r'\.am', r'\.org', r'url', r'link', r'հղում',
+    # Date and time standalone
+    r'^ամսաթիվ$', r'^date$', r'^time$', r'^ժամ$',
+    # Weather, media controls, pagination, legal terms
+    r'եղանակ', r'weather', r'temperature', r'ջերմություն', r'play', r'pause', r'stop', r'volume',
+    r'mute', r'նվագարկել', r'դադարեցնել', r'կանգնել', r'page', r'էջ', r'first', r'last',
+    r'առաջին', r'վերջին', r'terms', r'conditions', r'privacy', r'policy', r'պայմաններ',
+    r'գաղտնիություն', r'քաղաքականություն',
+]
+
+MEDIA_CLEAN = {
+    'min_length': 20,
+    'patterns': MEDIA_CONTENT_PATTERNS,
+    'max_special_ratio': 0.4,
+    'skip_upper': True,
+    'min_alnum_ratio': 0.6,
+    'max_punct_ratio': 0.5,
+}
+
+WIDE_DATES = [
+    'time::attr(datetime)',
+    'time::text',
+    '.date::text',
+    '.publish-date::text',
+    '.post-date::text',
+    '.entry-date::text',
+]
+
+# Page-wide paragraph fallback: sidebar, footer and share text (civic, euromedia, ...)
+PAGE_BOILERPLATE = [
+    'menu', 'navigation', 'sidebar', 'footer', 'copyright', 'social', 'follow', 'subscribe',
+    'newsletter', 'share', 'facebook', 'twitter', 'instagram', 'telegram', 'youtube', 'contact',
+    'terms', 'privacy', 'cookie', 'advertisement', 'sponsored', 'related', 'see also', 'read more',
+    'bookmark', 'print', 'source:', 'photo:', 'image:', 'video:', 'կապ', 'հետևել', 'բաժանորդագրում',
+    'բաժանել', 'տեղեկատվական', 'գովազդ', 'այլ լուրեր', 'նոր նյութեր', 'հետևյալ', 'ետևյալ',
+]
+
+BULLETS = ['•', '→', '►', '»', '›', '◆']
+
+# Request headers of the sites that ask for Armenian pages with a newer Chrome
+CHROME_120 = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+CHROME_121 = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+CHROME_91 = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# No Accept-Encoding here: CompressionStatsMiddleware offers exactly what this install can decode
+BROWSER_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'hy-AM,hy;q=0.9,en-US;q=0.8,en;q=0.7,ru;q=0.6',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+}
+
+# What Chrome 121 itself sends (armtimes, iravaban, ...)
+CHROME_HEADERS = dict(
+    BROWSER_HEADERS,
+    Accept='text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    **{'Accept-Language': 'en-US,en;q=0.9,hy;q=0.8'},
+)
+
+ARMENIAN_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'hy-AM,hy;q=0.9,en;q=0.8',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+SITES = {}
+
+SITES['news168'] = {
+    'class_name': 'News168Spider',
+    'label': '168.AM',
+    'allowed_domains': ['168.am'],
+    'start_urls': ['https://168.am'],
+    'cache_prefix': 'processed_168:',
+    'listing': {
+        'articles': ['article', '.post', '.news-item', '.article',
+                     'div[class*="news"]', 'div[class*="post"]', 'div[class*="article"]'],
+        'link': ['a::attr(href)', 'h2 a::attr(href)', 'h3 a::attr(href)'],
+        'title': ['a::text', 'h2::text', 'h3::text'],
+        'require_title': False,
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', 'title::text'],
+        'content': ['.entry-content ::text', '.post-content ::text', '.content ::text',
+                    'article ::text', 'p::text'],
+        'date': ['time::text', '.date::text'],
+    },
+}
+
+SITES['1in'] = {
+    'class_name': 'OneInSpider',
+    'label': '1IN.AM',
+    'allowed_domains': ['1in.am'],
+    'start_urls': [
+        'https://www.1in.am/',
+        'https://www.1in.am/newsfeed',
+        'https://www.1in.am/section/newsfeed/armenia',
+        'https://www.1in.am/section/newsfeed/armenia/politics',
+        'https://www.1in.am/section/newsfeed/armenia/foreignpolicy',
+        'https://www.1in.am/section/newsfeed/armenia/economy',
+        'https://www.1in.am/section/newsfeed/armenia/society',
+        'https://www.1in.am/section/newsfeed/region',
+        'https://www.1in.am/section/newsfeed/world',
+        'https://www.1in.am/section/newsfeed/business',
+        'https://www.1in.am/section/newsfeed/sport',
+    ],
+    'settings': {
+        'USER_AGENT': CHROME_120,
+        'DEFAULT_REQUEST_HEADERS': BROWSER_HEADERS,
+        'DOWNLOAD_DELAY': 1,
+        'RANDOMIZE_DOWNLOAD_DELAY': True,
+    },
+    'listing': {
+        'articles': ['div.newsfeed-item', 'div.post-item', 'article', 'div.item', "div[id*='post-']"],
+        'link': ["a[href*='.html']::attr(href)", 'a::attr(href)', 'div.item_title a::attr(href)',
+                 'h3 a::attr(href)', 'h2 a::attr(href)'],
+        'title': ['div.item_title::text', 'a div.item_title::text', 'h3::text', 'h2::text', '.title::text'],
+        # Only actual article URLs
+        'link_rules': {'requires': ['.html', '/3']},
+        'meta': {'article_date': 'div.item_date::text'},
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1::text', '.post-title::text', '.article-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', 'div.post-content ::text', 'div.article-content ::text',
+                    'div.content ::text', 'article ::text', '.main-content ::text', 'div.text ::text',
+                    'p::text'],
+        'date_meta': 'article_date',
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text',
+                 '.item_date::text', '.post-date::text'],
+    },
+}
+
+SITES['24news'] = {
+    'class_name': 'TwentyFourNewsSpider',
+    'label': '24NEWS.AM',
+    'allowed_domains': ['24news.am'],
+    'start_urls': ['https://24news.am/'],
+    'listing': {
+        # "Լրահոս" and "Ամենաշատ դիտվածները" sidebars
+        'articles': ['ul.sidebar-list.latest-list li', 'ul.sidebar-list.most-viewed li'],
+        'combine': True,
+        # The newsfeed link is not an article
+        'exclude': "a[href*='lrahos']",
+        'link': 'p a::attr(href)',
+        'title': 'p a::text',
+        'meta': {'list_time': 'span.ll-time::text', 'category': 'a.ll-category::text'},
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1::text', '.post-title::text', '.article-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content p::text', '.post-content p::text', '.article-content p::text',
+                    '.content p::text', 'article p::text', '.main-content p::text',
+                    'div.entry-content ::text', 'p::text'],
+        'date': WIDE_DATES,
+        'date_meta': 'list_time',
+    },
+}
+
+SITES['5tv'] = {
+    'class_name': 'FiveTvSpider',
+    'label': '5TV.AM',
+    'allowed_domains': ['5tv.am', 'news.5tv.am'],
+    'start_urls': ['https://news.5tv.am/'],
+    'listing': {
+        'articles': 'ul.feed_list li div.block_feed',
+        'limit': 15,
+        'link': 'a.info_block::attr(href)',
+        'title': 'a.info_block span.news_title::text',
+        'meta': {'category': 'div.category_block::text'},
+    },
+    'article': {
+        'title': ['h1.article-title::text', 'h1.post-title::text', 'h1.entry-title::text',
+                  'h1.news-title::text', 'h1.title::text', 'h1::text', '.article-title::text',
+                  '.post-title::text', '.entry-title::text', '.news-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'5TV\.AM', r'5TV'],
+        'container': ['article', '.article-content', '.post-content'],
+        'container_content': ['p::text', 'div::text'],
+        'min_parts': 2,
+        'content': ['article p::text', '.article-content p::text', '.post-content p::text',
+                    '.entry-content p::text', '.content p::text', '.main-content p::text',
+                    '.news-content p::text', '.article-body p::text', '.post-body p::text',
+                    '.text p::text', '.description p::text', 'p::text'],
+        'clean': {
+            'min_length': 10,
+            'short_digits': 20,
+            'contains_case': [
+                # Navigation and UI elements
+                "Լրահոս", "Տնտեսական", "Հասարակական", "Քաղաքական", "Իրավական",
+                "Տարածաշրջան", "Միջազգային", "Մշակույթ", "Հայաստան", "Սպորտ",
+                "Կարդացեք նաև", "Կարդալ ավելին", "Ավելին", "Կարդալ",
+                "news.5tv.am", "5tv.am", "5TV", "5tv", "5 TV",
+                # Time stamps
+                "21:00", "20:29", "20:10", "19:00", "18:30", "18:09", "16:34", "16:19",
+                "15:41", "15:00", "14:30", "14:01", "13:49", "13:30", "13:11", "12:49",
+                "12:34", "11:51", "11:30", "11:23", "10:58", "10:29", "10:00", "00:01",
+                "23:58", "23:45", "23:30", "23:15", "23:00", "22:45", "22:30", "22:15",
+                "22:00", "21:45", "21:30",
+                # Date formats
+                ".07.25", ".07.2025", "/07/25", "/07/2025",
+                # Social media and sharing
+                "share", "facebook", "twitter", "instagram", "telegram", "youtube",
+                "Կիսվել", "Տարածել", "Հղում",
+                # Footer and copyright
+                "© 2025", "© 2024", "Copyright", "Բոլոր իրավունքները", "Հեղինակային իրավունք",
+                # Advertisement and promo
+                "Գովազդ", "Ռեկլամ", "Promo", "Sponsored", "Մասնագետի կարծիք",
+                # Navigation bullets and arrows
+                "►", "▼", "▲", "◄", "→", "←", "↑", "↓", "•", "·", "‣", "⚫", "⚪",
+                # Comments and interaction
+                "Մեկնաբանություններ", "Գրել մեկնաբանություն", "Հավանել", "Չհավանել",
+                "Գնահատել", "Պատասխանել", "Մեկնաբանել",
+                # Page structure
+                "Գլխավոր", "Տնային", "Անցնել բովանդակությանը", "Մենյու", "Փնտրում",
+                "Ցանկ", "Թեմներ", "Բաժիններ", "Ավտոր", "Հեղինակ",
+                # News feed indicators
+                "Վերջին նորություններ", "Այլ նորություններ", "Համանման նորություններ",
+                "Առաջարկվող", "Պատկեր", "Ֆոտո", "Տեսանյութ", "Վիդեո",
+                # View counts that appear in articles
+                "47", "4 475", "146", "27",
+                # End of article indicators
+                "Նմանատիպ նյութեր", "Գիտեք նաև", "Կարծիք",
+                "Անդրադարձ", "Մեկնաբանություն", "Գրանցվել", "Մուտք",
+                # Technical elements
+                "JavaScript", "CSS", "HTML", "404", "Error", "Page not found",
+            ],
+            'end_markers': ["Կարդացեք նաև", "Կարդալ ավելին", "Նմանատիպ նյութեր",
+                            "Գիտեք նաև", "Մեկնաբանություններ", "Գրանցվել", "Մուտք"],
+        },
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.news_date .date_block::text',
+                 '.news_date .hour_block::text', '.publish-date::text', '.post-date::text',
+                 '.entry-date::text'],
+        'keyword_meta': 'category',
+    },
+}
+
+SITES['7or'] = {
+    'class_name': 'SevenOrSpider',
+    'label': '7OR.AM',
+    'allowed_domains': ['7or.am'],
+    'start_urls': ['https://www.7or.am/'],
+    'listing': {
+        'articles': 'div.newsBlock',
+        'link': 'div.newsBlockTitle h2 a::attr(href)',
+        'title': 'div.newsBlockTitle h2 a::text',
+    },
+    'article': {
+        'title': ['article h1::text', '.entry-title::text', '.post-title::text', 'h1.article-title::text',
+                  'h1.title::text', "meta[property='og:title']::attr(content)"],
+        'content': ['article .entry-content p::text', 'article .post-content p::text',
+                    '.entry-content p::text', '.post-content p::text', 'article .content p::text',
+                    '.article-content p::text', 'main article p::text', '.article-body p::text',
+                    'article .entry-content ::text', 'article .post-content ::text',
+                    '.entry-content ::text', '.post-content ::text', 'main article ::text'],
+        'clean': {
+            'min_length': 6,
+            'prefixes': ['•', '→', '►', 'կարդալ', 'share', 'comment', 'բաց', 'menu', 'search',
+                         'տեղեկատվական', 'գովազդ'],
+            'contains': SOCIAL + ['linkedin', 'tiktok', 'viber', 'messenger', 'copyright', '©', 'terms', 'privacy', 'cookie'],
+        },
+        'date': ['article time::attr(datetime)', 'article .date::text', '.post-date::text',
+                 '.entry-date::text', 'p.newsBlockDate::text', 'time::text'],
+    },
+}
+
+SITES['alphanews'] = {
+    'class_name': 'AlphanewsSpider',
+    'label': 'ALPHANEWS.AM',
+    'allowed_domains': ['alphanews.am'],
+    'start_urls': [
+        'https://alphanews.am/',
+        'https://alphanews.am/lrahos/',
+        'https://alphanews.am/category/politics/',
+        'https://alphanews.am/category/economics/',
+        'https://alphanews.am/category/culture/',
+    ],
+    'settings': {
+        'USER_AGENT': CHROME_120,
+        'DEFAULT_REQUEST_HEADERS': dict(BROWSER_HEADERS, DNT='1'),
+        'DOWNLOAD_DELAY': 1,
+        'RANDOMIZE_DOWNLOAD_DELAY': True,
+    },
+    'listing': {
+        'articles': ['article.aside__article', 'article', '.post', '.news-item'],
+        'link': 'a::attr(href)',
+        'title': ['h3.h4::text', 'h3::text', 'h2::text', '.title::text', 'figcaption h3::text'],
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text',
+                  'h1.h1::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content p::text', '.post-content p::text', '.article-content p::text',
+                    '.content p::text', 'article p::text', '.main-content p::text',
+                    '.single-content p::text', 'p::text'],
+        'clean': {
+            'min_length': 21,
+            'contains': [
+                "կարդալ ավելին", "կարդալ ավելի", "ավելին", "կարդալ", "share", "like", "follow",
+                "subscribe", "կիսվել", "հավանել", "տեսնել ավելին", "բաժանորդագրվել",
+                "facebook", "twitter", "instagram", "կապ", "contact", "մեկնաբանություն",
+                "comment", "tag", "պիտակ", "category", "կատեգորիա", "author", "հեղինակ",
+                "date", "ամսաթիվ", "մարտ", "ապրիլ", "մայիս", "հունիս", "հուլիս", "օգոստոս",
+                "սեպտեմբեր", "հոկտեմբեր", "նոյեմբեր", "դեկտեմբեր", "փետրվար", "հունվար",
+                "copyright", "© ", "all rights reserved", "բոլոր իրավունքները",
+                "advertisement", "գովազդ", "դասակարգիչ", "որպես", "Click here", "Մանրամասն",
+                "Ավելի տեղեկություն", "Տեղեկություն", "Կարծիք", "Գրել", "Այլ",
+                "Alphanews.am", "alphanews", "related", "հարակից", "կարգահանել", "պարազիտ",
+                "keywords", "բանալի բառեր", "navigation", "նավիգացիա", "menu", "մենյու",
+                "search", "որոնում", "footer", "ներքև", "header", "վերև",
+            ],
+        },
+        'min_content_length': 51,
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text',
+                 '.post-date::text', 'p.date::text'],
+    },
+}
+
+SITES['ankakh'] = {
+    'class_name': 'AnkakhSpider',
+    'label': 'ANKAKH.COM',
+    'allowed_domains': ['ankakh.com'],
+    'start_urls': ['http://ankakh.com/'],
+    'listing': {
+        'articles': 'div.newsline div.article a',
+        'limit': 15,
+        'link': '::attr(href)',
+        'title': '::text',
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1.post-title::text', 'h1.article-title::text',
+                  'h1.news-title::text', 'h1.title::text', 'h1::text', '.entry-title::text',
+                  '.post-title::text', '.article-title::text', '.news-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'ankakh\.com', r'Ankakh'],
+        'container': ['article', '.entry-content', '.post-content'],
+        'container_content': ['p::text', 'div::text'],
+        'min_parts': 2,
+        'content': ['article p::text', '.entry-content p::text', '.post-content p::text',
+                    '.article-content p::text', '.content p::text', '.main-content p::text',
+                    '.news-content p::text', '.article-body p::text', '.post-body p::text',
+                    '.text p::text', '.article_text p::text', '.description p::text', 'p::text'],
+        'clean': {
+            'min_length': 15,
+            'short_digits': 30,
+            'contains_case': [
+                # Navigation and UI elements
+                "Հարցազրույցներ", "Նորություններ", "Գլխավոր", "Տնային", "Մենյու", "Փնտրում",
+                "Այլ նորություններ", "Հետաքրքիր", "Կարևոր", "Անցյալ", "Ցանկ", "Բաժիններ",
+                "Կատեգորիաներ", "Թեմներ", "Ավտոր", "Հեղինակ", "Լրագրող",
+                # ankakh.com specific
+                "ankakh.com", "Անկախ", "ANKAKH", "ankakh", "Ankakh",
+                # Date and time stamps
+                "13.07.25", "12.07.25", "11.07.25", "10.07.25", "09.07.25",
+                "2025", "2024", "2023", "ժամ", "րոպե", "վայրկյան",
+                # Social media and sharing
+                "Կիսվել", "Տարածել", "Հղում", "Լայք",
+                "Facebook", "Twitter", "Instagram", "Telegram", "Youtube",
+                "share", "facebook", "twitter", "instagram", "telegram", "youtube",
+                # Footer and copyright
+                "© 2025", "© 2024", "Copyright", "Բոլոր իրավունքները", "Հեղինակային իրավունք",
+                "Պաշտպանված է", "Վերապրոդուկցիա",
+                # Navigation bullets and arrows
+                "►", "▼", "▲", "◄", "→", "←", "↑", "↓", "•", "·", "‣", "⚫", "⚪",
+                # Comments and interaction
+                "Մեկնաբանություններ", "Գրել մեկնաբանություն", "Կարծիք", "Մեկնաբանել",
+                "Հավանել", "Չհավանել", "Գնահատել", "Պատասխանել", "Գրանցվել", "Մուտք",
+                # Advertisement and promo
+                "Գովազդ", "Ռեկլամ", "Promo", "Sponsored", "Մասնագետի կարծիք",
+                "Ծանուցում", "Գովազդային", "Ռեկլամային",
+                # Page structure and navigation
+                "Անցնել բովանդակությանը", "Փակել", "Բացել", "Ցույց տալ",
+                "Կարդալ ավելին", "Կարդալ", "Ավելին", "Դիտել", "Տեսնել", "Կարդացեք նաև",
+                # News feed indicators
+                "Վերջին նորություններ", "Համանման նորություններ", "Առաջարկվող",
+                "Այլ կարծիքներ", "Նմանատիպ նյութեր", "Գիտեք նաև",
+                # Technical elements
+                "JavaScript", "CSS", "HTML", "404", "Error", "Page not found",
+                "Loading", "Բեռնում", "Սպասեք", "Ներբեռնում",
+                # End of article indicators
+                "Անդրադարձ", "Մեկնաբանություն", "Այլ նյութեր", "Հետաքրքիր կարող է լինել",
+            ],
+            'end_markers': ["Կարդալ ավելին", "Կարդացեք նաև", "Նմանատիպ նյութեր",
+                            "Գիտեք նաև", "Մեկնաբանություններ", "Գրանցվել", "Մուտք"],
+        },
+        'date': WIDE_DATES,
+    },
+}
+
+SITES['antifake'] = {
+    'class_name': 'AntiFakeSpider',
+    'label': 'ANTIFAKE.AM',
+    'allowed_domains': ['antifake.am'],
+    'start_urls': ['https://antifake.am/'],
+    'listing': {
+        'articles': 'section#latest-news div#latest-news-container article.item',
+        'link': 'div.info h4.title.usmall a::attr(href)',
+        'title': 'div.info h4.title.usmall a::text',
+        # Shorter titles are not real article titles
+        'title_rules': {'min_length': 10},
+    },
+    'article': {
+        'title': ['article h1::text', '.post-title::text', '.entry-title::text', 'h1.title::text',
+                  "meta[property='og:title']::attr(content)"],
+        'content': ['article .post-content p::text', 'article .entry-content p::text',
+                    '.post-content p::text', '.entry-content p::text', 'article .content p::text',
+                    '.article-content p::text', 'main article p::text', '.post-body p::text',
+                    'article .post-content ::text', 'article .entry-content ::text',
+                    '.post-content ::text', '.entry-content ::text', 'main article ::text'],
+        'clean': {
+            'min_length': 6,
+            'prefixes': ['•', '→', 'կարդալ', 'share', 'comment', 'բաց', 'menu', 'search'],
+            'contains': ['facebook', 'twitter', 'instagram', 'telegram', 'copyright', '©'],
+        },
+        'date': ['article time::attr(datetime)', 'article .date::text', '.post-date::text',
+                 '.entry-date::text', 'time::text'],
+    },
+}
+
+SITES['araratnews'] = {
+    'class_name': 'AraratnewsSpider',
+    'label': 'ARARATNEWS.AM',
+    'allowed_domains': ['araratnews.am'],
+    'start_urls': ['https://araratnews.am/'],
+    'listing': {
+        'articles': 'div.postsDiv a.categoriePostItem',
+        'link': '::attr(href)',
+        'title': 'div.postInfoText::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text',
+                  '.title::text', '.news-title::text', "meta[property='og:title']::attr(content)",
+                  'title::text'],
+        'content': ['article ::text', '.article-content ::text', '.entry-content ::text',
+                    '.post-content ::text', '.content ::text', '.main-content ::text',
+                    '.news-content ::text', '.text ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text',
+                 '.post-date::text', '.timestamp::text', '.postInfoTime::text'],
+    },
+}
+
+SITES['aravot'] = {
+    'module': 'news_scraper.spiders.aravot',
+    'class_name': 'AravotSpider',
+    'label': 'ARAVOT.AM',
+    'allowed_domains': ['aravot.am'],
+    'start_urls': ['https://www.aravot.am/', 'https://www.aravot.am/newsfeed/'],
+    'listing': {
+        'articles': ['div.newsfeed-block-wrapper div.card', 'div.card.mb-3', 'div.card'],
+        'link': ['a.btn-link.text-reset.stretched-link::attr(href)', 'h6 a::attr(href)',
+                 "a[href*='/2025/']::attr(href)", "a[href*='/2024/']::attr(href)"],
+        'title': ['a.btn-link.text-reset.stretched-link::text', 'h6 a::text', 'a::attr(title)'],
+        'meta': {'list_time': 'li.nav-item::text'},
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1::text', '.post-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r' [-|] Առավոտ'],
+        'content': ['div.entry-content p::text', 'div.post-content p::text', 'div.article-content p::text',
+                    'div.content p::text', '.entry-content ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.entry-date::text', '.post-date::text', '.date::text'],
+        'date_meta': 'list_time',
+    },
+}
+
+SITES['armenia24'] = {
+    'class_name': 'Armenia24Spider',
+    'label': 'ARMENIA24.LIVE',
+    'allowed_domains': ['armenia24.live'],
+    'start_urls': ['https://armenia24.live/?l=am'],
+    'listing': {
+        'articles': 'div.timeline a',
+        'link': '::attr(href)',
+        'title': 'span::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text',
+                  '.title::text', '.news-title::text', "meta[property='og:title']::attr(content)",
+                  'title::text'],
+        'content': ['article ::text', '.article-content ::text', '.entry-content ::text',
+                    '.post-content ::text', '.content ::text', '.main-content ::text',
+                    '.news-content ::text', '.text ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text',
+                 '.post-date::text', '.timestamp::text', '.timeago::attr(datetime)'],
+    },
+}
+
+SITES['armeniatoday'] = {
+    'class_name': 'ArmeniatodaySpider',
+    'label': 'ARMENIATODAY.AM',
+    'allowed_domains': ['armeniatoday.am'],
+    'start_urls': ['https://armeniatoday.am/hy/', 'https://armeniatoday.am/'],
+    'listing': {
+        'articles': ['article.jeg_post, .jeg_post, .post-item, .post, article',
+                     'div.jeg_post, .entry-header, .post-header',
+                     'div[data-id], .content-block, .news-item'],
+        'link': ['h3 a::attr(href)', 'h2 a::attr(href)', 'h1 a::attr(href)', 'a.entry-title-link::attr(href)',
+                 '.entry-title a::attr(href)', 'a::attr(href)'],
+        'title': ['h3 a::text', 'h2 a::text', 'h1 a::text', '.entry-title a::text', '.post-title::text', 'a::text'],
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1::text', '.post-title::text', '.article-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text',
+                    '.content ::text', 'article .entry-content ::text', '.main-content ::text',
+                    'div.wpb_wrapper ::text', 'p::text'],
+        'date': WIDE_DATES,
+    },
+}
+
+SITES['arminfo'] = {
+    'class_name': 'ArminfoSpider',
+    'label': 'ARMINFO.INFO',
+    'allowed_domains': ['arminfo.info'],
+    'start_urls': ['https://arminfo.info/index.php?lang=1'],
+    'listing': {
+        # Article links sit in table cells all over the page
+        'articles': "a[href*='full_news']",
+        'limit_after_filter': True,
+        'link': '::attr(href)',
+        'title': '::text',
+        # The picture caption in the same cell often names people the title does not
+        'meta': {'img_alt': ['./ancestor::td[1]//img/@alt', '::text']},
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.news-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.article-content p::text', 'div.news-content p::text', 'div.content p::text',
+                    '.entry-content p::text', '.post-content p::text', 'div.article-content ::text',
+                    'div.news-content ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text',
+                 '.post-date::text', '.news-date::text'],
+        'keyword_meta': 'img_alt',
+    },
+}
+
+SITES['armlife'] = {
+    'class_name': 'ArmLifeSpider',
+    'label': 'ARMLIFE.AM',
+    'allowed_domains': ['armlife.am'],
+    'start_urls': ['https://armlife.am/'],
+    'listing': {
+        'articles': 'article.elementor-post.elementor-grid-item',
+        'link': 'p.elementor-post__title a::attr(href)',
+        'title': 'p.elementor-post__title a::text',
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1.elementor-heading-title::text', 'h1::text',
+                  "meta[property='og:title']::attr(content)"],
+        'content': ['div.elementor-widget-theme-post-content ::text', 'div.entry-content p::text',
+                    'div.post-content p::text', 'div.single-post-content p::text',
+                    'article div.content p::text', 'p::text'],
+        # Page-wide paragraphs: drop sidebar / footer text
+        'fallback_clean': {
+            'min_length': 11,
+            'contains': ['menu', 'navigate', 'sidebar', 'footer', 'copyright', 'social', 'follow',
+                         'share', 'subscribe', 'newsletter', 'կապ', 'հետևել', 'բաժանորդագրում', 'բաժանել'],
+        },
+        'date': [],
+    },
+}
+
+SITES['armlur'] = {
+    'class_name': 'ArmlurSpider',
+    'label': 'ARMLUR.AM',
+    'allowed_domains': ['armlur.am'],
+    'start_urls': ['https://armlur.am/'],
+    'listing': {
+        'articles': ['li.armlur-custom-posts-item', 'article', 'div.post-item'],
+        'link': ['div.armlur-custom-posts-small-title a::attr(href)', 'a::attr(href)'],
+        'title': ['div.armlur-custom-posts-small-title a::text', 'a::attr(title)', 'a::text'],
+    },
+    'article': {
+        'title': ['h1::text', 'h1.entry-title::text', '.post-title::text', '.entry-title::text',
+                  '.article-title::text', 'h1.title::text', "meta[property='og:title']::attr(content)",
+                  'title::text'],
+        'content': ['div.entry-content ::text', 'div.post-content ::text', '.article-content ::text',
+                    '.content ::text', 'article ::text', '.main-content ::text', 'div.post-body ::text',
+                    '.armlur-single-content ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.entry-meta-date::text', '.date::text',
+                 '.publish-date::text', '.post-date::text', '.meta-date::text', '.updated::text'],
+    },
+}
+
+SITES['armradio'] = {
+    'class_name': 'ArmradioSpider',
+    'label': 'HY.ARMRADIO.AM',
+    'allowed_domains': ['hy.armradio.am'],
+    'start_urls': ['https://hy.armradio.am/'],
+    'listing': {
+        'articles': 'ul.posts-list-items.widget-posts-wrapper li.widget-single-post-item',
+        'limit': 15,
+        'link': 'a.post-title.the-subtitle::attr(href)',
+        'title': 'a.post-title.the-subtitle::text',
+        'meta': {'date_text': 'span.date.meta-item.tie-icon::text'},
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text',
+                  '.the-title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text',
+                    '.content ::text', 'article ::text', '.the-content ::text', '.main-content ::text',
+                    '.news-content ::text', '.text ::text', '.post-body ::text', 'p::text'],
+        'date': WIDE_DATES,
+        'date_meta': 'date_text',
+    },
+}
+
+SITES['armsport'] = {
+    'class_name': 'ArmsportSpider',
+    'label': 'ARMSPORT.AM',
+    'allowed_domains': ['armsport.am'],
+    'start_urls': ['https://armsport.am/', 'https://armsport.am/lrahos/'],
+    'listing': {
+        # Sidebar news first, then the main column; the same post can be in both
+        'articles': ['div#sidebar-news-main article.jeg_post', 'article.jeg_post'],
+        'combine': True,
+        'limit_after_filter': True,
+        'link': 'h3.jeg_post_title a::attr(href)',
+        'title': 'h3.jeg_post_title a::text',
+        'meta': {'list_time': 'div.jeg_meta_date a::text'},
+    },
+    'article': {
+        'title': ['h1.jeg_post_title::text', 'h1::text', '.entry-header h1::text', '.post-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.content-inner p::text', 'div.jeg_content p::text', '.entry-content p::text',
+                    '.post-content p::text', '.article-content p::text', 'div.content-inner ::text',
+                    'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.jeg_meta_date::text', '.date::text',
+                 '.publish-date::text', '.post-date::text'],
+        'date_meta': 'list_time',
+    },
+}
+
+SITES['armtimes'] = {
+    'class_name': 'ArmTimesSpider',
+    'label': 'ARMTIMES.COM',
+    'allowed_domains': ['armtimes.com'],
+    'start_urls': ['https://armtimes.com/hy'],
+    'settings': {
+        'USER_AGENT': CHROME_121,
+        'DEFAULT_REQUEST_HEADERS': CHROME_HEADERS,
+    },
+    'listing': {
+        'articles': 'div.col.s12.lastnews div.item',
+        'link': ['a.black-text.clamp-hidden-4::attr(href)', 'a::attr(href)'],
+        'title': ['a.black-text.clamp-hidden-4 p.marg-bot-0.clamp-hidden-4.marg-top-0::text', 'p::text'],
+        'title_rules': {'min_length': 10},
+    },
+    'article': {
+        'title': ['article h1::text', '.article-title::text', '.post-title::text', '.entry-title::text',
+                  'h1.main-title::text', 'h1.title::text', "meta[property='og:title']::attr(content)"],
+        'content': ['article .article-content p::text', 'article .post-content p::text',
+                    'article .entry-content p::text', '.article-content p::text', '.post-content p::text',
+                    '.entry-content p::text', 'article .content p::text', 'main article p::text',
+                    '.article-body p::text', 'article .article-content ::text',
+                    'article .post-content ::text', 'article .entry-content ::text',
+                    '.article-content ::text', '.post-content ::text', '.entry-content ::text',
+                    'main article ::text'],
+        'clean': {
+            'min_length': 6,
+            'prefixes': ['•', '→', '►', '»', 'կարդալ', 'share', 'comment', 'բաց', 'menu', 'search',
+                         'տեղեկատվական', 'գովազդ', 'advertising', 'advertisement', 'sponsored',
+                         'related', 'see also', 'read also'],
+            'contains': SOCIAL + ['linkedin', 'tiktok', 'copyright', '©', 'terms', 'privacy', 'cookie',
+                                  'subscribe', 'newsletter'],
+        },
+        'date': ['article time::attr(datetime)', 'article .date::text', 'article span.datetext::text',
+                 '.post-date::text', '.entry-date::text', '.article-date::text', 'span.datetext::text',
+                 'time::text'],
+    },
+}
+
+SITES['asekose'] = {
+    'class_name': 'AsekoseSpider',
+    'label': 'ASEKOSE.AM',
+    'allowed_domains': ['asekose.am'],
+    'start_urls': ['http://asekose.am/am/'],
+    'listing': {
+        'articles': 'aside#latest-news ul.list-group li.list-group-item',
+    },
+    'article': {
+        'title': ['h1.page-header::text', 'h1::text', "meta[property='og:title']::attr(content)"],
+        'content': ['div.row div.col-md-8 p::text', 'div.container div.row div.col-md-8 div p::text',
+                    'main p::text', 'div.main-content p::text', 'p::text'],
+        # Page-wide paragraphs: drop inline code, footer and contact text
+        'fallback_clean': {
+            'min_length': 16,
+            'prefixes': ['<', '/'],
+            'contains': ['<?', '</', 'function', 'var ', 'document.', 'window.', 'copyright', 'footer',
+                         'menu', 'navigation', 'sidebar', 'social', 'follow', 'subscribe', 'newsletter',
+                         'share', 'կապ', 'հետևել', 'բաժանորդագրում', 'բաժանել', 'email', '@',
+                         'http://', 'https://'],
+        },
+        'date': [],
+    },
+}
+
+SITES['auroranews'] = {
+    'class_name': 'AuroraNewsSpider',
+    'label': 'AURORANEWS.AM',
+    'allowed_domains': ['auroranews.am'],
+    'start_urls': ['https://auroranews.am/'],
+    'cache_key': 'url',
+    'listing': {
+        # No article cards on the page: collect article links by section path
+        'articles': ["article a[href*='/']", "a[href*='/news/']", "a[href*='/politics/']",
+                     "a[href*='/society/']", "a[href*='/world/']", "a[href*='/sport/']",
+                     "a[href*='/economy/']", "a[href*='/culture/']", "a[href*='/health/']",
+                     "a[href*='/tech/']", "a[href*='/2024/']", "a[href*='/2025/']"],
+        'limit_after_filter': True,
+        'link': '::attr(href)',
+        'title': [],
+        'require_title': False,
+        'link_rules': {'contains': ['javascript:', 'mailto:', '#', 'facebook.com', 'twitter.com',
+                                    'instagram.com', 'telegram.me', 'youtube.com']},
+        'same_site': True,
+    },
+    'article': {
+        'title': ['article h1::text', 'h1.article-title::text', 'h1::text',
+                  "meta[property='og:title']::attr(content)"],
+        'content': ['article .article-content p::text', 'article .post-content p::text',
+                    'article .entry-content p::text', 'main article p::text', '.article-content p::text',
+                    '.post-content p::text', 'p::text'],
+        # Page-wide paragraphs: strict, to keep news lists and navigation out
+        'fallback_clean': {
+            'min_length': 21,
+            'prefixes': BULLETS,
+            'contains': ['կարդալ ավելին', 'read more', 'share', 'comment', 'menu', 'search', 'follow',
+                         'subscribe', 'newsletter', 'social', 'facebook', 'twitter', 'instagram',
+                         'telegram', 'youtube', 'copyright', '©', 'terms', 'privacy', 'cookie',
+                         'source:', 'photo:', 'image:', 'advertisement', 'sponsored', 'related',
+                         'see also', 'read also', 'contact', 'այլ լուրեր', 'նոր նյութեր', 'հետևյալ',
+                         'ետևյալ', 'կապ', 'հետևել', 'բաժանորդագրում', 'բաժանել', 'գովազդ',
+                         'տեղեկատվական', 'bookmark', 'print'],
+        },
+        'date': [],
+    },
+}
+
+SITES['blognews'] = {
+    'class_name': 'BlognewsSpider',
+    'label': 'BLOGNEWS.AM',
+    'allowed_domains': ['blognews.am'],
+    'start_urls': ['https://blognews.am/arm/'],
+    'listing': {
+        'articles': 'div.news-item.small',
+        'link': 'div.item-content a::attr(href)',
+        'title': 'div.item-content a p::text',
+    },
+    'article': {
+        'title': ['article h1::text', '.article-title::text', '.entry-title::text', 'h1.post-title::text',
+                  'h1.title::text', 'h1.news-title::text', 'h1::text',
+                  "meta[property='og:title']::attr(content)"],
+        'content': ['article .entry-content p::text', 'article .post-content p::text',
+                    'article .article-content p::text', '.entry-content p::text', '.post-content p::text',
+                    '.article-content p::text', 'article .content p::text', 'main article p::text',
+                    '.main-content p::text', '.article-body p::text', 'article .entry-content ::text',
+                    'article .post-content ::text', 'article .article-content ::text',
+                    '.entry-content ::text', '.post-content ::text', '.article-content ::text',
+                    'main article ::text'],
+        'clean': {
+            'min_length': 6,
+            'prefixes': ['•', '→', '►', '»', '›', '◆', 'կարդալ', 'share', 'comment', 'բաց', 'menu',
+                         'search', 'տեղեկատվական', 'գովազդ', 'advertising', 'advertisement',
+                         'sponsored', 'related', 'see also', 'read also', 'contact', 'follow',
+                         'ետևյալ', 'հետևյալ', 'նոր նյութեր', 'այլ լուրեր', 'bookmark', 'print',
+                         'navigation', 'բաժիններ', 'կատեգորիաներ', 'tags', 'թեգեր', 'home',
+                         'գլխավոր', 'back to', 'վերադարձ'],
+            'contains': SOCIAL + ['linkedin', 'tiktok', 'viber', 'messenger', 'copyright', '©', 'terms',
+                                  'privacy', 'cookie', 'subscribe', 'newsletter', 'source:', 'photo:',
+                                  'image:'],
+        },
+        'date': ['article time::attr(datetime)', 'article .date::text', '.post-date::text',
+                 '.entry-date::text', '.article-date::text', '.publish-date::text', '.timestamp::text',
+                 'time::text'],
+    },
+}
+
+SITES['civic'] = {
+    'class_name': 'CivicSpider',
+    'label': 'CIVIC.AM',
+    'allowed_domains': ['civic.am'],
+    'start_urls': ['https://civic.am/'],
+    'listing': {
+        # Cards are the links themselves (card_lg and card_xs)
+        'articles': 'a.card',
+        'link': '::attr(href)',
+        'title': ['div.card__title::text', '.title-xl::text', '.title-xs::text'],
+    },
+    'article': {
+        'title': ['h1.article__title::text', 'h1.title-lg::text', 'h1::text', '.article__title::text',
+                  '.title-lg::text', '.page-title::text', '.post-title::text', '.entry-title::text',
+                  '.content-title::text', '.main-title::text', 'title::text',
+                  "meta[property='og:title']::attr(content)", "meta[name='title']::attr(content)",
+                  'h2::text', 'h3::text', '.content h1::text', '.content h2::text', 'article h1::text',
+                  'main h1::text', '.card__title::text', '.title::text', 'p:first-of-type::text'],
+        'title_split': [' | ', ' - '],
+        'title_strip': [r'Civic\.am'],
+        'title_rules': {
+            'min_length': 11,
+            'prefixes': ['civic'],
+            'contains': ['menu', 'search', 'բաժանորդագր', 'subscribe', 'follow', 'հետևել', 'կապ',
+                         'contact', 'share', 'բաժանել', 'newsletter', 'մեզ նաև'],
+        },
+        'content': ['div.article__text p::text', 'div.article__body p::text', 'div.content p::text',
+                    'article p::text', 'main p::text', 'p::text'],
+        'fallback_clean': {
+            'min_length': 16,
+            'prefixes': BULLETS,
+            'contains': PAGE_BOILERPLATE,
+        },
+        'date': [],
+    },
+}
+
+# Footer / share text of the sites built by the same web studio (ecolur, oratert, ...)
+STUDIO_BOILERPLATE = [
+    "share", "facebook", "twitter", "telegram", "հետևեք", "կիսվել",
+    "հեղինակային", "պաշտպանված", "copyright",
+    "կայքէջի", "վերարտադրումը", "արգելվում է", "կարդալ ավելին",
+    "տեսնել ավելին", "ցույց տալ", "սեղմել", "մուտք", "ելք",
+    "բոլոր իրավունքները", "պահպանված", "ստեղծված",
+    # Truncated teaser text
+    "[…]", "...",
+]
+
+STUDIO_CONTAINERS = ['div.entry-content', '.post-content', '.article-content', '.content', 'article',
+                     '.main-content', '.news-content']
+
+STUDIO_DATES = ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                '.entry-date::text', '.article-date::text', '.news-date::text', '[class*="date"]::text']
+
+SITES['ecolur'] = {
+    'class_name': 'EcolurSpider',
+    'label': 'ECOLUR.ORG',
+    'allowed_domains': ['ecolur.org'],
+    'start_urls': ['https://www.ecolur.org/hy/'],
+    'settings': {
+        'USER_AGENT': CHROME_91,
+        'DEFAULT_REQUEST_HEADERS': ARMENIAN_HEADERS,
+    },
+    'listing': {
+        'articles': 'section.news article',
+        'limit': 12,
+        'link': "a[href*='/hy/news/']::attr(href)",
+        'title': "a[href*='/hy/news/']::text",
+        'meta': {'date_text': 'div.date::text'},
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r' [-|] Ecolur\.org', r' [-|] EcoLur'],
+        'container': STUDIO_CONTAINERS,
+        'container_content': ['p::text', 'div > *::text'],
+        'min_parts': 2,
+        'content': 'p::text',
+        'clean': {
+            'min_length': 10,
+            'contains': STUDIO_BOILERPLATE + ["ecolur.org", "ecolur", "ghazanchyan.com"],
+        },
+        'stop_at': (5, 300),
+        'min_content_length': 100,
+        'min_words': 20,
+        'date_meta': 'date_text',
+        'date': STUDIO_DATES,
+    },
+}
+
+SITES['ejc'] = {
+    'class_name': 'EjcSpider',
+    'label': 'EJC.AM',
+    'allowed_domains': ['ejc.am'],
+    'start_urls': ['https://ejc.am/hy'],
+    'listing': {
+        # Feed entries are the article links themselves
+        'articles': "div.feed a[href*='/hy/article/']",
+        'link': '::attr(href)',
+        'title': 'h2.text-primary-100::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['article ::text', '.article-content ::text', '.entry-content ::text',
+                    '.post-content ::text', '.content ::text', '.main-content ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text',
+                 '.post-date::text', '.timestamp::text'],
+    },
+}
+
+SITES['euromedia'] = {
+    'class_name': 'EuromediaSpider',
+    'label': 'EUROMEDIA24.COM',
+    'allowed_domains': ['euromedia24.com'],
+    'start_urls': ['https://euromedia24.com/hy/'],
+    'settings': {
+        'USER_AGENT': CHROME_91,
+        'DEFAULT_REQUEST_HEADERS': dict(BROWSER_HEADERS, Referer='https://euromedia24.com/'),
+    },
+    'listing': {
+        'articles': 'div.live-posts a',
+        'link': '::attr(href)',
+        'title': 'h6.live-post-active::text',
+    },
+    'article': {
+        'title': ['h1.post-title::text', 'h1::text', '.entry-title::text',
+                  "meta[property='og:title']::attr(content)"],
+        'title_split': [' | ', ' - '],
+        'title_strip': [r'Euromedia'],
+        'content': ['div.entry-content p::text', 'div.post-content p::text', 'div.article-content p::text',
+                    'article p::text', 'main p::text', 'p::text'],
+        'fallback_clean': {
+            'min_length': 21,
+            'prefixes': BULLETS,
+            'contains': PAGE_BOILERPLATE + ['euromedia', 'site', 'website', 'login', 'register'],
+        },
+        'date': [],
+    },
+}
+
+SITES['factor'] = {
+    'class_name': 'FactorSpider',
+    'label': 'FACTOR.AM',
+    'allowed_domains': ['factor.am'],
+    'start_urls': [
+        'https://factor.am/',
+        'https://factor.am/category/politics/',
+        'https://factor.am/category/economy/',
+        'https://factor.am/category/society/',
+        'https://factor.am/category/culture/',
+    ],
+    'settings': {
+        'USER_AGENT': CHROME_120,
+        'DEFAULT_REQUEST_HEADERS': dict(BROWSER_HEADERS, DNT='1', Referer='https://factor.am/'),
+        'DOWNLOAD_DELAY': 1,
+        'RANDOMIZE_DOWNLOAD_DELAY': True,
+    },
+    'listing': {
+        'articles': ['div.item-post.clearfix', 'article', '.post', '.news-item'],
+        'link': 'a::attr(href)',
+        'title': ['div.title::text', '.title::text', 'h3::text', 'h2::text'],
+        'meta': {'list_time': 'span.item-date::text'},
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text',
+                  'h1.title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text',
+                    '.content ::text', 'article p::text', '.main-content ::text', '.single-content ::text',
+                    '.text-content ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text',
+                 '.post-date::text', 'span.item-date::text'],
+    },
+}
+
+SITES['freenews'] = {
+    'class_name': 'FreenewsSpider',
+    'label': 'FREENEWS.AM',
+    'allowed_domains': ['freenews.am'],
+    'start_urls': ['https://freenews.am/'],
+    'listing': {
+        # Recommended-posts sidebar widget
+        'articles': 'ul.recommended-posts li div.post-item-small',
+        'limit': 15,
+        'title': 'h3.title a::text',
+    },
+    'article': {
+        'title': ['h1::text', '.post-title::text', '.article-title::text', '.entry-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['.post-content ::text', '.entry-content ::text', '.article-content ::text', '.content ::text',
+                    'article ::text', '.main-content ::text', '.post-body ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.post-date::text', '.publish-date::text',
+                 '.entry-date::text', '.meta-date::text'],
+    },
+}
+
+SITES['golosarmenii'] = {
+    'class_name': 'GolosarmeniiSpider',
+    'label': 'GOLOSARMENII.AM',
+    'allowed_domains': ['golosarmenii.am'],
+    'start_urls': ['https://golosarmenii.am/'],
+    'listing': {
+        'articles': 'ul.small_post_list.vertical_post_list li',
+        'limit': 15,
+        'link': 'div.post_text a::attr(href)',
+        'title': 'div.post_text a::text',
+        'meta': {'date_text': 'div.event_date::text'},
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text', '.content ::text',
+                    'article ::text', '.main-content ::text', '.article-body ::text', '.text ::text',
+                    '.article_text ::text', '.news-content ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.entry-date::text'],
+        'date_meta': 'date_text',
+    },
+}
+
+SITES['hayacq'] = {
+    'class_name': 'HayacqSpider',
+    'label': 'HAYACQ.COM',
+    'allowed_domains': ['hayacq.com'],
+    'start_urls': ['https://hayacq.com/'],
+    'cache_prefix': 'hayacq_article:',
+    'listing': {
+        'articles': 'article.short-news',
+        'link': 'div.short-news-content h1 a::attr(href)',
+        'title': 'div.short-news-content h1 a::text',
+    },
+    'article': {
+        'prefer_listing_title': True,
+        'title': ['article h1::text', '.article-title::text', 'h1.post-title::text', 'h1.entry-title::text',
+                  'h1.title::text', 'h1::text', "meta[property='og:title']::attr(content)"],
+        # Paragraphs inside known containers first, then whole containers
+        'content': [
+            'article .full-text p::text', 'article .content p::text', 'article .article-content p::text',
+            'article .post-content p::text', 'article .entry-content p::text', '.full-text p::text',
+            '.content p::text', '.article-content p::text', '.post-content p::text', '.entry-content p::text',
+            'main article p::text', '.main-content p::text', '.article-body p::text', '.news-content p::text',
+            '.story-content p::text',
+            'article .full-text ::text', 'article .content ::text', 'article .article-content ::text',
+            'article .post-content ::text', 'article .entry-content ::text', '.full-text ::text',
+            '.content ::text', '.article-content ::text', '.post-content ::text', '.entry-content ::text',
+            'main article ::text', '.main-content ::text', '.article-body ::text', '.news-content ::text',
+        ],
+        'clean': {
+            'min_length': 6,
+            'prefixes': ['•', '→', '►', '»', '›', '◆', 'կարդալ', 'share', 'comment', 'բաց', 'menu', 'search',
+                         'տեղեկատվական', 'գովազդ', 'advertising', 'advertisement', 'sponsored', 'related',
+                         'see also', 'read also', 'contact', 'follow', 'ետևյալ', 'հետևյալ', 'նոր նյութեր',
+                         'այլ լուրեր', 'bookmark', 'print', 'navigation', 'բաժիններ', 'կատեգորիաներ', 'tags',
+                         'թեգեր', 'home', 'գլխավոր', 'back to', 'վերադարձ', 'more', 'ավելին', 'all', 'բոլոր'],
+            'contains': SOCIAL + ['copyright', '©', 'terms', 'privacy', 'cookie', 'subscribe', 'newsletter',
+                                  'source:', 'photo:', 'image:'],
+        },
+        'date': [],
+    },
+}
+
+SITES['hayastan_news'] = {
+    'class_name': 'HayastanNewsSpider',
+    'label': 'HAYASTAN.NEWS',
+    'allowed_domains': ['hayastan.news'],
+    'start_urls': ['https://hayastan.news/am'],
+    'cache_prefix': 'processed_hayastan:',
+    'listing': {
+        'articles': 'div.py-12.border-b.border-gray-light',
+        'link': 'h4.text-sm a.animate-text::attr(href)',
+        'title': 'h4.text-sm a.animate-text::text',
+        'require_title': False,
+    },
+    'article': {
+        'title': ['h1.font-bold.text-2xl::text', 'h1::text', 'title::text',
+                  'meta[property="og:title"]::attr(content)'],
+        'content': ['div.prose p::text', '.content p::text', 'article p::text', '.article-content p::text',
+                    '.main-content p::text', '.post-content p::text', 'p::text'],
+        'clean': {
+            'min_length': 21,
+            'contains': [
+                "կարդալ ավելին", "կարդալ ավելի", "ավելին", "կարդալ", "share", "like", "follow", "subscribe",
+                "կիսվել", "հավանել", "տեսնել ավելին", "բաժանորդագրվել", "facebook", "twitter", "instagram",
+                "կապ", "contact", "մեկնաբանություն", "comment", "tag", "պիտակ", "category", "կատեգորիա",
+                "author", "հեղինակ", "date", "ամսաթիվ", "մարտ", "ապրիլ", "մայիս", "հունիս", "հուլիս",
+                "օգոստոս", "սեպտեմբեր", "հոկտեմբեր", "նոյեմբեր", "դեկտեմբեր", "փետրվար", "հունվար",
+                "copyright", "© ", "all rights reserved", "բոլոր իրավունքները", "advertisement", "գովազդ",
+                "footer", "ծանուցակցություն", "անվտանգություն", "Click here", "Մանրամասն",
+                "Ավելի տեղեկություն", "Տեղեկություն", "Կարծիք", "Գրել", "Այլ", "hayastan.news", "hayastan",
+                "related", "հարակից", "navigation", "նավիգացիա", "menu", "մենյու", "search", "որոնում",
+                "header", "վերև", "ներքև", "sidebar", "կողային", "widget", "վիջետ", "popular", "հայտնի",
+                "trending", "թրենդ", "recent", "վերջին", "more news", "ավելի լուրեր", "other articles",
+                "այլ հոդվածներ",
+            ],
+        },
+        'min_content_length': 51,
+        'date': ['div.text-sm.text-gray-darker.font-medium span::text'],
+    },
+}
+
+SITES['hayeli'] = {
+    'class_name': 'HayeliSpider',
+    'label': 'HAYELI.AM',
+    'allowed_domains': ['hayeli.am'],
+    'start_urls': ['https://hayeli.am/'],
+    'listing': {
+        'articles': ['a.timelineUnit', 'div.timeline a', "a[href*='/?p=']", 'article', 'div.news-item'],
+        'link': '::attr(href)',
+        'title': ['span::text', '::text'],
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text', '.content ::text',
+                    'article ::text', '.main-content ::text', 'p::text'],
+    },
+}
+
+SITES['hetq'] = {
+    'class_name': 'HetqSpider',
+    'label': 'HETQ.AM',
+    'allowed_domains': ['hetq.am'],
+    'start_urls': ['https://hetq.am/hy'],
+    'listing': {
+        'articles': "a.news-item[href*='/hy/article/']",
+        'link': '::attr(href)',
+        'title': ['h4::text', '.content-block h4::text', '::attr(title)'],
+        'require_title': False,
+    },
+    'article': {
+        'title': ['h1.article-title::text', 'h1::text', '.article-title::text', '.post-title::text',
+                  '.entry-title::text', '.title::text', "meta[property='og:title']::attr(content)", 'title::text',
+                  'article h1::text', 'main h1::text', '.content h1::text'],
+        # Skip "loading" placeholders, menus and the site name
+        'title_rules': {
+            'min_length': 6,
+            'exact': ['բեռնվում է', 'loading', 'բեռնել', 'load'],
+            'contains': ['բեռն', 'loading', 'menu', 'search', 'hetq'],
+        },
+        'title_split': [' | ', ' - '],
+        'title_strip': [r'Hetq'],
+        'content': ['.article-content p::text', '.post-content p::text', '.news-content p::text', 'article p::text',
+                    'main p::text', 'p::text'],
+        'fallback_clean': {
+            'min_length': 21,
+            'prefixes': BULLETS,
+            'contains': [
+                'բեռնվում է', 'loading', 'բեռնել', 'load', 'menu', 'navigation', 'sidebar', 'footer', 'copyright',
+                'social', 'follow', 'subscribe', 'newsletter', 'share', 'facebook', 'twitter', 'instagram',
+                'telegram', 'youtube', 'contact', 'terms', 'privacy', 'cookie', 'advertisement', 'sponsored',
+                'related', 'see also', 'read more', 'bookmark', 'print', 'source:', 'photo:', 'image:', 'video:',
+                'կապ', 'հետևել', 'բաժանորդագրում', 'բաժանել', 'տեղեկատվական', 'գովազդ', 'այլ լուրեր',
+                'նոր նյութեր', 'հետևյալ', 'ետևյալ', 'hetq', 'site', 'website', 'login', 'register',
+            ],
+        },
+        'date': [],
+    },
+}
+
+SITES['hraparaktv'] = {
+    'class_name': 'HraparaktvSpider',
+    'label': 'HRAPARAKTV.AM',
+    'allowed_domains': ['hraparaktv.am'],
+    'start_urls': ['https://hraparaktv.am/'],
+    'listing': {
+        'articles': ["a[href*='/post/']", '.post-item-small a', '.recommended-posts a', 'h3.title a'],
+        'link': '::attr(href)',
+        'title': ['::text', '::attr(title)'],
+        'require_title': False,
+    },
+    'article': {
+        'title': ['h1::text', 'h1 *::text', '.article-title::text', '.post-title::text', '.entry-title::text',
+                  '.title::text', '.page-title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        # Timeline titles carry the publication time: "16:51 - ..."
+        'title_strip': [r'^[\d:]+ - '],
+        'content': ['.post-content p::text', '.article-content p::text', '.entry-content p::text', '.content p::text',
+                    '.single-content p::text', '.post-body p::text', '.article-body p::text',
+                    '.news-content p::text', '.main-content p::text', '.content-area p::text', 'article p::text',
+                    '.main p::text', 'p::text'],
+        'clean': {
+            'min_length': 21,
+            'prefixes': ['մենյու', 'navigation', 'menu', 'կիսվել', 'share', 'tags', 'category', 'comment', 'login',
+                         'register', 'բաժին', 'կարծիք', 'մեկնաբանություն'],
+            'contains': ['hraparaktv', 'copyright', 'developed by'],
+            # Breadcrumbs: more than three separators
+            'patterns': [r'(?:[^|]*\|){4}'],
+        },
+        'join': ' ',
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.article-date::text', '[class*="date"]::text'],
+    },
+}
+
+SITES['infoport'] = {
+    'class_name': 'InfoportSpider',
+    'label': 'INFOPORT.AM',
+    'allowed_domains': ['infoport.am'],
+    'start_urls': ['https://infoport.am/'],
+    'listing': {
+        'articles': 'div.timeline-news',
+        'link': 'h3 a::attr(href)',
+        'title': 'h3 a::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text', '.title::text',
+                  '.news-title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['article ::text', '.article-content ::text', '.entry-content ::text', '.post-content ::text',
+                    '.content ::text', '.main-content ::text', '.news-content ::text', '.text ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.timestamp::text', '.icofont-clock-time::text'],
+    },
+}
+
+SITES['irakanum'] = {
+    'class_name': 'IrakanumSpider',
+    'label': 'IRAKANUM.AM',
+    'allowed_domains': ['irakanum.am'],
+    'start_urls': ['https://irakanum.am/posts'],
+    'listing': {
+        'articles': 'div.mb-15',
+        'title': 'span.block.mt-5.text-sm.leading-5.font-bold::text',
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text', '.content ::text',
+                    'article ::text', '.main-content ::text', 'p::text'],
+    },
+}
+
+SITES['irates'] = {
+    'module': 'news_scraper.spiders.irates',
+    'class_name': 'IratesSpider',
+    'label': 'IRATES.AM',
+    'allowed_domains': ['irates.am'],
+    'start_urls': ['https://www.irates.am/'],
+    'listing': {
+        'articles': ["a[href*='/hy/']", '.feed_li a', '.list-news a', 'li.feed_li a', "a[href*='/news/']",
+                     "a[href*='/article/']"],
+        'link': '::attr(href)',
+        'title': ['::text', '::attr(title)'],
+        'require_title': False,
+        # Archive pages and old/problem sections
+        'link_rules': {'contains': ['2024', 'archive', 'problem', 'issue', 'خنیر', 'interview']},
+    },
+    'article': {
+        'title': ['h1::text', 'h1 *::text', '.article-title::text', '.post-title::text', '.entry-title::text',
+                  '.news-title::text', '.title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'\s*\|\s*irates\.am.*$', r'^irates\.am\s*[-:]\s*'],
+        'title_rules': {
+            'min_length': 6,
+            'patterns': [r'^խնդիր', r'^problem', r'^issue', r'^բժշկական\s+խնդիր', r'^medical\s+problem',
+                         r'^տեխնիկական\s+խնդիր', r'^technical\s+issue', r'^հարցազրույց', r'^interview',
+                         r'^հետաքննություն', r'^investigation', r'^վիճակագրություն', r'^statistics',
+                         r'^մենյու', r'^menu', r'^navigation', r'^բաժին', r'^section', r'^\d{4}\s*թ\.?',
+                         r'^\d{4}\s*year'],
+        },
+        # Publication date, only used to drop old articles (see IratesSpider.is_recent_content)
+        'recent_date': ['time::attr(datetime)', 'time::text', '.feedDateTime::text', '.feedDate::text',
+                        '.date::text', '.publish-date::text', '.post-date::text', '.article-date::text'],
+        'content': [f'{selector}::text' for selector in (
+            'div.article-content p', 'div.post-content p', 'div.content p', 'div.article-text p',
+            'div.article-body p', 'div.news-content p', 'div.main-content p', 'div#content p', 'div.text p',
+            'div.body p', '.content-area p', '.entry-content p', '.article p', 'article p', 'main p', '#main p',
+            '.main p', 'p')],
+        'clean': {
+            'min_length': 20,
+            'patterns': [r'բաժանորդագր', r'subscribe', r'follow', r'հետևել', r'կիսվել', r'share', r'like',
+                         r'comment', r'copyright', r'հեղինակային', r'բոլոր իրավունքները', r'navigation',
+                         r'մենյու', r'menu', r'բաժին', r'կատեգորիա', r'category', r'tag', r'թագ', r'read more',
+                         r'ավելին', r'continue', r'շարունակել', r'previous', r'next', r'նախորդ', r'հաջորդ',
+                         r'advertisement', r'գովազդ', r'sponsor', r'հովանավոր', r'contact', r'կապ', r'email',
+                         r'phone', r'հեռախոս', r'footer', r'header', r'sidebar', r'related', r'առնչվող',
+                         r'similar', r'նմանատիպ', r'comments', r'մեկնաբանություն', r'feedback',
+                         r'2024\s*թ\.?', r'year\s*2024'],
+            'max_special_ratio': 0.3,
+            'skip_upper': True,
+        },
+        'max_parts': 15,
+        'join': " ",
+        'date': [],
+    },
+}
+
+SITES['iravaban'] = {
+    'class_name': 'IravabanSpider',
+    'label': 'IRAVABAN.NET',
+    'allowed_domains': ['iravaban.net'],
+    'start_urls': ['https://iravaban.net/'],
+    'settings': {
+        'USER_AGENT': CHROME_121,
+        'DEFAULT_REQUEST_HEADERS': CHROME_HEADERS,
+    },
+    'listing': {
+        'articles': 'div.newsfeed_item',
+        'title': ['div.entry-title::text', 'div.entry-title *::text'],
+        'title_rules': {'min_length': 10},
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text', '.page-title::text',
+                  '.news-title::text', '.main-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'\s*\|\s*iravaban\.net.*$', r'^iravaban\.net\s*[-:]\s*'],
+        'title_rules': {
+            'min_length': 6,
+            'patterns': NAV_TITLE_PATTERNS,
+        },
+        'content': [f'{selector}::text' for selector in (
+            'div.article-content p', 'div.post-content p', 'div.entry-content p', 'div.content p',
+            'div.article-body p', 'div.article-text p', 'div.text-content p', 'div.main-content p',
+            'div.news-content p', 'div.story-content p', 'div.body-content p', 'article p', '.content p',
+            '.article p', '.text p', 'p')],
+        'clean': {
+            'min_length': 15,
+            'patterns': [r'բաժանորդագր', r'subscribe', r'follow', r'հետևել', r'կիսվել', r'share', r'like',
+                         r'comment', r'մեկնաբանություն', r'copyright', r'հեղինակային', r'բոլոր իրավունքները',
+                         r'navigation', r'մենյու', r'menu', r'բաժին', r'կատեգորիա', r'category', r'tag', r'թագ',
+                         r'read more', r'ավելին', r'continue', r'շարունակել', r'previous', r'next', r'նախորդ',
+                         r'հաջորդ', r'advertisement', r'գովազդ', r'sponsor', r'հովանավոր', r'contact', r'կապ',
+                         r'email', r'phone', r'հեռախոս', r'footer', r'header', r'sidebar', r'related',
+                         r'առնչվող', r'similar', r'նմանատիպ', r'comments', r'feedback', r'հետադարձ', r'login',
+                         r'մուտք', r'register', r'գրանցվել', r'search', r'փնտրել', r'որոնում', r'home',
+                         r'գլխավոր', r'սկիզբ', r'view all', r'տեսնել բոլորը', r'show more'],
+            'max_special_ratio': 0.4,
+            'skip_upper': True,
+            'min_alnum_ratio': 0.6,
+        },
+        'max_parts': 15,
+        'join': " ",
+        'date': [],
+    },
+}
+
+# Fragments dropped from article paragraphs by the lurer-style cleaners (lurer, magnis, mamul)
+LINK_FARM_FRAGMENTS = [
+    # Navigation and UI elements
+    '•', '›', '»', '«', '‹', '→', '←', '↑', '↓',
+    # Social media and sharing
+    'share', 'facebook', 'twitter', 'whatsapp', 'telegram', 'viber',
+    'կիսվել', 'տարածել', 'ուղարկել', 'պահպանել',
+    # Navigation terms
+    'գլխավոր', 'մենյու', 'բաժին', 'կատեգորիա', 'ետ', 'առաջ',
+    'home', 'menu', 'back', 'next', 'previous', 'continue',
+    # Footer elements
+    'copyright', '©', 'բոլոր իրավունքները', 'all rights reserved',
+    'կայքի իրավունքները', 'terms of use', 'privacy policy',
+    # Ads and sponsored content
+    'advertisement', 'sponsored', 'реклама', 'գովազդ',
+    # Common website elements
+    'read more', 'ավելին', 'continue reading', 'բացել',
+    'search', 'որոնում', 'login', 'մուտք',
+    # Subscription, comments, source attribution
+    'subscribe', 'բաժանորդագրություն', 'newsletter',
+    'comment', 'մեկնաբանություն', 'feedback',
+    'source:', 'աղբյուր:', 'منبع:', 'источник:',
+    # Armenian navigation terms
+    'կարդալ ավելին', 'շարունակել', 'կարդալ',
+    'բոլոր նորությունները', 'այլ նորություններ',
+    # Time/date fragments that are not content
+    'ժամ', 'րոպե', 'օր', 'ամիս',
+]
+
+LINK_FARM_CLEAN = {
+    'min_length': 6,
+    'skip_digits': True,
+    'prefixes': ['բաժին', 'մենյու', 'navigation', 'menu'],
+    'suffixes': ['...', '→', '»', '›'],
+    'contains': LINK_FARM_FRAGMENTS,
+}
+
+LINK_FARM_TITLES = ['h1.article-title::text', 'h1.post-title::text', 'h1.entry-title::text', 'h1.news-title::text',
+                    'article h1::text', '.content h1::text', '.main h1::text', 'h1::text',
+                    "meta[property='og:title']::attr(content)", 'title::text']
+
+LINK_FARM_CONTENT = ['article .content p::text', 'article .article-content p::text', 'article .post-content p::text',
+                     'article .entry-content p::text', '.article-body p::text', '.news-body p::text',
+                     '.post-body p::text', '.content-area p::text', '.main-content p::text',
+                     '.article-text p::text', 'article p::text', '.main p::text']
+
+SITES['lurer'] = {
+    'class_name': 'LurerSpider',
+    'label': 'LURER.COM',
+    'allowed_domains': ['lurer.com'],
+    'start_urls': ['https://lurer.com/'],
+    'cache_key': 'url',
+    'listing': {
+        'articles': ["a[href*='/article/']", "a[href*='/news/']", "a[href*='/post/']", "a[href*='/2025/']",
+                     "a[href*='/2024/']", '.article-link', '.news-link', '.post-link'],
+        'combine': True,
+        'link': '::attr(href)',
+        'title': '::text',
+        'require_title': False,
+    },
+    'article': {
+        'title': LINK_FARM_TITLES,
+        'content': LINK_FARM_CONTENT,
+        'clean': LINK_FARM_CLEAN,
+        'date': ['time::attr(datetime)', 'time::text', '.article-date::text', '.post-date::text',
+                 '.publish-date::text', '.date::text', '[class*="date"]::text'],
+    },
+}
+
+SITES['magnis'] = {
+    'class_name': 'MagnisSpider',
+    'label': 'MAGNIS.NEWS',
+    'allowed_domains': ['magnis.news'],
+    'start_urls': ['https://www.magnis.news/'],
+    'cache_key': 'url',
+    'listing': {
+        'articles': ['a.item', '.article-link', '.news-item a', '.post-item a', "a[href*='/post/']",
+                     "a[href*='/article/']", "a[href*='/news/']", "a[href*='/2025/']", "a[href*='/2024/']"],
+        'combine': True,
+        'link': '::attr(href)',
+        'title': '::text',
+        'require_title': False,
+    },
+    'article': {
+        'title': LINK_FARM_TITLES,
+        'content': LINK_FARM_CONTENT,
+        'clean': dict(LINK_FARM_CLEAN, contains=LINK_FARM_FRAGMENTS + ['magnis.news', 'magnis', 'news']),
+        'date': ['time::attr(datetime)', 'time::text', '.article-date::text', '.post-date::text',
+                 '.publish-date::text', '.date::text', '.timestamp::text', '[class*="date"]::text'],
+    },
+}
+
+MAMUL_CATEGORIES = ['Իրադարձություններ', 'Միջազգային', 'Համացանց', 'Քաղաքականություն', 'Տնտեսություն',
+                    'Հասարակություն', 'Events', 'International', 'Internet', 'Politics', 'Economy', 'Society']
+
+SITES['mamul'] = {
+    'class_name': 'MamulSpider',
+    'label': 'MAMUL.AM',
+    'allowed_domains': ['mamul.am'],
+    'start_urls': ['https://mamul.am/am/news', 'https://mamul.am/'],
+    'cache_key': 'url',
+    'listing': {
+        # News articles live under /en/news/ID, /am/news/ID, /ru/news/ID
+        'articles': ["a[href*='/en/news/']", "a[href*='/am/news/']", "a[href*='/ru/news/']", "a[href*='/news/']"],
+        'link': '::attr(href)',
+        'title': ['::text', '::attr(title)', '::attr(alt)'],
+        'title_rules': {
+            'min_length': 16,
+            'exact': MAMUL_CATEGORIES,
+            'prefixes': ['բաժին', 'մենյու', 'section', 'menu', 'read', '»', 'more'],
+            'suffixes': ['...', '→', '»', '›', 'more'],
+        },
+    },
+    'article': {
+        'title': ['h1.article-title::text', 'h1.post-title::text', 'h1.entry-title::text', 'h1.news-title::text',
+                  'h1.main-title::text', '.article-header h1::text', '.post-header h1::text',
+                  '.content-header h1::text', 'article h1::text', '.main h1::text', '.content h1::text', 'h1::text',
+                  'h2.article-title::text', 'h2.post-title::text', 'h2::text',
+                  "meta[property='og:title']::attr(content)", "meta[name='title']::attr(content)", 'title::text'],
+        'title_rules': {
+            'min_length': 11,
+            'exact': MAMUL_CATEGORIES,
+            'prefixes': ['բաժին', 'մենյու', 'section', 'menu'],
+        },
+        'content': ['div.article-content p::text', 'div.post-content p::text', 'div.entry-content p::text',
+                    'div.news-content p::text', 'div.main-content p::text', '.article-body p::text',
+                    '.post-body p::text', '.news-body p::text', '.content-area p::text', '.article-text p::text',
+                    '.news-text p::text', 'article .content p::text', 'article .body p::text', 'article p::text',
+                    '.main .content p::text', '.main p::text', '.content p::text', 'p::text'],
+        'min_parts': 3,
+        'clean': dict(LINK_FARM_CLEAN, min_length=11, contains=LINK_FARM_FRAGMENTS + [
+            'mamul.am', 'mamul', 'իրադարձություններ', 'միջազգային', 'համացանց', 'քաղաքականություն',
+            'տնտեսություն', 'հասարակություն',
+        ]),
+        'max_parts': 20,
+        'date': ['time::attr(datetime)', 'time::text', '.article-date::text', '.post-date::text',
+                 '.publish-date::text', '.date::text', '.dater::text', '[class*="date"]::text'],
+    },
+}
+
+SITES['mediahub'] = {
+    'class_name': 'MediahubSpider',
+    'label': 'MEDIAHUB.AM',
+    'allowed_domains': ['mediahub.am'],
+    'start_urls': ['https://mediahub.am/'],
+    'listing': {
+        'articles': 'div#latest-news-block div.col-xl-12.border-blog',
+        'link': 'div.blog-content p a.hover-line::attr(href)',
+        'title': 'div.blog-content p a.hover-line::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text', '.blog-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['article ::text', '.article-content ::text', '.entry-content ::text', '.post-content ::text',
+                    '.blog-content ::text', '.content ::text', '.main-content ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.blog-meta span::text', '.timestamp::text'],
+    },
+}
+
+SITES['mediamax_sport'] = {
+    'class_name': 'MediamaxSportSpider',
+    'label': 'SPORT.MEDIAMAX.AM',
+    'allowed_domains': ['sport.mediamax.am'],
+    'start_urls': ['https://sport.mediamax.am/am/'],
+    'listing': {
+        'articles': ['div.newsminh', 'div.right-blocks', "a[href*='/am/news/']"],
+        'limit': 15,
+        # Block containers: the last link is the headline; bare links carry it themselves
+        'link': ['./descendant::a[last()]/@href', '::attr(href)'],
+        'title': ['./descendant::a[last()]/text()', '::text'],
+        'title_rules': {'min_length': 11},
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['.article-content ::text', '.entry-content ::text', '.post-content ::text', '.content ::text',
+                    'article ::text', '.main-content ::text', '.news-content ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.post-date::text', '.publish-date::text',
+                 '.entry-date::text', '.meta-date::text'],
+    },
+}
+
+SITES['medianews'] = {
+    'class_name': 'MedianewsSpider',
+    'label': 'MEDIANEWS.SITE',
+    'allowed_domains': ['medianews.site'],
+    'start_urls': ['https://medianews.site/'],
+    'listing': {
+        # Swiper slider on the front page
+        'articles': "div.swiper-slide a[href*='medianews.site']",
+        'link': '::attr(href)',
+        'title': 'div.card-slider__title::text',
+        'meta': {'category': 'span.card-slider__category::text'},
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'\s*\|\s*medianews\.site.*$', r'^medianews\.site\s*[-:]\s*', r'\s*[-–]\s*Media\s*News.*$',
+                        r'\s*[-–]\s*Լրատվություն.*$'],
+        'title_rules': {
+            'min_length': 6,
+            'patterns': NAV_TITLE_PATTERNS + SHARE_TITLE_PATTERNS + [r'^swiper', r'^slider', r'^slide', r'^կարգավոր'],
+        },
+        'content': [f'{selector}::text' for selector in (
+            'div.entry-content p', 'div.post-content p', 'div.article-content p', 'div.content p', 'article p',
+            'div.main-content p', 'div.wp-content p', 'div.post-body p', 'div.article-body p',
+            'div.text-content p', '.entry-content p', '.post-content p', '.article-content p', '.content p',
+            '.main-content p', '.wp-content p', '.post-body p', '.article-body p', '.text-content p', 'p')],
+        'clean': dict(MEDIA_CLEAN, patterns=MEDIA_CONTENT_PATTERNS + [
+            # Site branding and slider leftovers
+            r'medianews', r'media\s*news', r'լրատվություն', r'նորություններ', r'\.site',
+            r'swiper', r'slider', r'slide', r'կարգավոր', r'ցուցակ', r'ցուցադրություն', r'card__title',
+            r'card__category', r'replies',
+        ]),
+        'max_parts': 15,
+        'join': " ",
+        'min_content_length': 30,
+        'date': [],
+    },
+}
+
+SITES['mitk'] = {
+    'class_name': 'MitkSpider',
+    'label': 'MITK.AM',
+    'allowed_domains': ['mitk.am'],
+    'start_urls': ['https://mitk.am/'],
+    'settings': {
+        'USER_AGENT': CHROME_91,
+        'DEFAULT_REQUEST_HEADERS': dict(BROWSER_HEADERS, Referer='https://mitk.am/', **{
+            'sec-ch-ua': '"Google Chrome";v="91", "Chromium";v="91", ";Not A Brand";v="99"',
+            'sec-ch-ua-mobile': '?0',
+            'Sec-Fetch-Site': 'same-origin',
+            'Sec-Fetch-User': '?1',
+        }),
+    },
+    'listing': {
+        # "Recent posts" widget
+        'articles': 'div#recent-posts-2 ul li',
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1.post-title::text', 'h1.article-title::text', '.entry-title::text',
+                  '.post-title::text', '.article-title::text', 'article h1::text', '.main-content h1::text',
+                  '.content h1::text', 'h1::text', 'h2.entry-title::text', 'h2.post-title::text', 'h2::text',
+                  "meta[property='og:title']::attr(content)", "meta[name='title']::attr(content)", 'title::text'],
+        'title_rules': dict(COMMON_TITLE_RULES, min_length=11),
+        'content': ['div.entry-content p::text', 'div.post-content p::text', 'div.article-content p::text',
+                    '.entry-content p::text', '.post-content p::text', '.article-content p::text',
+                    'article .content p::text', 'article p::text', '.main-content p::text', '.content p::text',
+                    'p::text'],
+        'min_parts': 3,
+        'clean': {
+            'min_length': 11,
+            'min_words': 3,
+            'skip_digits': True,
+            'prefixes': ['բաժին', 'մենյու', 'navigation', 'menu', 'home', 'գլխավոր', 'http://', 'https://', 'click',
+                         'կտտացնել', 'press', 'սեղմել'],
+            'suffixes': ['...', '→', '»', '›', 'more', 'ավելին'],
+            'contains': COMMON_FRAGMENTS + ['mitk.am', 'mitk'],
+        },
+        'max_parts': 15,
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.entry-meta .posted-on::text', '.entry-date::text', '[class*="date"]::text'],
+    },
+}
+
+SITES['newspress'] = {
+    'class_name': 'NewspressSpider',
+    'label': 'NEWSPRESS.AM',
+    'allowed_domains': ['newspress.am'],
+    'start_urls': ['https://newspress.am/?l=am'],
+    'listing': {
+        'articles': 'div.timeline a',
+        'link': '::attr(href)',
+        'title': 'span::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text', '.title::text',
+                  '.news-title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['article ::text', '.article-content ::text', '.entry-content ::text', '.post-content ::text',
+                    '.content ::text', '.main-content ::text', '.news-content ::text', '.text ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time.timeago::attr(datetime)', 'time::text', '.date::text',
+                 '.publish-date::text', '.post-date::text', '.timestamp::text'],
+    },
+}
+
+SITES['norlur'] = {
+    'class_name': 'NorlurSpider',
+    'label': 'NORLUR.AM',
+    'allowed_domains': ['norlur.am'],
+    'start_urls': ['https://norlur.am/'],
+    'cache_prefix': 'norlur_article:',
+    'listing': {
+        # "Recent posts" widget first, then the headlines of the main column
+        'articles': ['div.widget_recent_entries ul li', 'article h2, article h3, .entry-title'],
+        'combine': True,
+        'limit': 15,
+    },
+    'article': {
+        'prefer_listing_title': True,
+        'content': ['div.entry-content ::text', 'div.post-content ::text', 'article .content ::text',
+                    'div.article-content ::text', 'div.single-content ::text', 'div[class*="content"] ::text',
+                    'main article p ::text', 'article p ::text', 'p::text'],
+        'join': ' ',
+        'stop_at': (1, 5000),
+        'date': [],
+    },
+}
+
+SITES['newday'] = {
+    'class_name': 'NewdaySpider',
+    'label': 'NEWDAY.AM',
+    'allowed_domains': ['newday.am'],
+    'start_urls': ['https://newday.am/'],
+    'listing': {
+        'articles': ['article.elementor-post.elementor-grid-item', '.elementor-post', 'article.post', '.post-item',
+                     'article'],
+        # Elementor grids are not always in date order
+        'sort_by': ['time::attr(datetime)', 'time::text', '.elementor-post-date::text', '.date::text',
+                    '.post-date::text', "[class*='date']::text"],
+        'link': ['h3.elementor-post__title a::attr(href)', 'h2.elementor-post__title a::attr(href)',
+                 '.elementor-post__title a::attr(href)', 'a::attr(href)'],
+        'title': ['h3.elementor-post__title a::text', 'h2.elementor-post__title a::text',
+                  '.elementor-post__title a::text', 'h1::text', 'h2::text', 'h3::text'],
+        # No post grid at all: any link with a headline-sized text
+        'fallback': {
+            'articles': 'a[href]',
+            'link': '::attr(href)',
+            'title': '::text',
+            'title_rules': {'min_length': 21},
+            'limit_after_filter': True,
+        },
+    },
+    'article': {
+        'title': ['.elementor-heading-title::text', 'h1.elementor-heading-title::text',
+                  'h2.elementor-heading-title::text', 'h3.elementor-heading-title::text'] + [
+                      query for query in ARTICLE_TITLES if 'page-title' not in query],
+        # The site slogan "Հավաստի լուրեր" is the first heading on every page
+        'title_rules': {
+            'min_length': 16,
+            'exact': ['հավաստի լուրեր', 'reliable news', 'newday.am', 'newday'],
+            'contains': ['newday'],
+            'prefixes': COMMON_TITLE_RULES['prefixes'] + ['հավաստի', 'reliable', 'news', 'լուրեր'],
+            'suffixes': COMMON_TITLE_RULES['suffixes'],
+        },
+        'content': ['div.entry-content p::text', 'div.post-content p::text', 'div.article-content p::text',
+                    '.entry-content p::text', '.post-content p::text', '.article-content p::text',
+                    '.elementor-widget-container p::text', 'article .content p::text', 'article p::text',
+                    '.main-content p::text', '.content p::text', 'p::text'],
+        'min_parts': 3,
+        'clean': dict(COMMON_CLEAN, exact=['հավաստի լուրեր', 'reliable news'], contains=COMMON_FRAGMENTS + [
+            'newday.am', 'newday', 'new day', 'հավաստի լուրեր', 'reliable news', 'elementor', 'widget', 'container',
+        ]),
+        'max_parts': 15,
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.elementor-post-date::text',
+                 '.publish-date::text', '.post-date::text', '.entry-date::text', '[class*="date"]::text'],
+    },
+}
+
+SITES['noyantapan'] = {
+    'class_name': 'NoyantapanSpider',
+    'label': 'NOYAN TAPAN',
+    'allowed_domains': ['nt.am'],
+    'start_urls': ['https://nt.am/am/'],
+    'listing': {
+        'articles': 'div.rec-item.d-flex',
+        'link': 'div.img-content p a::attr(href)',
+        'title': 'div.img-content p a::text',
+        'meta': {'time_text': 'div.img-content strong span::text'},
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'\s*\|\s*nt\.am.*$', r'^nt\.am\s*[-:]\s*', r'\s*[-–]\s*Noyan\s*Tapan.*$',
+                        r'\s*[-–]\s*Նոյան\s*Տապան.*$', r'\s*[-–]\s*Լրատվական\s*Գործակալություն.*$'],
+        'title_rules': {
+            'min_length': 6,
+            'patterns': NAV_TITLE_PATTERNS + SHARE_TITLE_PATTERNS + [
+                r'^rec-item', r'^d-flex', r'^img-content', r'^rec', r'^item'],
+        },
+        'content': [f'{selector}::text' for selector in (
+            'div.entry-content p', 'div.post-content p', 'div.article-content p', 'div.content p', 'article p',
+            'div.main-content p', 'div.article-body p', 'div.text p', 'div.article_text p', 'div.news-content p',
+            'div.news-body p', 'div.post-body p', 'div.text-content p', '.entry-content p', '.post-content p',
+            '.article-content p', '.content p', '.main-content p', '.article-body p', '.text p',
+            '.article_text p', '.news-content p', '.news-body p', '.post-body p', '.text-content p', 'p')],
+        'clean': dict(MEDIA_CLEAN, patterns=MEDIA_CONTENT_PATTERNS + [
+            # Site branding and markup leftovers
+            r'nt\.am', r'noyan\s*tapan', r'նոյան\s*տապան', r'լրատվական\s*գործակալություն', r'news\s*agency',
+            r'գործակալություն', r'rec-item', r'd-flex', r'img-content', r'rec', r'item', r'strong', r'span',
+            r'div', r'p', r'a', r'href',
+        ]),
+        'max_parts': 15,
+        'join': " ",
+        'min_content_length': 30,
+        'date': [],
+    },
+}
+
+SITES['past'] = {
+    'class_name': 'PastSpider',
+    'label': 'PAST.AM',
+    'allowed_domains': ['past.am'],
+    'start_urls': ['https://past.am/'],
+    'listing': {
+        'articles': 'div.timeline a',
+        'link': '::attr(href)',
+        'title': 'span::text',
+    },
+    'article': {
+        'title': ARTICLE_TITLES,
+        'title_rules': dict(COMMON_TITLE_RULES, min_length=11, contains=['past']),
+        'content': ['div.content p::text', 'div.article-content p::text', 'div.post-content p::text',
+                    'div.entry-content p::text', '.content p::text', '.article-content p::text',
+                    '.post-content p::text', '.entry-content p::text', 'article .content p::text', 'article p::text',
+                    '.main-content p::text', '.article-body p::text', 'p::text'],
+        'min_parts': 3,
+        'clean': dict(
+            COMMON_CLEAN,
+            prefixes=COMMON_CLEAN['prefixes'] + ['կարդալ', 'read', 'more', 'ավելին'],
+            contains=COMMON_FRAGMENTS + ['past.am', 'past', 'անցել', 'անցյալ', 'timeline', 'ծանուցում',
+                                         'notification'],
+        ),
+        'max_parts': 15,
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.news-date::text', '.entry-date::text', '[class*="date"]::text'],
+    },
+}
+
+SITES['oragir'] = {
+    'module': 'news_scraper.spiders.oragir',
+    'class_name': 'OragirSpider',
+    'label': 'ORAGIR.NEWS',
+    'allowed_domains': ['oragir.news'],
+    # OragirSpider.start_requests adds the daily archives of the last days
+    'start_urls': ['https://oragir.news/hy', 'https://oragir.news/hy/materials/all', 'https://oragir.news/'],
+    'settings': {
+        'USER_AGENT': CHROME_91,
+        'DEFAULT_REQUEST_HEADERS': dict(ARMENIAN_HEADERS, Referer='https://oragir.news/', **{
+            'Accept-Language': 'hy-AM,hy;q=0.9,en-US;q=0.8,en;q=0.7',
+        }),
+    },
+    'listing': {
+        'articles': ['div.lnews-item', 'div.news-item', 'article', 'div.post', 'div.item', "a[href*='/material/']"],
+        'link': ['a.ajaxlink.lnews-title::attr(href)', "a[href*='/material/']::attr(href)", '::attr(href)'],
+        'title': ['a.ajaxlink.lnews-title::text', "a[href*='/material/']::text", '::text'],
+        'require_title': False,
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.news-title::text',
+                  '.title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text', '.content ::text',
+                    '.news-content ::text', '.material-content ::text', 'article ::text', '.main-content ::text',
+                    'div.text ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.news-date::text'],
+    },
+}
+
+SITES['politik'] = {
+    'class_name': 'PolitikSpider',
+    'label': 'POLITIK.AM',
+    'allowed_domains': ['politik.am'],
+    'start_urls': ['https://politik.am/'],
+    'listing': {
+        'articles': ['ul.oc-horizon li', 'article', '.post', '.news-item'],
+        'link': ['a::attr(href)', 'h2 a::attr(href)', 'h3 a::attr(href)'],
+        'title': ['a::text', 'h2::text', 'h3::text'],
+        'require_title': False,
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', "meta[property='og:title']::attr(content)",
+                  'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.content ::text', 'article ::text',
+                    'p::text'],
+        'date': ['time::text', '.date::text'],
+    },
+}
+
+SITES['pastinfo'] = {
+    'class_name': 'PastinfoSpider',
+    'label': 'PASTINFO.AM',
+    'allowed_domains': ['pastinfo.am'],
+    'start_urls': ['https://pastinfo.am/hy'],
+    'listing': {
+        'articles': ['div.news_block', 'div.news-block', 'article', 'div.news-item', "div[class*='news']"],
+        'link': ['a.news_title::attr(href)', 'a::attr(href)'],
+        'title': ['a.news_title::text', 'a::text'],
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1.post-title::text', 'h1.article-title::text', 'h1.title::text', 'h1::text',
+                  '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_rules': {'min_length': 6},
+        'content': ['div.entry-content p::text', 'div.post-content p::text', 'div.article-content p::text',
+                    'div.content p::text', 'article p::text', 'div.main-content p::text', '.entry-content p::text',
+                    '.post-content p::text', '.article-content p::text', '.content p::text',
+                    '.main-content p::text', 'p::text'],
+        'clean': {
+            'min_length': 3,
+            'min_alnum_ratio': 0.5,
+            'patterns': [
+                r'^[\W\d_]+$',  # no letters at all: numbers, dates, punctuation
+                r'^\S{1,9}$',  # a single short word
+            ],
+            'contains': [
+                # Navigation elements
+                "•", "›", "→", "←", "↑", "↓", "▪", "▫", "■", "□", "◆", "◇", "○", "●",
+                # Social media and sharing
+                "share", "facebook", "twitter", "instagram", "youtube", "telegram", "whatsapp", "viber",
+                "like", "comment", "follow", "subscribe", "պահանջել", "կիսվել", "նշել", "հավանել",
+                # Armenian navigation terms
+                "գլխավոր", "մենյու", "կարդալ ավելին", "ավել", "բաց", "փակ", "վերադառնալ",
+                "հաջորդ", "նախորդ", "ցույց տալ", "թաքցնել", "բացել", "տեղեկատվություն",
+                # Site specific elements
+                "pastinfo.am", "pastinfo", "կայք", "կապ", "հեռախոս", "հասցե", "էլ-փոստ",
+                "հաղորդագրություն", "գրանցվել", "մուտք", "ծանուցում", "գովազդ", "պատուհան",
+                # Copyright and legal
+                "© 2024", "© 2023", "© pastinfo", "copyright", "հեղինակային", "իրավունք",
+                "terms", "privacy", "policy", "կանոն", "գաղտնիություն", "պայմաններ",
+                # Ads
+                "advertisement", "sponsored", "ad", "ads", "ծանուցումներ",
+                # Common website elements
+                "read more", "see more", "show more", "load more",
+                "մանրամասն", "տեսնել", "բեռնել", "ավելացնել", "փնտրել",
+                # Date/time navigation
+                "today", "yesterday", "tomorrow", "week", "month", "year", "այսօր", "երեկ", "վաղը",
+                # Click baits
+                "click here", "այստեղ սեղմել", "սեղմել", "մուտք գործել", "անցնել",
+                # Archive and categories
+                "archive", "category", "tag", "արխիվ", "կատեգորիա", "պիտակ",
+                # Comments and user interactions
+                "comments", "reply", "post", "մեկնաբանություն", "պատասխանել", "գրառում",
+                # Search and filtering
+                "search", "filter", "sort", "ֆիլտր", "դասակարգել",
+                # Newsletter and subscriptions
+                "newsletter", "subscription", "բաժանորդագրություն", "տեղեկագիր",
+                # Contact information
+                "contact", "phone", "email", "address",
+                # Technical leftovers
+                "loading", "error", "404", "500", "բեռնում", "սխալ", "տեխնիկական",
+                "javascript", "css", "html", "enable", "disable", "միացնել", "անջատել",
+                # Weather/external widgets
+                "weather", "temperature", "forecast", "եղանակ", "ջերմաստիճան",
+                # URLs and links
+                "http", "www", ".com", ".am", ".org", ".net", "url", "link",
+                # Time of day without context
+                "am", "pm", "գիշեր", "ցերեկ", "առավոտ", "երեկո",
+            ],
+        },
+        'min_content_length': 50,
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.news_date::text', '.publish-date::text',
+                 '.post-date::text'],
+    },
+}
+
+SITES['press24'] = {
+    'class_name': 'Press24Spider',
+    'label': 'PRESS24.AM',
+    'allowed_domains': ['press24.am'],
+    'start_urls': ['https://press24.am/?l=am'],
+    'listing': {
+        'articles': 'div.timeline a',
+        'link': '::attr(href)',
+        'title': 'span::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text', '.title::text',
+                  '.news-title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['article ::text', '.article-content ::text', '.entry-content ::text', '.post-content ::text',
+                    '.content ::text', '.main-content ::text', '.news-content ::text', '.text ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.timestamp::text', '.timeago::attr(datetime)'],
+    },
+}
+
+SITES['pressmedia'] = {
+    'class_name': 'PressmediaSpider',
+    'label': 'PRESSMEDIA.AM',
+    'allowed_domains': ['pressmedia.am'],
+    'start_urls': ['https://pressmedia.am/?l=am'],
+    'settings': {
+        'USER_AGENT': CHROME_91,
+        'DEFAULT_REQUEST_HEADERS': dict(ARMENIAN_HEADERS, **{
+            'Accept-Language': 'hy-AM,hy;q=0.9,en-US,en;q=0.8',
+            'Cache-Control': 'max-age=0',
+        }),
+    },
+    'listing': {
+        'articles': 'div.timeline a.clearfix',
+        'link': '::attr(href)',
+        'title': 'span::text',
+    },
+    'article': {
+        'title': ['h1.article-title::text', 'h1.post-title::text', 'h1.entry-title::text', 'h1.title::text', 'h1::text',
+                  '.article-title::text', '.post-title::text', '.entry-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'\s*\|\s*pressmedia\.am.*$', r'^pressmedia\.am\s*[-:]\s*', r'\s*[-–]\s*Press\s*Media.*$'],
+        'title_rules': {
+            'min_length': 6,
+            'patterns': NAV_TITLE_PATTERNS + SHARE_TITLE_PATTERNS,
+        },
+        'content': [f'{selector}::text' for selector in (
+            'div.article-content p', 'div.post-content p', 'div.entry-content p', 'div.content p',
+            'div.article-body p', 'div.story-content p', 'div.text-content p', 'article p', 'div.main-content p',
+            '.article-content p', '.post-content p', '.entry-content p', '.content p', '.article-body p',
+            '.story-content p', '.text-content p', '.main-content p', 'p')],
+        'clean': {
+            'min_length': 20,
+            'patterns': [r'բաժանորդագր', r'subscribe', r'follow', r'հետևել', r'կիսվել', r'share', r'like',
+                         r'comment', r'մեկնաբանություն', r'copyright', r'հեղինակային', r'բոլոր իրավունքները',
+                         r'navigation', r'մենյու', r'menu', r'բաժին', r'կատեգորիա', r'category', r'tag', r'թագ',
+                         r'read more', r'ավելին', r'continue', r'շարունակել', r'previous', r'next', r'նախորդ',
+                         r'հաջորդ', r'advertisement', r'գովազդ', r'sponsor', r'հովանավոր', r'contact', r'կապ',
+                         r'email', r'phone', r'հեռախոս', r'footer', r'header', r'sidebar', r'related',
+                         r'առնչվող', r'similar', r'նմանատիպ', r'comments', r'feedback', r'հետադարձ', r'login',
+                         r'մուտք', r'register', r'գրանցվել', r'search', r'փնտրել', r'որոնում', r'home',
+                         r'գլխավոր', r'սկիզբ', r'view all', r'տեսնել բոլորը', r'show more', r'pressmedia\.am',
+                         r'press\s*media', r'loading', r'բեռնում', r'facebook', r'twitter', r'instagram',
+                         r'youtube', r'telegram', r'http', r'www\.', r'\.com', r'\.am', r'\.org'],
+            'max_special_ratio': 0.4,
+            'skip_upper': True,
+            'min_alnum_ratio': 0.6,
+        },
+        'max_parts': 15,
+        'join': " ",
+        'min_content_length': 30,
+        'date': [],
+    },
+}
+
+SITES['radar'] = {
+    'class_name': 'RadarSpider',
+    'label': 'RADAR.AM',
+    'allowed_domains': ['radar.am'],
+    'start_urls': [
+        'https://www.radar.am/hy/',
+        'https://www.radar.am/hy/feed/',
+        'https://www.radar.am/hy/news/politics/',
+        'https://www.radar.am/hy/news/social/',
+        'https://www.radar.am/hy/news/world/',
+        'https://www.radar.am/hy/news/karabagh/',
+    ],
+    'settings': {
+        'USER_AGENT': CHROME_120,
+        'DEFAULT_REQUEST_HEADERS': dict(
+            BROWSER_HEADERS,
+            Accept='text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+            DNT='1',
+            Referer='https://www.radar.am/',
+        ),
+        'DOWNLOAD_DELAY': 1,
+        'RANDOMIZE_DOWNLOAD_DELAY': True,
+    },
+    'listing': {
+        'articles': ['div.news_feed_item.news-section__filter-item', 'div.news_feed_item',
+                     '.news-section__filter-item', 'article', '.news-item'],
+        'title': ['div.wrap-context p::text', 'p::text', '.wrap-context::text', 'h3::text', 'h2::text'],
+        'meta': {'article_date': 'span::text'},
+    },
+    'article': {
+        'title': ['article h1::text', 'main h1::text', 'div.content h1::text', 'div.article h1::text',
+                  'div.post h1::text', 'h1.title::text', 'h1.article-title::text', 'h1.entry-title::text',
+                  'h1.post-title::text', 'h1::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        # Site name decorations, then the separators left behind
+        'title_strip': [r'Radar\.am \| ', r'Radar\.am', r'Հայաստանի նորություններ', r'Armenian News', r'Radar - ',
+                        r' - Radar', r'^[\s|-]+', r'[\s|-]+$'],
+        'title_rules': {'exact': ['radar']},
+        'content': ['div.article-content p::text', '.entry-content p::text', '.post-content p::text',
+                    '.content p::text', 'article p::text', '.main-content p::text', '.article-body p::text',
+                    '.news-content p::text', 'div.post-body p::text', 'div.news-text p::text', 'main p::text',
+                    'p::text'],
+        'clean': {'min_length': 31},
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.article-date::text'],
+        'date_meta': 'article_date',
+    },
+}
+
+SITES['shamshyan'] = {
+    'class_name': 'ShamshyanSpider',
+    'label': 'SHAMSHYAN.COM',
+    'allowed_domains': ['shamshyan.com'],
+    'start_urls': ['https://shamshyan.com/hy'],
+    'settings': {
+        'USER_AGENT': CHROME_91,
+        'DEFAULT_REQUEST_HEADERS': ARMENIAN_HEADERS,
+    },
+    'listing': {
+        'articles': 'ul.news-items li.item',
+        'limit': 15,
+        'link': 'a.item-title::attr(href)',
+        'title': 'a.item-title span.xfont-medium::text',
+        'meta': {'date_text': 'span.item-date::text'},
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r' - Shamshyan\.com', r' \| Shamshyan\.com'],
+        # Paragraphs of the article body, else its direct children
+        'container': ['div.entry-content', '.post-content', '.article-content', '.content', 'article',
+                      '.main-content'],
+        'container_content': ['p::text', 'div > *::text'],
+        'min_parts': 2,
+        'clean': {
+            'min_length': 10,
+            'contains': ["share", "facebook", "twitter", "telegram", "հետևեք", "կիսվել", "հեղինակային",
+                         "պաշտպանված", "copyright", "shamshyan.com", "կայքէջի", "վերարտադրումը", "արգելվում է",
+                         "կարդալ ավելին", "տեսնել ավելին", "ցույց տալ", "սեղմել", "մուտք", "ելք",
+                         # Teasers of other articles are truncated
+                         "[…]", "..."],
+        },
+        'stop_at': (5, 300),
+        'min_content_length': 100,
+        'min_words': 20,
+        'date_meta': 'date_text',
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.entry-date::text'],
+    },
+}
+
+SITES['shantnews'] = {
+    'class_name': 'ShantnewsSpider',
+    'label': 'SHANTNEWS.AM',
+    'allowed_domains': ['shantnews.am'],
+    'start_urls': ['https://www.shantnews.am/'],
+    'listing': {
+        'articles': ["a[href*='/news/view/']", '.newsfeed_title', ".newsfeed_block a[href*='/news/view/']",
+                     'li.newsfeed_block a'],
+        'link': '::attr(href)',
+        'title': ['::text', '::attr(title)', '::attr(alt)'],
+        'require_title': False,
+    },
+    'article': {
+        'title': ['h1.article-title::text', 'h1.post-title::text', 'h1.entry-title::text', 'h1.news-title::text',
+                  'h1.title::text', 'h1::text', '.article-title::text', '.post-title::text', '.entry-title::text',
+                  '.news-title::text', '.title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r' - Shantnews\.am', r' \| Shantnews\.am', r' - Shant TV', r' \| Shant TV'],
+        'title_rules': {'min_length': 6},
+        'container': ['div.article-content', 'div.post-content', 'div.entry-content', 'div.news-content',
+                      'div.content', 'article', 'main', '.main-content'],
+        'container_content': ['p::text', 'div > *::text'],
+        'min_parts': 2,
+        # The page also lists other news; read only the first block of the article
+        'content': ['div.article-content:first-of-type p::text', 'div.post-content:first-of-type p::text',
+                    'div.entry-content:first-of-type p::text', 'div.news-content:first-of-type p::text',
+                    'div.content:first-of-type p::text', 'article:first-of-type p::text',
+                    'div.article-content > p::text', 'div.post-content > p::text', 'div.entry-content > p::text',
+                    'div.news-content > p::text', 'div.content > p::text', 'article > p::text', 'p::text'],
+        'tier_parts': 5,
+        'clean': {
+            'min_length': 10,
+            'prefixes': ["Քրեակատարողական", "Թուրքիան", "Գերմանիայի", "ՊԵԿ", "Հետևեք", "Կայքէջի", "Ռուսաստանի",
+                         "Չինաստանի", "Լավրովը", "Վան Ին"],
+            'contains': ["հեղինակային", "պաշտպանված", "shantnews.am", "shant tv", "հետևեք մեզ", "սոց․ ցանցերում",
+                         "կայքէջի նյութերի", "վերարտադրումը", "արգելվում է", "համաձայնության", "share", "facebook",
+                         "twitter", "[…]", "..."],
+            # Footer and teaser sentences that mark the end of the article body
+            'end_markers': ["Քրեակատարողական ծառահությունը տեղադրել է", "Թուրքիան ուշադիր հետևում է",
+                            "Գերմանիայի փոխկանցլեր", "ՊԵԿ ռազմավարական նախագծերին", "Հետևեք մեզ սոց․ ցանցերում",
+                            "Կայքէջի նյութերի վերարտադրումը", "արգելվում է առանց"],
+        },
+        # Reporting phrases of other news items; the first paragraph may use them
+        'later_clean': {
+            'contains_case': ["այս մասին ասել է", "հաղորդում է", "նշել են գերատեսչությունում", "ընդգծել է", "հավելել",
+                              "նկատելով"],
+        },
+        'stop_at': (3, 300),
+        'min_content_length': 100,
+        'min_words': 15,
+        'date': ['time::attr(datetime)', 'time::text', '.newsfeed_date::text', '.date::text', '.publish-date::text',
+                 '.post-date::text', '.article-date::text', '.news-date::text', '[class*="date"]::text'],
+    },
+}
+
+SITES['slaq'] = {
+    'class_name': 'SlaqSpider',
+    'label': 'SLAQ.AM',
+    'allowed_domains': ['slaq.am'],
+    'start_urls': ['https://slaq.am/'],
+    'listing': {
+        'articles': 'div.news_feed ul.feed_list li',
+        'link': 'a::attr(href)',
+        'title': 'span.news_title::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article_title::text', '.news_title::text', 'h2::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'\s*\|\s*slaq\.am.*$', r'^slaq\.am\s*[-:]\s*', r'\s*[-–]\s*SLAQ.*$'],
+        'title_rules': {
+            'min_length': 6,
+            'patterns': NAV_TITLE_PATTERNS + SHARE_TITLE_PATTERNS + [r'^տեսնել ավելին', r'^see more', r'^load more',
+                                                                     r'^բեռնել', r'^loading', r'^բեռնում'],
+        },
+        'content': [f'{selector}::text' for selector in (
+            'div.article_content p', '.news_content p', '.content p', '.article_text p', 'div.news_text p',
+            '.main_content p', 'article p', 'div.article_content', '.news_content', '.content', '.article_text',
+            'div.news_text', '.main_content', 'article', 'p')],
+        'clean': {
+            'min_length': 20,
+            'patterns': [
+                r'բաժանորդագր', r'subscribe', r'follow', r'հետևել', r'կիսվել', r'share', r'like', r'comment',
+                r'մեկնաբանություն', r'copyright', r'հեղինակային', r'բոլոր իրավունքները', r'navigation', r'մենյու',
+                r'menu', r'բաժին', r'կատեգորիա', r'category', r'tag', r'թագ', r'read more', r'ավելին', r'continue',
+                r'շարունակել', r'previous', r'next', r'նախորդ', r'հաջորդ', r'advertisement', r'գովազդ', r'sponsor',
+                r'հովանավոր', r'contact', r'կապ', r'email', r'phone', r'հեռախոս', r'footer', r'header', r'sidebar',
+                r'related', r'առնչվող', r'similar', r'նմանատիպ', r'comments', r'feedback', r'հետադարձ', r'login',
+                r'մուտք', r'register', r'գրանցվել', r'search', r'փնտրել', r'որոնում', r'home', r'գլխավոր',
+                r'սկիզբ', r'view all', r'տեսնել բոլորը', r'show more', r'slaq', r'loading', r'բեռնում',
+                r'facebook', r'twitter', r'instagram', r'youtube', r'telegram', r'http', r'www\.', r'\.com',
+                r'\.am', r'\.org', r'տեսնել ավելին', r'see more', r'load more', r'բեռնել', r'download', r'click',
+                r'սեղմել',
+            ],
+            'max_special_ratio': 0.4,
+            'skip_upper': True,
+            'min_alnum_ratio': 0.6,
+        },
+        'max_parts': 15,
+        'join': " ",
+        'min_content_length': 30,
+        'date': [],
+    },
+}
+
+SITES['sputnik'] = {
+    'class_name': 'SputnikSpider',
+    'label': 'SPUTNIK ARMENIA',
+    'allowed_domains': ['arm.sputniknews.ru'],
+    'start_urls': ['https://arm.sputniknews.ru/'],
+    'listing': {
+        'articles': 'a.cell-list__item',
+        'link': '::attr(href)',
+        'title': 'span.cell-list__item-title::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article__title::text', '.article-title::text', '.entry-title::text',
+                  '.post-title::text', '.title::text', '.news-title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.article__text ::text', 'div.article__body ::text', 'div.article-content ::text',
+                    'article ::text', '.entry-content ::text', '.post-content ::text', '.content ::text',
+                    '.main-content ::text', '.news-content ::text', '.text ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.article__date::text', '.date::text', '.publish-date::text',
+                 '.post-date::text', '.timestamp::text', 'span[data-unixtime]::attr(data-unixtime)'],
+    },
+}
+
+SITES['tiv1'] = {
+    'class_name': 'Tiv1Spider',
+    'label': 'TIV1.AM',
+    'allowed_domains': ['tiv1.am'],
+    'start_urls': ['https://tiv1.am/'],
+    'listing': {
+        'articles': "a[href*='tiv1.am/'][href$='.html']",
+        'link': '::attr(href)',
+        'title': 'div.text-xs.font-normal.leading-none.line-clamp-3::text',
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text', '.content ::text',
+                    'article ::text', '.main-content ::text', '.wp-content ::text', '.post-body ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', r'div.leading-none.text-\[10px\].font-light::text',
+                 '.publish-date::text', '.post-date::text', '.entry-date::text'],
+    },
+}
+
+SITES['times'] = {
+    'class_name': 'TimesSpider',
+    'label': 'TIMES.AM',
+    'allowed_domains': ['times.am'],
+    'start_urls': ['https://times.am/'],
+    'listing': {
+        'articles': 'div.sidebar-news',
+        'link': ['h3 a::attr(href)', 'a::attr(href)'],
+        'title': ['h3 a::text', 'a::text'],
+        # No sidebar: the article cards of the main sections
+        'fallback': {
+            'articles': ['article', 'div.news-item'],
+            'link': ['h3 a::attr(href)', 'a::attr(href)'],
+            'title': ['h3 a::text', 'a::text'],
+        },
+    },
+    'article': {
+        'title': ['h1::text', '.post-title::text', '.entry-title::text', '.article-title::text', 'h1.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.post-content ::text', 'div.entry-content ::text', '.article-content ::text',
+                    '.content ::text', 'article ::text', '.main-content ::text', 'div.post-body ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.meta-date::text'],
+    },
+}
+
+SITES['yerevan_today'] = {
+    'class_name': 'YerevanTodaySpider',
+    'label': 'YEREVAN.TODAY',
+    'allowed_domains': ['yerevan.today'],
+    'start_urls': ['https://yerevan.today/'],
+    'listing': {
+        'articles': 'article.et_pb_post',
+        'link': 'h2.entry-title a::attr(href)',
+        'title': 'h2.entry-title a::text',
+    },
+    'article': {
+        'title': ['h1.entry-title::text', 'h1::text', '.entry-title::text', '.post-title::text',
+                  '.article-title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text', '.content ::text',
+                    'article ::text', '.main-content ::text', 'p::text'],
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.published::text', '.post-date::text',
+                 'span.published.gag2::text'],
+    },
+}
+
+SITES['yerkir'] = {
+    'class_name': 'YerkirSpider',
+    'label': 'YERKIR.AM',
+    'allowed_domains': ['yerkir.am'],
+    'start_urls': ['https://yerkir.am/'],
+    'cache_prefix': 'yerkir_article:',
+    'listing': {
+        'articles': 'ul#ajaxfeed li a.lrahos-link.ajaxlink',
+        'link': '::attr(href)',
+        'title': ['div.lrahos-bigtext div:nth-child(2)::text', 'div.lrahos-bigtext div::text', 'div.titler a::text'],
+    },
+    'article': {
+        'prefer_listing_title': True,
+        'container': ['.single-content, .entry-content, .article-content, .news-content, .post-content, '
+                      '.content-area'],
+        'container_content': ['p::text', 'div::text'],
+        'content': ['article p::text', '.main p::text', '.main-content p::text', '.content p::text',
+                    '.news-body p::text', '.article-text p::text', '.article-body p::text',
+                    '.single-post-content p::text', '.post-body p::text', 'p::text'],
+        'clean': {
+            'min_length': 16,
+            'skip_digits': True,
+            'prefixes': ['բաժին', 'մենյու', 'navigation', 'menu', 'կիսվել', 'share', 'tags', 'category', 'կարծիք',
+                         'մեկնաբանություն'],
+            'exact': ['read more', 'ավելին', 'continue reading', 'կարդալ ավելին', 'source', 'منبع', 'աղբյուր'],
+            # Breadcrumbs and arrow navigation
+            'patterns': [r'(\|.*){3}', r'(».*){2}', r'(→.*){2}'],
+        },
+        'join': ' ',
+        'stop_at': (1, 5000),
+        'date': [],
+    },
+}
+
+SITES['yn'] = {
+    'class_name': 'YnSpider',
+    'label': 'YN.AM',
+    'allowed_domains': ['yn.am'],
+    'start_urls': ['https://yn.am/?l=am'],
+    'listing': {
+        'articles': 'div.timeLine a',
+        'limit': 15,
+        'link': '::attr(href)',
+        # Text of the span after its <time> element
+        'title': 'span::text',
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text', '.content ::text',
+                    'article ::text', '.main-content ::text', '.news-content ::text', '.text ::text',
+                    '.mainText ::text', 'p::text'],
+    },
+}
+
+SITES['zham'] = {
+    'class_name': 'ZhamSpider',
+    'label': 'ZHAM.AM',
+    'allowed_domains': ['zham.am'],
+    'start_urls': ['https://zham.am/?l=am'],
+    'listing': {
+        'articles': 'div.timeline a.timelineUnit',
+        'limit': 15,
+        'link': '::attr(href)',
+        'title': 'span::text',
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'content': ['div.entry-content ::text', '.post-content ::text', '.article-content ::text', '.content ::text',
+                    'article ::text', '.main-content ::text', '.news-content ::text', '.text ::text', 'p::text'],
+    },
+}
+
+# Whole-fragment stop list of the azatutyun / 1lurer / reopen cleaners: page text is read node by
+# node there, so single UI words come through as fragments of their own
+STANDALONE_FRAGMENTS = [
+    # Print and share
+    'տպել', 'տպել էջը', 'տպել հոդվածը', 'print', 'share', 'share this article', 'կիսվել', 'կիսվել սա',
+    'կիսվել facebook', 'կիսվել twitter', 'կիսվել telegram', 'facebook', 'twitter', 'telegram', 'whatsapp',
+    'linkedin', 'instagram',
+    # Footer and copyright
+    'copyright', 'հեղինակային իրավունք', 'բոլոր իրավունքները պաշտպանված են', 'all rights reserved',
+    # Ads
+    'գովազդ', 'advertisement', 'ads', 'sponsored', 'sponsored content', 'անվճար', 'զեղչ', 'առաջարկ', 'ակցիա',
+    'special offer', 'free', 'discount', 'sale', 'promo', 'promotion',
+    # Comments and rating
+    'մեկնաբանություններ', 'comments', 'comment', 'reply', 'replies', 'like', 'dislike', 'հավանել', 'չհավանել',
+    'rating', 'rate',
+    # Navigation
+    'գլխավոր', 'մեկանավոր', 'home', 'main', 'menu', 'navigation', 'բաժին', 'բաժիններ', 'category', 'categories',
+    'section', 'sections', 'պիտակներ', 'tags', 'tag', 'archive', 'archives', 'ավելի', 'ավելի շատ', 'կարդալ ավելի',
+    'more', 'read more', 'continue reading', 'նախորդ', 'հաջորդ', 'previous', 'next', 'back', 'forward',
+    'վերադառնալ', 'վերցնել', 'return', 'go back', 'back to',
+    # Contact, subscription, search
+    'կապ', 'կապնվել', 'գրանցվել', 'բաժանորդագրվել', 'contact', 'subscribe', 'subscription', 'newsletter', 'email',
+    'էլ. փոստ', 'հասցե', 'address', 'փնտրել', 'search', 'filter', 'sort', 'տեսակավորել', 'ֆիլտր',
+    # Status messages
+    'loading', 'բեռնվում', 'please wait', 'սպասել', 'error', 'սխալ', 'success', 'հաջողություն', 'warning',
+    'նախազգուշացում',
+    # Legal
+    'terms', 'conditions', 'privacy', 'policy', 'legal', 'disclaimer', 'պայմաններ', 'գաղտնիություն',
+    'քաղաքականություն', 'իրավական',
+    # Media controls and pagination
+    'play', 'pause', 'stop', 'volume', 'mute', 'fullscreen', 'նվագարկել', 'դադարեցնել', 'կանգնել', 'ձայն', 'լռել',
+    'page', 'pages', 'էջ', 'էջեր', 'next page', 'previous page', 'հաջորդ էջ', 'նախորդ էջ', 'first', 'last',
+    'առաջին', 'վերջին',
+]
+
+# Dates, weather, technical leftovers and form buttons (azatutyun and 1lurer)
+STANDALONE_WIDGETS = [
+    'ամսաթիվ', 'date', 'time', 'ժամ', 'րոպե', 'վայրկյան', 'հունվար', 'փետրվար', 'մարտ', 'ապրիլ', 'մայիս',
+    'հունիս', 'հուլիս', 'օգոստոս', 'սեպտեմբեր', 'հոկտեմբեր', 'նոյեմբեր', 'դեկտեմբեր', 'january',
+    'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october', 'november',
+    'december', 'եղանակ', 'weather', 'temperature', 'ջերմություն', 'անձրև', 'rain', 'արև', 'sun', 'wind',
+    'քամի', 'snow', 'ձյուն',
+    'html', 'css', 'javascript', 'jquery', 'bootstrap', 'meta', 'script', 'api', 'url', 'http', 'https',
+    'www', 'com', 'org', 'ուղարկել', 'submit', 'send', 'save', 'պահպանել', 'cancel', 'չեղարկել',
+    'հատված', 'մասնակ', 'սկիզբ', 'վերջ', 'մեջ', 'part', 'segment', 'start', 'end', 'middle',
+]
+
+STANDALONE_CLEAN = {
+    'min_length': 3,
+    'exact': STANDALONE_FRAGMENTS,
+    # Numbers, dates and punctuation only
+    'patterns': [r'^[0-9\s\-\.\,\:\;]+$'],
+    'max_symbol_ratio': 0.5,
+    # Short all-caps headings and navigation
+    'short_upper': 20,
+}
+
+# Site name and separator left around the headline
+STANDALONE_TITLE_EDGES = r'^[\s\-|:–—»«]+|[\s\-|:–—»«]+$'
+STANDALONE_SEPARATORS = r'[\s\-|:–—»«]*'
+
+SITES['azatutyun'] = {
+    'class_name': 'AzatutyunSpider',
+    'label': 'AZATUTYUN.AM',
+    'allowed_domains': ['azatutyun.am'],
+    'start_urls': ['https://www.azatutyun.am/'],
+    'listing': {
+        'articles': 'div.row ul li div.media-block',
+        'limit': 15,
+        'link': 'a::attr(href)',
+        'title': 'h4.media-block__title::text',
+    },
+    'article': {
+        'title': ['h1::text', '.wsw h1::text', '.content-header h1::text', '.article-title::text',
+                  '.entry-title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'^(?:azatutyun\.am|azatutyun|ազատություն|ազատ եվրոպա|rfe/rl|radio free europe)'
+                        + STANDALONE_SEPARATORS,
+                        STANDALONE_SEPARATORS
+                        + r'(?:azatutyun\.am|azatutyun|ազատություն|ազատ եվրոպա|rfe/rl|radio free europe)$',
+                        STANDALONE_TITLE_EDGES],
+        'title_rules': {'min_length': 5},
+        'content': [f'{selector} ::text' for selector in (
+            'div.wsw', 'div.content', 'div.article-content', 'div.entry-content', 'article', 'div.main-content',
+            'div.post-content', "div[class*='content']", "div[id*='content']", 'main', 'section.content')] + ['p::text'],
+        'clean': dict(STANDALONE_CLEAN, exact=STANDALONE_FRAGMENTS + STANDALONE_WIDGETS + [
+            # Branding
+            '© azatutyun', 'azatutyun.am', 'azatutyun', 'ազատություն', 'ազատությունը', 'ազատ եվրոպա', 'rfe/rl', 'rfe',
+            'radio free europe', 'radio liberty', 'ռադիո ազատություն', 'ռադիո ազատ եվրոպա', 'ազատական', 'ազատ',
+            'եվրոպա', 'ռադիո', 'liberty', 'radio free',
+        ]),
+        'min_content_length': 50,
+        'min_words': 10,
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.entry-date::text', '.media-block__date::text'],
+    },
+}
+
+# Script, style and markup words the 1lurer page text is full of, as whole fragments
+ONETV_CODE_FRAGMENTS = [
+    'function', 'div', 'span', 'class', 'document', 'window', 'console', 'log', 'warn', 'info', 'async',
+    'await', 'promise', 'then', 'catch', 'try', 'if(', 'else', 'for(', 'while(', 'switch(', 'case', 'break',
+    'continue', 'array', 'object', 'string', 'number', 'boolean', 'null', 'undefined', 'true', 'false', 'this.',
+    'prototype', 'extends', 'super', 'import', 'export', 'from', 'default', 'module', 'require', 'onclick',
+    'onload', 'onchange', 'onsubmit', 'onmouseover', 'onmouseout', 'style=', 'class=', 'id=', 'href=', 'src=',
+    'alt=', 'title=', 'rem', 'auto', 'none', 'block', 'inline', 'flex', 'margin', 'padding', 'border',
+    'background', 'color', 'font', 'text', 'width', 'height', 'top', 'left', 'right', 'bottom', 'position',
+    'absolute', 'relative', 'fixed', 'static', 'z-index', 'opacity', 'display', 'visibility', 'overflow',
+    'float', 'clear', 'vertical-align', 'text-align', 'line-height', 'letter-spacing', 'word-spacing',
+    'text-decoration', 'text-transform', 'white-space', 'word-wrap', 'box-sizing', 'border-radius',
+    'box-shadow', 'transition', 'transform', 'animation', 'keyframes', 'linear', 'ease', 'cubic-bezier', 'rgba',
+    'rgb', 'hsl', 'hsla', 'hex', '#fff', '#000', '#ccc', 'important', '!important', 'inherit', 'initial',
+    'unset', 'media', 'screen', 'max-width', 'min-width', 'max-height', 'min-height', 'hover', 'active',
+    'focus', 'visited', 'first-child', 'last-child', 'nth-child', 'before', 'after', 'content', 'counter',
+    'quotes', 'list-style', 'table', 'thead', 'tbody', 'caption', 'border-collapse', 'border-spacing',
+    'empty-cells', 'table-layout', 'caption-side', '<div', '</div>', '<span', '</span>', '<p>', '</p>', '</a>',
+    '<img', '<br>', '<hr>', '<ul>', '</ul>', '<li>', '</li>', '<h1>', '</h1>', '<h2>', '</h2>', '<h3>', '</h3>',
+    '<h4>', '</h4>', '<h5>', '</h5>', '<h6>', '</h6>', '<strong>', '</strong>', '<em>', '</em>', '<b>', '</b>',
+    '<i>', '</i>', '<u>', '</u>', '<small>', '</small>', '<big>', '</big>', '<sub>', '</sub>', '<sup>',
+    '</sup>', '<del>', '</del>', '<ins>', '</ins>', '<code>', '</code>', '<pre>', '</pre>', '<blockquote>',
+    '</blockquote>', '<cite>', '</cite>', '<q>', '</q>', '<abbr>', '</abbr>', '<acronym>', '</acronym>',
+    '<address>', '</address>', '<bdo>', '</bdo>', '<kbd>', '</kbd>', '<samp>', '</samp>', '<var>', '</var>',
+    '<dfn>', '</dfn>', '<caption>', '</caption>', '.class', '#id', 'nth-of-type', 'first-of-type',
+    'last-of-type', 'only-child', 'only-of-type', 'empty', 'root', 'target', 'enabled', 'disabled', 'checked',
+    'indeterminate', 'valid', 'invalid', 'required', 'optional', 'read-only', 'read-write', 'lang', 'dir',
+    'not', 'matches', 'where', 'has', 'react', 'angular', 'vue', 'svelte', 'ember', 'backbone', 'underscore',
+    'lodash', 'moment', 'axios', 'fetch', 'ajax', 'json', 'xml', 'endpoint', 'uri', 'get', 'post', 'put',
+    'delete', 'patch', 'options', 'head', 'status', 'response', 'request', 'header', 'body', 'params', 'query',
+    'path', 'route', 'router', 'middleware', 'controller', 'model', 'view', 'template', 'component',
+    'directive', 'service', 'factory', 'provider', 'injector', 'dependency', 'injection', 'observable',
+    'callback', 'event', 'listener', 'emit', 'dispatch', 'unsubscribe', 'observer', 'state', 'props', 'context',
+    'ref', 'key', 'index', 'map', 'reduce', 'find', 'some', 'every', 'includes', 'slice', 'splice', 'push',
+    'pop', 'shift', 'unshift', 'reverse', 'concat', 'join', 'split', 'replace', 'match', 'test', 'exec',
+    'constructor', 'call', 'apply', 'bind', 'arguments', 'callee', 'caller', 'length', 'name', 'eval', 'escape',
+    'unescape', 'alert', 'confirm', 'prompt', 'open', 'close', 'blur', 'scroll', 'history', 'location',
+    'navigator', 'frames', 'parent', 'self', 'opener', 'closed', 'toolbar', 'menubar', 'scrollbars',
+    'locationbar', 'statusbar', 'directories', 'personalbar', 'external',
+]
+
+SITES['onetv'] = {
+    'class_name': 'OnetvSpider',
+    'label': '1LURER.AM',
+    'allowed_domains': ['1lurer.am'],
+    'start_urls': ['https://www.1lurer.am/hy'],
+    # The news-feed pages are very long; the first 15 items and the article body come early
+    'download': {'max_bytes': 768 * 1024},
+    'listing': {
+        'articles': 'ul.news-feed__list li.news-feed__item',
+        'limit': 15,
+        'link': 'a.news-feed__link::attr(href)',
+        'title': 'span.news-feed__title::text',
+        # Old pinned stories stay at the top of the feed; their date drops them before download
+        'date': 'span.news-feed__date::text',
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  '.news-title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'^(?:1lurer\.am|1lurer|առաջին լուրեր|հեռուստատեսություն)' + STANDALONE_SEPARATORS,
+                        STANDALONE_SEPARATORS + r'(?:1lurer\.am|1lurer|առաջին լուրեր|հեռուստատեսություն|tv|news)$',
+                        STANDALONE_TITLE_EDGES],
+        'title_rules': {'min_length': 5},
+        # Paragraphs of the article body; the whole page text only when there are none
+        'content': ['article p::text', 'div.entry-content p::text', '.post-content p::text',
+                    '.article-content p::text', '.content p::text', '.main-content p::text', '.news-content p::text',
+                    '.news-body p::text', '.article-body p::text', '.post-body p::text', '.text-content p::text',
+                    'article div.text::text', 'div.entry-content div.text::text', '.post-content div.text::text',
+                    '.article-content div.text::text', 'p::text', 'body ::text'],
+        'min_parts': 2,
+        'clean': dict(STANDALONE_CLEAN, skip_code=True, exact=STANDALONE_FRAGMENTS + STANDALONE_WIDGETS
+                      + ONETV_CODE_FRAGMENTS + [
+            '© 1lurer', '1lurer.am', '1lurer', 'առաջին լուրեր', 'նորություններ', 'հեռուստատեսություն', 'tv',
+            'news', 'channel', 'ալիք', 'խմբագիր', 'լրագրող', 'հեղինակ', 'tv channel', 'news-feed',
+            'feed', 'list', 'item', 'news-feed__list', 'news-feed__item', 'news-feed__link',
+            'news-feed__title', 'news-feed__time', 'news-feed__date',
+        ]),
+        'min_content_length': 50,
+        'min_words': 10,
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.entry-date::text'],
+    },
+}
+
+SITES['reopen'] = {
+    'class_name': 'ReopenSpider',
+    'label': 'REOPEN.MEDIA',
+    'allowed_domains': ['reopen.media'],
+    'start_urls': ['https://reopen.media/hy-am'],
+    'listing': {
+        'articles': "a[href*='/hy-am/articles/']",
+        'limit': 15,
+        'link': '::attr(href)',
+        'title': '::text',
+    },
+    'article': {
+        'title': ['h1::text', '.article-title::text', '.entry-title::text', '.post-title::text',
+                  '.content-title::text', '.title::text', "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r'^(?:reopen\.media|reopen|վերաբացում\.մեդիա|վերաբացում)' + STANDALONE_SEPARATORS,
+                        STANDALONE_SEPARATORS + r'(?:reopen\.media|reopen|վերաբացում\.մեդիա|վերաբացում)$',
+                        STANDALONE_TITLE_EDGES],
+        'title_rules': {'min_length': 5},
+        'content': ['article p::text', 'div.prose p::text', '.content p::text', '.article-content p::text',
+                    '.entry-content p::text', '.post-content p::text', '.main-content p::text',
+                    '.article-body p::text', '.post-body p::text', '.text-content p::text',
+                    'article div.text::text', 'div.prose div.text::text', '.content div.text::text',
+                    '.article-content div.text::text', 'main p::text', 'section p::text', 'p::text', 'main ::text',
+                    'body ::text'],
+        'min_parts': 2,
+        'clean': dict(STANDALONE_CLEAN, skip_code=True, exact=STANDALONE_FRAGMENTS + [
+            '© reopen', 'reopen.media', 'reopen', 'վերաբացում', 'վերաբացում.մեդիա', 'լրատվություն', 'տեղեկություն',
+            'լուրեր', 'news', 'media', 'independent media', 'անկախ լրատվական', 'մեդիա կազմակերպություն',
+            'investigative journalism', 'քննարկողական լրագրություն',
+            # Script and markup words left as text nodes
+            'javascript', 'js', 'jquery', 'function', 'return', 'html', 'css', 'bootstrap', 'meta', 'script', 'div',
+            'span', 'class', 'document', 'window', 'console', 'log', 'error', 'warn', 'info',
+            # Class names of the article list
+            'article-list', 'article-item', 'article-link', 'article-title', 'article-time', 'article-date', 'prose',
+            'text-sm', 'text-card-foreground',
+        ]),
+        'min_content_length': 50,
+        'min_words': 10,
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', 'span.text-sm.text-card-foreground::text',
+                 '.publish-date::text', '.post-date::text', '.entry-date::text'],
+    },
+}
+
+SITES['shabat'] = {
+    'module': 'news_scraper.spiders.shabat',
+    'class_name': 'ShabatSpider',
+    'label': 'SHABAT.NEWS',
+    'allowed_domains': ['shabat.news'],
+    'start_urls': ['https://shabat.news/', 'https://shabat.news/am/'],
+    'settings': {
+        'DOWNLOAD_DELAY': 2,
+        'RANDOMIZE_DOWNLOAD_DELAY': 1,
+        'RETRY_TIMES': 3,
+        'RETRY_HTTP_CODES': [500, 502, 503, 504, 408, 429, 403],
+        'HTTPERROR_ALLOWED_CODES': [403, 404],
+        'COOKIES_ENABLED': True,
+        'CONCURRENT_REQUESTS': 2,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 1,
+        'DEFAULT_REQUEST_HEADERS': {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+            'Accept-Language': 'hy-AM,hy;q=0.9,en;q=0.8,ru;q=0.7',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'DNT': '1',
+            'Cache-Control': 'max-age=0',
+        },
+    },
+    'listing': {
+        'articles': ['div.artcl', 'div.artcl-list div.artcl', 'section.list-section div.artcl'],
+        'link': 'a::attr(href)',
+        'title': 'h1::text',
+        'meta': {'list_date': 'h2::text', 'preview_text': 'p::text'},
+    },
+    'article': {
+        'title': ['h1.article-title::text', 'h1.post-title::text', 'h1.entry-title::text', 'h1.title::text',
+                  'h1::text', '.article-title::text', '.post-title::text', '.entry-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r' [-|] Shabat\.am', r' [-|] shabat\.news'],
+        'title_rules': {'min_length': 6},
+        'content': ['div.article-content p::text', 'div.post-content p::text', 'div.entry-content p::text',
+                    'div.content p::text', 'div.article-body p::text', 'div.text-content p::text',
+                    'div.text p::text', 'article p::text', 'div.main-content p::text', '.article-content p::text',
+                    '.post-content p::text', '.entry-content p::text', '.content p::text', '.article-body p::text',
+                    '.text-content p::text', '.text p::text', '.main-content p::text', 'p::text'],
+        'clean': {
+            'min_length': 2,
+            'exact': ["•", "›", "→", "←", "↑", "↓", "▪", "▫", "■", "□", "◆", "◇", "○", "●",
+                      "share", "facebook", "twitter", "instagram", "youtube", "telegram", "whatsapp", "viber",
+                      "like", "comment", "follow", "subscribe", "կիսվել", "հավանել", "տարածել",
+                      "կարդալ ավելին", "ցույց տալ", "բացել", "սեղմել", "մուտք", "ելք", "գնալ",
+                      "shabat.news", "shabat.am", "shabat", "շաբաթ", "© 2024", "© 2023", "© shabat", "copyright",
+                      "գովազդ", "advertisement", "click here", "այստեղ սեղմել", "կարդալ ամբողջը",
+                      "loading", "error", "բեռնում", "սխալ", "որոնում", "search", "մենյու", "menu"],
+            'min_alnum_ratio': 0.1,
+            # No letters at all: numbers, dates, punctuation
+            'patterns': [r'^[^a-zA-Zա-ֆԱ-Ֆа-яА-Я]*$'],
+        },
+        'min_content_length': 30,
+        'min_words': 5,
+        'date': ['time::attr(datetime)', 'time::text', '.article-date::text', '.post-date::text', '.date::text'],
+        'date_meta': 'list_date',
+    },
+}
+
+SITES['oratert'] = {
+    'class_name': 'OratertSpider',
+    'label': 'ORATERT.AM',
+    'allowed_domains': ['oratert.am'],
+    'start_urls': ['https://oratert.am/'],
+    'settings': {
+        'USER_AGENT': CHROME_91,
+        'DEFAULT_REQUEST_HEADERS': ARMENIAN_HEADERS,
+    },
+    'listing': {
+        'articles': "div.timeline a[href*='/article/']",
+        'limit': 15,
+        'link': '::attr(href)',
+        'title': 'span::text',
+        'meta': {'date_text': 'time::attr(datetime)'},
+    },
+    'article': {
+        'title': ['h1::text', '.entry-title::text', '.post-title::text', '.article-title::text', '.title::text',
+                  "meta[property='og:title']::attr(content)", 'title::text'],
+        'title_strip': [r' [-|] Oratert\.am', r' [-|] Oratert'],
+        'container': ['div.entry-content', '.post-content', '.article-content', '.content', 'article',
+                      '.main-content', '.news-content'],
+        'container_content': ['p::text', 'div > *::text'],
+        'min_parts': 2,
+        'clean': {
+            'min_length': 10,
+            'contains': ["share", "facebook", "twitter", "telegram", "հետևեք", "կիսվել", "հեղինակային",
+                         "պաշտպանված", "copyright", "oratert", "կայքէջի", "վերարտադրումը", "արգելվում է",
+                         "կարդալ ավելին", "տեսնել ավելին", "ցույց տալ", "սեղմել", "մուտք", "ելք",
+                         "բոլոր իրավունքները", "պահպանված", "ստեղծված", "sargssyan", "կայքի պատրաստում",
+                         "սպասարկում", "գովազդ", "գովազդատուներին",
+                         # Teasers of other articles are truncated
+                         "[…]", "..."],
+        },
+        'stop_at': (5, 300),
+        'min_content_length': 100,
+        'min_words': 20,
+        'date_meta': 'date_text',
+        'date': ['time::attr(datetime)', 'time::text', '.date::text', '.publish-date::text', '.post-date::text',
+                 '.entry-date::text', '.article-date::text', '.news-date::text', '[class*="date"]::text'],
+    },
+}
@@ -0,0 +1,54 @@
+# Spider loader that imports only the spider being run
+#
+# Resolves names through news_scraper.manifest instead of walking SPIDER_MODULES, so a crawl
+# builds one SiteSpider class (or imports one bespoke module) rather than all of them.
+
+from importlib import import_module
+
+from scrapy.interfaces import ISpiderLoader
+from scrapy.utils.url import url_is_from_any_domain
+from zope.interface import implementer
+
+from news_scraper.engine import build_spider_class
+from news_scraper.manifest import REGISTRY_MODULE, spider_manifest
+from news_scraper.sites import SITES
+
+
+@implementer(ISpiderLoader)
+class ManifestSpiderLoader:
+    """Scrapy SPIDER_LOADER_CLASS backed by the spider manifest"""
+
+    def __init__(self, settings):
+        self._manifest = spider_manifest()
+        self._spiders = {}
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(settings)
+
+    def load(self, spider_name):
+        """Return the Spider class for the given spider name; KeyError if there is none"""
+        if spider_name in self._spiders:
+            return self._spiders[spider_name]
+        try:
+            module, class_name = self._manifest[spider_name]
+        except KeyError:
+            raise KeyError(f"Spider not found: {spider_name}")
+        if module == REGISTRY_MODULE:
+            spider_cls = build_spider_class(spider_name, SITES[spider_name], module)
+        else:
+            spider_cls = getattr(import_module(module), class_name)
+        if spider_cls.name != spider_name:
+            raise KeyError(f"Spider {module}.{class_name} is named {spider_cls.name!r}, not {spider_name!r}")
+        self._spiders[spider_name] = spider_cls
+        return spider_cls
+
+    def find_by_request(self, request):
+        """Names of the spiders whose allowed domains cover the request URL"""
+        return [
+            name for name in self._manifest
+            if url_is_from_any_domain(request.url, SITES[name]['allowed_domains'])
+        ]
+
+    def list(self):
+        return list(self._manifest)
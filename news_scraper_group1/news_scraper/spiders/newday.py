@@ -1,390 +0,0 @@
-import scrapy
-from news_scraper.items import NewsScraperItem
-import sys
-import os
-import hashlib
-import requests
-import redis
-from datetime import datetime
-
-    
-
-class NewDaySpider(scrapy.Spider):
-    name = "newday"
-    allowed_domains = ["newday.am"]
-    start_urls = ["https://newday.am/"]
-    
-    # Add duplicate_articles attribute
-    duplicate_articles = 0
-    
-    # Add custom headers to bypass potential blocking
-    custom_settings = {
-        'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'DEFAULT_REQUEST_HEADERS': {
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-    }
-
-    def __init__(self, *args, **kwargs):
-        super(NewDaySpider, self).__init__(*args, **kwargs)
-        
-        # Redis connection
-        try:
-            self.redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
-            self.redis_client.ping()
-            self.logger.info("🔴 Redis կապակցված է")
-        except Exception as e:
-            self.logger.warning(f"🔴 Redis չկա, կաշխատի առանց cache: {e}")
-            self.redis_client = None
-
-        # API client
-        self.api_base_url = "https://beackkayq.onrender.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'NewsMonitor/1.0'
-        })
-        
-        # Load keywords via API
-        try:
-            response = self.session.get(f"{self.api_base_url}/api/keywords/", timeout=10)
-            if response.status_code == 200:
-                keywords_data = response.json()
-                self.keywords = [kw.get('word', '').lower() for kw in keywords_data]
-                self.logger.info(f"🔑 Բանալի բառեր: {', '.join(self.keywords) if self.keywords else 'Չկա (բոլոր հոդվածները)'}")
-            else:
-                self.logger.warning(f"API keywords error: {response.status_code}")
-                self.keywords = []
-        except Exception as e:
-            self.logger.warning(f"Բանալի բառերը չհաջողվեց բեռնել: {e}")
-            self.keywords = []
-
-        # Statistics
-        self.processed_articles = 0
-        self.new_articles = 0
-        self.cached_skips = 0
-        self.duplicate_articles = 0
-
-    def is_article_processed(self, url, title):
-        """Check if article was already processed using Redis cache"""
-        if not self.redis_client:
-            return False
-        # Create unique hash for article
-        article_hash = hashlib.md5(f"{url}:{title}".encode()).hexdigest()
-        cache_key = f"processed_newday:{article_hash}"
-        return self.redis_client.exists(cache_key)
-
-    def mark_article_processed(self, url, title):
-        """Mark article as processed in Redis cache"""
-        if not self.redis_client:
-            return
-        # Create unique hash for article
-        article_hash = hashlib.md5(f"{url}:{title}".encode()).hexdigest()
-        cache_key = f"processed_newday:{article_hash}"
-        # Mark as processed (expire in 7 days)
-        self.redis_client.setex(cache_key, 604800, "1")
-
-    def article_contains_keyword(self, article_text):
-        if not article_text:
-            return False
-        if not self.keywords:  # If no keywords, scrape all articles
-            return True
-        for keyword in self.keywords:
-            if keyword in article_text.lower():
-                return True
-        return False
-
-    def parse(self, response):
-        # Extract articles using multiple selectors to ensure we get the latest
-        articles = []
-        
-        # Try multiple selectors to find the latest articles
-        article_selectors = [
-            "article.elementor-post.elementor-grid-item",  # Main grid items
-            ".elementor-post",  # Alternative elementor posts
-            "article.post",  # Standard post articles
-            ".post-item",  # Post items
-            "article"  # Generic articles
-        ]
-        
-        for selector in article_selectors:
-            found_articles = response.css(selector)
-            if found_articles:
-                articles = found_articles
-                self.logger.info(f"🔍 Օգտագործված selector: {selector} - գտնվել է {len(articles)} հոդված")
-                break
-        
-        # If no articles found, log for debugging
-        if not articles:
-            self.logger.warning("❌ Հոդվածներ չգտնվեցին: Փորձում ենք այլ մեթոդով...")
-            # Try to find any links that might be articles
-            all_links = response.css("a[href]")
-            article_links = []
-            for link in all_links:
-                href = link.css("::attr(href)").get()
-                text = link.css("::text").get()
-                if href and text and len(text.strip()) > 20:  # Substantial text
-                    article_links.append(link)
-            
-            if article_links:
-                self.logger.info(f"🔍 Գտնվել է {len(article_links)} հնարավոր հոդված հղում")
-                # Process only the first 10 potential articles
-                for i, link in enumerate(article_links[:10]):
-                    href = link.css("::attr(href)").get()
-                    title_preview = link.css("::text").get()
-                    
-                    if href and title_preview:
-                        full_url = response.urljoin(href)
-                        
-                        # Check Redis cache first
-                        if self.is_article_processed(full_url, title_preview):
-                            self.cached_skips += 1
-                            continue
-                            
-                        yield scrapy.Request(full_url, callback=self.parse_article)
-                return
-        
-        # Sort articles by date if possible - try to find date elements
-        articles_with_dates = []
-        for article in articles:
-            # Try to extract date from article
-            date_selectors = [
-                "time::attr(datetime)",
-                "time::text",
-                ".elementor-post-date::text",
-                ".date::text",
-                ".post-date::text",
-                "[class*='date']::text"
-            ]
-            
-            article_date = None
-            for date_selector in date_selectors:
-                date_text = article.css(date_selector).get()
-                if date_text:
-                    article_date = date_text
-                    break
-            
-            articles_with_dates.append((article, article_date))
-        
-        # Sort by date if we found dates (most recent first)
-        if any(date for _, date in articles_with_dates):
-            try:
-                articles_with_dates.sort(key=lambda x: x[1] or "", reverse=True)
-                articles = [article for article, _ in articles_with_dates]
-                self.logger.info("📅 Հոդվածները դասավորված են ամսաթվի ըստ (նորագույնից)")
-            except Exception as e:
-                self.logger.warning(f"⚠️ Ամսաթվի ըստ դասավորումը չհաջողվեց: {e}")
-        
-        # Optimize: limit to only latest 10 articles
-        articles = articles[:10]
-        
-        self.logger.info(f"📰 Վերջնական: {len(articles)} հոդված կստուգվի (սահմանափակված 10-ով)")
-
-        for i, article in enumerate(articles):
-            # Extract link and title using Elementor structure
-            link = (article.css("h3.elementor-post__title a::attr(href)").get() or
-                   article.css("h2.elementor-post__title a::attr(href)").get() or
-                   article.css(".elementor-post__title a::attr(href)").get() or
-                   article.css("a::attr(href)").get())
-            
-            title_preview = (article.css("h3.elementor-post__title a::text").get() or
-                           article.css("h2.elementor-post__title a::text").get() or
-                           article.css(".elementor-post__title a::text").get() or
-                           article.css("h1::text").get() or
-                           article.css("h2::text").get() or
-                           article.css("h3::text").get())
-            
-            if link and title_preview:
-                full_url = response.urljoin(link)
-                
-                # Check Redis cache first
-                if self.is_article_processed(full_url, title_preview):
-                    self.cached_skips += 1
-                    continue
-                    
-                self.logger.info(f"🔗 [{i+1}] {title_preview[:50]}...")
-                yield scrapy.Request(full_url, callback=self.parse_article)
-            else:
-                self.logger.warning(f"❌ Հոդված {i+1}: Հղում կամ վերնագիր չգտնվեց")
-
-    def parse_article(self, response):
-        self.processed_articles += 1
-
-        # Extract title from newday.am article page structure with hierarchy
-        title = None
-        title_selectors = [
-            ".elementor-heading-title::text",
-            "h1.elementor-heading-title::text",
-            "h2.elementor-heading-title::text", 
-            "h3.elementor-heading-title::text",
-            "h1.entry-title::text",
-            "h1.post-title::text",
-            "h1.article-title::text",
-            ".entry-title::text",
-            ".post-title::text",
-            ".article-title::text",
-            "article h1::text",
-            ".main-content h1::text",
-            ".content h1::text",
-            "h1::text",
-            "h2.entry-title::text",
-            "h2.post-title::text",
-            "h2::text",
-            "meta[property='og:title']::attr(content)",
-            "meta[name='title']::attr(content)",
-            "title::text"
-        ]
-        
-        for selector in title_selectors:
-            titles = response.css(selector).getall()
-            # Try all matching titles and pick the first substantial one
-            for potential_title in titles:
-                if potential_title and potential_title.strip():
-                    potential_title = potential_title.strip()
-                    # Filter out the site's general slogan and navigation elements
-                    if (len(potential_title) > 15 and  # Longer titles are more likely to be articles
-                        potential_title.lower() not in ['հավաստի լուրեր', 'reliable news', 'newday.am', 'newday'] and
-                        not potential_title.lower().startswith(('բաժին', 'մենյու', 'section', 'menu', 'home', 'գլխավոր')) and
-                        not potential_title.endswith(('...', '→', '»', '›', 'more', 'ավելին')) and
-                        'newday' not in potential_title.lower() and
-                        not potential_title.lower().startswith(('հավաստի', 'reliable', 'news', 'լուրեր'))):
-                        title = potential_title
-                        break
-            if title:  # If we found a good title, stop searching
-                break
-        
-        # Extract content from newday.am article page structure with improved filtering
-        content_parts = []
-        
-        # Try article-specific content selectors first
-        content_selectors = [
-            "div.entry-content p::text",
-            "div.post-content p::text",
-            "div.article-content p::text",
-            ".entry-content p::text",
-            ".post-content p::text", 
-            ".article-content p::text",
-            ".elementor-widget-container p::text",
-            "article .content p::text",
-            "article p::text",
-            ".main-content p::text",
-            ".content p::text",
-            "p::text"
-        ]
-        
-        for selector in content_selectors:
-            content_parts = response.css(selector).getall()
-            if content_parts and len(content_parts) > 2:  # Need substantial content
-                break
-        
-        # Clean and filter content extensively
-        cleaned_content = []
-        unwanted_fragments = [
-            # Navigation and UI elements
-            '•', '›', '»', '«', '‹', '→', '←', '↑', '↓', '▲', '▼', '◄', '►',
-            # Social media and sharing
-            'share', 'facebook', 'twitter', 'whatsapp', 'telegram', 'viber', 'linkedin',
-            'share on', 'follow us', 'subscribe', 'like us',
-            'կիսվել', 'տարածել', 'ուղարկել', 'պահպանել', 'տպել', 'print',
-            # Navigation terms
-            'գլխավոր', 'մենյու', 'բաժին', 'կատեգորիա', 'ետ', 'առաջ', 'հետ',
-            'home', 'menu', 'back', 'next', 'previous', 'continue', 'section', 'category',
-            # Footer elements
-            'copyright', '©', 'բոլոր իրավունքները', 'all rights reserved',
-            'կայքի իրավունքները', 'terms of use', 'privacy policy', 'legal',
-            # Ads and sponsored content
-            'advertisement', 'sponsored', 'реклама', 'գովազդ', 'promo',
-            # Common website elements
-            'read more', 'ավելին', 'continue reading', 'բացել', 'կարդալ ավելին',
-            'search', 'որոնում', 'login', 'մուտք', 'register', 'գրանցվել',
-            # Subscription and newsletter
-            'subscribe', 'բաժանորդագրություն', 'newsletter', 'email',
-            # Comments and feedback
-            'comment', 'մեկնաբանություն', 'feedback', 'reply', 'պատասխանել',
-            # Source attribution
-            'source:', 'աղբյուր:', 'منبع:', 'источник:', 'via:', 'from:',
-            # Armenian navigation terms
-            'կարդալ ավելին', 'շարունակել', 'կարդալ', 'դիտել',
-            'բոլոր նորությունները', 'այլ նորություններ', 'ամբողջական',
-            # Time/date fragments that are not content
-            'ժամ', 'րոպե', 'օր', 'ամիս', 'տարի', 'am', 'pm',
-            # Website specific elements
-            'newday.am', 'newday', 'new day', 'հավաստի լուրեր', 'reliable news',
-            # Author and byline elements
-            'author:', 'հեղինակ:', 'by:', 'edited by:', 'խմբագիր:',
-            # Rating and voting
-            'rating', 'vote', 'գնահատել', 'քվեարկել',
-            # Tags and categories
-            'tags:', 'պիտակներ:', 'categories:', 'կատեգորիա:',
-            # Related articles
-            'related', 'հարակից', 'նմանատիպ', 'առնչվող',
-            # Elementor specific elements
-            'elementor', 'widget', 'container'
-        ]
-        
-        for part in content_parts:
-            if part and part.strip():
-                text = part.strip()
-                # Filter out unwanted content with comprehensive checks
-                if (len(text) > 10 and  # Minimum meaningful length
-                    not any(unwanted in text.lower() for unwanted in unwanted_fragments) and
-                    not text.isdigit() and  # Not just numbers
-                    not text.lower().startswith(('բաժին', 'մենյու', 'navigation', 'menu', 'home', 'գլխավոր')) and
-                    not text.endswith(('...', '→', '»', '›', 'more', 'ավելին')) and
-                    not text.strip() in ['', '\n', '\t', '\r'] and
-                    not text.startswith(('http://', 'https://')) and  # Not URLs
-                    not text.lower().startswith(('click', 'կտտացնել', 'press', 'սեղմել')) and
-                    len(text.split()) > 2 and  # Must have multiple words
-                    not text.lower().startswith(('follow', 'subscribe', 'like', 'share')) and  # No social media calls
-                    text.lower() not in ['հավաստի լուրեր', 'reliable news']):  # Not site slogan
-                    cleaned_content.append(text)
-        
-        content = "\n".join(cleaned_content[:15])  # Limit to first 15 paragraphs
-
-        # Extract scraped time with newday.am specific selectors
-        scraped_time = (response.css('time::attr(datetime)').get() or
-                       response.css('time::text').get() or 
-                       response.css('.date::text').get() or 
-                       response.css('.elementor-post-date::text').get() or
-                       response.css('.publish-date::text').get() or
-                       response.css('.post-date::text').get() or
-                       response.css('.entry-date::text').get() or
-                       response.css('[class*="date"]::text').get() or
-                       datetime.now().isoformat())
-
-        # Clean title for display
-        display_title = title[:60] + "..." if title and len(title) > 60 else title or "Անանուն հոդված"
-        
-        # Check for keywords in both title and content
-        if self.article_contains_keyword(title) or self.article_contains_keyword(content):
-            self.logger.info(f"✅ Բանալի բառ գտնվեց: {display_title}")
-            # Mark as processed only after successful keyword match
-            self.mark_article_processed(response.url, title)
-            self.new_articles += 1
-            
-            item = NewsScraperItem()
-            item['title'] = title or f'Article from {response.url.split("/")[-1]}'
-            item['link'] = response.url
-            item['source_url'] = response.url
-            item['content'] = content
-            item['scraped_time'] = scraped_time
-            yield item
-        else:
-            self.logger.info(f"❌ Բանալի բառ չգտնվեց: {display_title}")
-            # Mark as processed even if no keyword match to avoid re-checking
-            self.mark_article_processed(response.url, title)
-
-    def closed(self, reason):
-        """Called when spider finishes"""
-        self.logger.info(f"""
-📊 ԱՄՓՈՓՈՒՄ NEWDAY.AM (օպտիմիզացված - միայն 10 հոդված):
-   • Ստուգված հոդվածներ: {self.processed_articles}
-   • Նոր հոդվածներ: {self.new_articles}
-   • Cache-ից բաց թողնված: {self.cached_skips}
-   • Դուպլիկատներ: {self.duplicate_articles}
-   • Սկրիպտի աշխատանքը: ✅ Ավարտված
-        """.strip()) 
\ No newline at end of file
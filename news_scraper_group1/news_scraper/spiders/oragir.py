@@ -1,235 +1,22 @@
-import scrapy
-from news_scraper.items import NewsScraperItem
-import sys
-import os
-import hashlib
-import redis
 from datetime import datetime, timedelta
-import requests
-
-class OragirSpider(scrapy.Spider):
-    name = "oragir"
-    allowed_domains = ["oragir.news"]
-    
-    def start_requests(self):
-        # Try multiple URLs for oragir.news
-        urls = [
-            "https://oragir.news/hy",
-            "https://oragir.news/hy/materials/all",
-            "https://oragir.news/",
-        ]
-        
-        # Add today's date-based URLs
-        today = datetime.now()
-        for i in range(3):  # Try last 3 days
-            date = today - timedelta(days=i)
-            date_url = f"https://oragir.news/hy/material/{date.year}/{date.month:02d}/{date.day:02d}"
-            urls.append(date_url)
-        
-        for url in urls:
-            yield scrapy.Request(url, callback=self.parse, dont_filter=True)
-    
-    # Add custom headers to bypass potential blocking
-    custom_settings = {
-        'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'DEFAULT_REQUEST_HEADERS': {
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'hy-AM,hy;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Referer': 'https://oragir.news/',
-        }
-    }
-
-    def __init__(self, *args, **kwargs):
-        super(OragirSpider, self).__init__(*args, **kwargs)
-        
-        # Redis connection
-        try:
-            self.redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
-            self.redis_client.ping()
-            self.logger.info("🔴 Redis կապակցված է")
-        except Exception as e:
-            self.logger.warning(f"🔴 Redis չկա, կաշխատի առանց cache: {e}")
-            self.redis_client = None
-
-        # API client
-        self.api_base_url = "https://beackkayq.onrender.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'NewsMonitor/1.0'
-        })
-        
-        # Load keywords via API
-        try:
-            response = self.session.get(f"{self.api_base_url}/api/keywords/", timeout=10)
-            if response.status_code == 200:
-                keywords_data = response.json()
-                self.keywords = [kw.get('word', '').lower() for kw in keywords_data]
-                self.logger.info(f"🔑 Բանալի բառեր: {', '.join(self.keywords) if self.keywords else 'Չկա (բոլոր հոդվածները)'}")
-            else:
-                self.logger.warning(f"API keywords error: {response.status_code}")
-                self.keywords = []
-        except Exception as e:
-            self.logger.warning(f"Բանալի բառերը չհաջողվեց բեռնել: {e}")
-            self.keywords = []
-
-        # Statistics
-        self.processed_articles = 0
-        self.new_articles = 0
-        self.cached_skips = 0
-        self.duplicate_articles = 0
 
-    def is_article_processed(self, url, title):
-        """Check if article was already processed using Redis cache"""
-        if not self.redis_client:
-            return False
-        # Create unique hash for article
-        article_hash = hashlib.md5(f"{url}:{title}".encode()).hexdigest()
-        cache_key = f"processed_oragir:{article_hash}"
-        return self.redis_client.exists(cache_key)
-
-    def mark_article_processed(self, url, title):
-        """Mark article as processed in Redis cache"""
-        if not self.redis_client:
-            return
-        # Create unique hash for article
-        article_hash = hashlib.md5(f"{url}:{title}".encode()).hexdigest()
-        cache_key = f"processed_oragir:{article_hash}"
-        # Mark as processed (expire in 7 days)
-        self.redis_client.setex(cache_key, 604800, "1")
-
-    def article_contains_keyword(self, article_text):
-        if not article_text:
-            return False
-        if not self.keywords:  # If no keywords, scrape all articles
-            return True
-        for keyword in self.keywords:
-            if keyword in article_text.lower():
-                return True
-        return False
-
-    def parse(self, response):
-        self.logger.info(f"🔍 Ստուգվում է {response.url}")
-        
-        # Try multiple selectors for different page structures
-        # For the main news feed structure
-        articles = response.css("div.lnews-item")
-        
-        # Try alternative selectors if the main one doesn't work
-        if not articles:
-            articles = response.css("div.news-item")
-        if not articles:
-            articles = response.css("article")
-        if not articles:
-            articles = response.css("div.post")
-        if not articles:
-            articles = response.css("div.item")
-        if not articles:
-            articles = response.css("a[href*='/material/']")  # Direct material links
-        
-        self.logger.info(f"📰 Գտնվել է {len(articles)} հոդված URL-ում: {response.url} (օպտիմիզացված - սահմանափակված 10-ով)")
-        
-        # Limit to latest 10 articles only for optimization (running every 10 minutes)
-        articles = articles[:10]
-
-        # If we found articles with the main structure
-        if articles and articles[0].css("a.ajaxlink.lnews-title"):
-            for article in articles:
-                # Extract link and title using oragir structure
-                link = article.css("a.ajaxlink.lnews-title::attr(href)").get()
-                title_preview = article.css("a.ajaxlink.lnews-title::text").get()
-                time_stamp = article.css("span.float-start.time::text").get()
-                
-                if link and title_preview:
-                    full_url = response.urljoin(link)
-                    
-                    # Check Redis cache first
-                    if self.is_article_processed(full_url, title_preview):
-                        self.cached_skips += 1
-                        continue
-                        
-                    yield scrapy.Request(full_url, callback=self.parse_article)
-        
-        # Try alternative link extraction for other page structures
-        else:
-            # Look for any links that contain "/material/" in the URL
-            material_links = response.css("a[href*='/material/']::attr(href)").getall()
-            for link in material_links[:10]:  # Limit to 10 for optimization (running every 10 minutes)
-                full_url = response.urljoin(link)
-                
-                # Basic check to avoid duplicates
-                if self.is_article_processed(full_url, ""):
-                    self.cached_skips += 1
-                    continue
-                    
-                yield scrapy.Request(full_url, callback=self.parse_article)
+import scrapy
 
-    def parse_article(self, response):
-        self.processed_articles += 1
+from news_scraper.engine import SiteSpider, site_spider
 
-        # Try multiple title selectors for oragir.news
-        title = (response.css("h1::text").get() or
-                response.css(".entry-title::text").get() or
-                response.css(".post-title::text").get() or
-                response.css(".article-title::text").get() or
-                response.css(".news-title::text").get() or
-                response.css(".title::text").get() or
-                response.css("meta[property='og:title']::attr(content)").get() or
-                response.css("title::text").get())
-        
-        # Try multiple content selectors for oragir.news
-        content_parts = (response.css("div.entry-content ::text").getall() or
-                        response.css(".post-content ::text").getall() or
-                        response.css(".article-content ::text").getall() or
-                        response.css(".content ::text").getall() or
-                        response.css(".news-content ::text").getall() or
-                        response.css(".material-content ::text").getall() or
-                        response.css("article ::text").getall() or
-                        response.css(".main-content ::text").getall() or
-                        response.css("div.text ::text").getall() or
-                        response.css("p::text").getall())
-        
-        content = "\n".join([p.strip() for p in content_parts if p.strip()])
+# Daily material archives read besides the front pages
+ARCHIVE_DAYS = 3
 
-        # Extract scraped time - try multiple selectors
-        scraped_time = (response.css('time::attr(datetime)').get() or
-                       response.css('time::text').get() or 
-                       response.css('.date::text').get() or 
-                       response.css('.publish-date::text').get() or
-                       response.css('.post-date::text').get() or
-                       response.css('.news-date::text').get() or
-                       datetime.now().isoformat())
 
-        # Clean title for display
-        display_title = title[:60] + "..." if title and len(title) > 60 else title or "Անանուն հոդված"
-        
-        if self.article_contains_keyword(title) or self.article_contains_keyword(content):
-            self.logger.info(f"✅ Բանալի բառ գտնվեց: {display_title}")
-            # Mark as processed only after successful keyword match
-            self.mark_article_processed(response.url, title)
-            self.new_articles += 1
-            
-            item = NewsScraperItem()
-            item['title'] = title or f'Article from {response.url.split("/")[-1]}'
-            item['link'] = response.url
-            item['source_url'] = response.url
-            item['content'] = content
-            item['scraped_time'] = scraped_time
-            yield item
-        else:
-            self.logger.info(f"❌ Բանալի բառ չգտնվեց: {display_title}")
-            # Mark as processed even if no keyword match to avoid re-checking
-            self.mark_article_processed(response.url, title)
+@site_spider('oragir')
+class OragirSpider(SiteSpider):
+    """oragir.news lists only a few materials on its front page: the last days' archives are read too"""
 
-    def closed(self, reason):
-        """Called when spider finishes"""
-        self.logger.info(f"""
-📊 ԱՄՓՈՓՈՒՄ ORAGIR.NEWS (օպտիմիզացված - միայն 10 հոդված):
-   • Ստուգված հոդվածներ: {self.processed_articles}
-   • Նոր հոդվածներ: {self.new_articles}
-   • Cache-ից բաց թողնված: {self.cached_skips}
-   • Սկրիպտի աշխատանքը: ✅ Ավարտված
-        """.strip())
\ No newline at end of file
+    def start_requests(self):
+        urls = list(self.start_urls)
+        today = datetime.now()
+        for i in range(ARCHIVE_DAYS):
+            date = today - timedelta(days=i)
+            urls.append(f"https://oragir.news/hy/material/{date.year}/{date.month:02d}/{date.day:02d}")
+        for url in urls:
+            yield scrapy.Request(url, callback=self.parse, dont_filter=True)
@@ -0,0 +1,16 @@
+# Spiders built from news_scraper/sites.py
+#
+# One SiteSpider class per SITES entry without a 'module' of its own. The classes are created
+# in this module's namespace so Scrapy's spider loader finds them like hand-written spiders.
+
+from news_scraper.engine import build_spider_class
+from news_scraper.sites import SITES
+
+for _name, _site in SITES.items():
+    if _site.get('module'):
+        continue
+    _cls = build_spider_class(_name, _site, __name__)
+    globals()[_cls.__name__] = _cls
+
+# The loop variable would register the last spider a second time
+del _name, _site, _cls
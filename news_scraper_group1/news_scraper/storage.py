@@ -0,0 +1,120 @@
+# Local state shared by the pipeline, spiders and the monitor: state files (circuit
+# breakers, outbox, snapshots...) and the Redis connection. No Scrapy imports, so the
+# monitor can use it without loading the Scrapy stack.
+
+import json
+import logging
+import os
+import time
+
+# <repo>/state by default; override with NEWS_MONITOR_STATE_DIR (e.g. a Render disk mount)
+DEFAULT_STATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'state'
+)
+
+
+def state_dir():
+    """Return the state directory, creating it if needed"""
+    path = os.environ.get('NEWS_MONITOR_STATE_DIR', DEFAULT_STATE_DIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def state_path(*parts):
+    """Path inside the state directory; parent directories are created"""
+    path = os.path.join(state_dir(), *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def load_json(path, default=None):
+    """Read a JSON file, returning default if it is missing or corrupt"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json_atomic(path, data):
+    """Write JSON via a temp file + rename so readers never see a partial file"""
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def redis_client(decode_responses=True):
+    """Redis connection used across the project (REDIS_URL, default localhost like the spiders).
+
+    Returns None if Redis is not reachable - callers fall back to local/in-memory state.
+    """
+    try:
+        import redis
+        url = os.environ.get('REDIS_URL')
+        if url:
+            client = redis.Redis.from_url(url, decode_responses=decode_responses, socket_connect_timeout=5)
+        else:
+            client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=decode_responses,
+                                 socket_connect_timeout=5)
+        client.ping()
+        return client
+    except Exception:
+        return None
+
+
+class StateStore:
+    """JSON entries keyed by name in one Redis hash, or one state file without Redis"""
+
+    redis_key = None
+    file_name = None
+
+    def __init__(self, redis_client=None, max_age_hours=None):
+        self.redis_client = redis_client
+        self.max_age = 3600 * float(max_age_hours or self.default_max_age_hours())
+        self.file_path = state_path(self.file_name)
+        self.logger = logging.getLogger(__name__)
+
+    def default_max_age_hours(self):
+        return 24 * 365
+
+    def load_all(self):
+        """Every saved entry, regardless of age"""
+        if self.redis_client:
+            try:
+                return {name: json.loads(value) for name, value in self.redis_client.hgetall(self.redis_key).items()}
+            except Exception as e:
+                self.logger.warning(f"⚠️ {self.redis_key}-ը Redis-ից չհաջողվեց կարդալ: {e}")
+        return load_json(self.file_path, {}) or {}
+
+    def load(self, slots):
+        """Saved state for the given slots; entries older than max_age are ignored"""
+        states = {}
+        if self.redis_client:
+            try:
+                raw = self.redis_client.hmget(self.redis_key, list(slots))
+                states = {slot: json.loads(value) for slot, value in zip(slots, raw) if value}
+            except Exception as e:
+                self.logger.warning(f"⚠️ {self.redis_key}-ը Redis-ից չհաջողվեց կարդալ: {e}")
+                states = None
+        if not self.redis_client or states is None:
+            saved = load_json(self.file_path, {}) or {}
+            states = {slot: saved[slot] for slot in slots if slot in saved}
+        now = time.time()
+        return {slot: state for slot, state in states.items() if now - state.get('updated', 0) <= self.max_age}
+
+    def save(self, states):
+        if not states:
+            return
+        if self.redis_client:
+            try:
+                self.redis_client.hset(self.redis_key, mapping={
+                    slot: json.dumps(state) for slot, state in states.items()
+                })
+                return
+            except Exception as e:
+                self.logger.warning(f"⚠️ {self.redis_key}-ը Redis-ում չհաջողվեց պահել: {e}")
+        saved = load_json(self.file_path, {}) or {}
+        saved.update(states)
+        save_json_atomic(self.file_path, saved)
@@ -0,0 +1,92 @@
+# Armenian text normalization for keyword matching
+#
+# Keyword checks used plain .lower() substring tests, redone at every call site. They missed
+# the two spellings of the "և" ligature (Երևան / Երեւան / ԵՐԵՎԱՆ) and could not tell a word
+# from a fragment of one. normalize_text() produces one canonical form - Unicode NFC, case
+# folded, "և"/"եւ" written as "եվ", punctuation folded to spaces - that is computed once per
+# article (NewsScraperItem 'normalized_text') and shared by the spider and pipeline matchers.
+# KeywordMatcher compiles keywords to normalized stems matched at word starts, so "Հայաստան"
+# also finds "Հայաստանի" and "Հայաստանում".
+
+import re
+import unicodedata
+
+# Armenian stress / exclamation / question marks (and soft hyphens, zero-width spaces) sit inside
+# words: dropped, not split on
+MARKS_INSIDE_WORDS = str.maketrans('', '', '\u055b\u055c\u055e\u00ad\u200b\u200c\u200d')
+NON_WORD = re.compile(r'[\W_]+')
+
+# Case and article endings stripped from keywords (longest first); at least MIN_STEM letters stay
+SUFFIXES = sorted(['ներում', 'ներից', 'ներով', 'ներին', 'ների', 'ները', 'երում', 'երից', 'երով', 'երին',
+                   'երի', 'երը', 'ում', 'ից', 'ով', 'ին', 'ը', 'ի'], key=len, reverse=True)
+MIN_STEM = 4
+# -ություն nouns change vowel when declined (կառավարություն -> կառավարության): the stem ends at -ությ
+UTYUN = 'ություն'
+
+
+def normalize_text(text):
+    """NFC, case-folded text with "և" expanded and punctuation folded to single spaces"""
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFC', text).casefold()
+    # casefold() turns the "և" ligature into "եւ"; the reformed spelling (and upper case ԵՎ) is "եվ"
+    text = text.replace('եւ', 'եվ').translate(MARKS_INSIDE_WORDS)
+    return NON_WORD.sub(' ', text).strip()
+
+
+def stem(word):
+    """Normalized word without a trailing case ending"""
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            word = word[:-len(suffix)]
+            break
+    if word.endswith(UTYUN) and len(word) > len(UTYUN):
+        word = word[:-3]
+    return word
+
+
+def keyword_words(keywords):
+    """Keyword strings from the API formats: list of {'word': ...}, list of strings, or {'results': [...]}"""
+    if isinstance(keywords, dict):
+        keywords = keywords.get('results', [])
+    words = []
+    for keyword in keywords or []:
+        word = keyword.get('word', '') if isinstance(keyword, dict) else keyword
+        word = (word or '').strip()
+        if word and word not in words:
+            words.append(word)
+    return words
+
+
+class KeywordMatcher:
+    """Keywords compiled to stem patterns; texts passed in must already be normalize_text() output"""
+
+    def __init__(self, keywords):
+        self.words = keyword_words(keywords)
+        self.patterns = []
+        self.stems = {}
+        for word in self.words:
+            stems = [stem(token) for token in normalize_text(word).split()]
+            if stems:
+                self.stems[word] = stems
+                # Each token may be inflected; tokens of a phrase stay adjacent
+                pattern = r'\w*\s+'.join(re.escape(token) for token in stems)
+                self.patterns.append((word, f'(?<!\\w){pattern}'))
+        self.compiled = [(word, re.compile(pattern)) for word, pattern in self.patterns]
+        self.any = re.compile('|'.join(f'(?:{pattern})' for _, pattern in self.patterns)) if self.patterns else None
+
+    def __bool__(self):
+        return bool(self.words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def search(self, normalized):
+        """True if any keyword occurs in the normalized text"""
+        return bool(normalized) and self.any is not None and self.any.search(normalized) is not None
+
+    def matches(self, normalized):
+        """Keywords (as given) occurring in the normalized text"""
+        if not self.search(normalized):
+            return []
+        return [word for word, pattern in self.compiled if pattern.search(normalized)]
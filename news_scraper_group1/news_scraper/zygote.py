@@ -0,0 +1,422 @@
+# Pre-forked crawler zygote
+#
+# Every spider still runs in its own process (a crash, leak or hung reactor only takes down
+# that run), but instead of starting a fresh interpreter and re-importing Scrapy, Twisted,
+# lxml and the project for each of the ~70 spiders, a warm zygote imports them once and
+# fork()s one child per run. The Twisted reactor is NOT installed in the zygote - each
+# child installs its own (TWISTED_REACTOR) - so children start from a clean state.
+#
+# Protocol: the monitor writes one JSON request per line to the zygote's stdin
+# ({"spiders": [...], "timeout": ...}) and reads one JSON reply per line from its stdout
+# ({"returncode", "stdout", "stderr", "timed_out"}). The child's output is captured to
+# temp files. Run as `python -m news_scraper.zygote` from the Scrapy project directory.
+# Several spiders in one request share the child's reactor and crawl concurrently, each
+# site in its own download slot (see CONCURRENT_REQUESTS* in settings.py) and its share of
+# the CONCURRENT_REQUESTS cap;
+# `python -m news_scraper.zygote crawl <spider> [<spider> ...]` does the same without forking.
+#
+# CRAWL_ZYGOTE_MODE=resident trades per-run isolation for warm connections: the zygote
+# installs the reactor itself and crawls in-process, so the keep-alive pool and DNS cache
+# (news_scraper/connections.py) survive between polls. Run logs are captured from logging;
+# the WorkerGovernor recycling still applies.
+#
+# Nothing heavy is imported at module level: the monitor imports CrawlZygote from here
+# without loading the Scrapy stack. POSIX only (needs os.fork).
+
+import io
+import json
+import logging
+import os
+import select
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+from news_scraper.governor import WorkerGovernor
+
+# Imported once in the zygote; every forked child inherits them already loaded
+PRELOAD_MODULES = [
+    'lxml.html',
+    'twisted.internet.asyncioreactor',
+    'scrapy',
+    'scrapy.crawler',
+    'scrapy.http',
+    'scrapy.utils.project',
+    'news_scraper.settings',
+    'news_scraper.spiderloader',
+    'news_scraper.engine',
+    'news_scraper.sites',
+    'news_scraper.items',
+    'news_scraper.middlewares',
+    'news_scraper.extensions',
+    'news_scraper.pipelines',
+]
+
+POLL_INTERVAL = 0.1
+
+
+def mode():
+    """'fork' (default: one child process per run) or 'resident' (in-process, warm connections)"""
+    return 'resident' if os.environ.get('CRAWL_ZYGOTE_MODE', 'fork') == 'resident' else 'fork'
+
+
+def supported():
+    """Zygote mode needs fork(); off elsewhere or when CRAWL_ZYGOTE=0"""
+    return hasattr(os, 'fork') and os.environ.get('CRAWL_ZYGOTE', '1') != '0'
+
+
+class ZygoteError(RuntimeError):
+    """The zygote died or broke the protocol before a crawl started; the caller should fall back to a plain subprocess"""
+
+
+class ZygoteNoReply(ZygoteError):
+    """The zygote did not answer in time"""
+
+
+# --- zygote side -------------------------------------------------------------------------
+
+def preload():
+    """Import the crawl stack once; fail loudly if anything installed the reactor"""
+    from importlib import import_module
+
+    for name in PRELOAD_MODULES:
+        import_module(name)
+    # A reactor installed here would be shared by every child and clash with TWISTED_REACTOR
+    if 'twisted.internet.reactor' in sys.modules:
+        raise RuntimeError("Twisted reactor was installed while preloading")
+
+
+def share_concurrency(settings, cap, crawlers):
+    """Split the process-wide CONCURRENT_REQUESTS cap between the crawlers of one batch.
+
+    Scrapy applies the setting per crawler; a site's own custom_settings still take priority.
+    """
+    settings.set('CONCURRENT_REQUESTS', max(1, cap // max(1, crawlers)), priority='project')
+
+
+def crawl(*spider_names):
+    """Body of a forked child: `scrapy crawl` for one or more spiders in one reactor"""
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+
+    settings = get_project_settings()
+    share_concurrency(settings, settings.getint('CONCURRENT_REQUESTS'), len(spider_names))
+    process = CrawlerProcess(settings)
+    failed = False
+    for spider_name in spider_names:
+        # An unknown or broken spider must not take the rest of the batch down
+        try:
+            process.crawl(spider_name)
+        except Exception:
+            traceback.print_exc()
+            failed = True
+    if process.crawlers:
+        process.start()
+    return 1 if failed or process.bootstrap_failed else 0
+
+
+def read_capture(capture):
+    capture.seek(0)
+    return capture.read().decode('utf-8', errors='replace')
+
+
+def child_rss_mb(pid):
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / 1024 / 1024
+    except Exception:
+        return 0
+
+
+def run_child(spider_names, timeout, protocol):
+    """Fork a child for one crawl and wait for it with a deadline and a memory ceiling"""
+    max_rss_mb = float(os.environ.get('CRAWL_CHILD_MAX_RSS_MB', 512))
+    stdout_capture = tempfile.TemporaryFile()
+    stderr_capture = tempfile.TemporaryFile()
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            protocol.close()
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            os.dup2(stdout_capture.fileno(), 1)
+            os.dup2(stderr_capture.fileno(), 2)
+            # Children must not share the zygote's random state (User-Agent rotation etc.)
+            import random
+            random.seed()
+            code = crawl(*spider_names)
+        except SystemExit as exit_error:
+            code = exit_error.code if isinstance(exit_error.code, int) else 1
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    deadline = time.monotonic() + timeout
+    timed_out = False
+    memory_exceeded = False
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            break
+        if time.monotonic() > deadline:
+            timed_out = True
+        elif max_rss_mb and child_rss_mb(pid) > max_rss_mb:
+            memory_exceeded = True
+        if timed_out or memory_exceeded:
+            os.kill(pid, signal.SIGKILL)
+            _, status = os.waitpid(pid, 0)
+            break
+        time.sleep(POLL_INTERVAL)
+
+    stderr = read_capture(stderr_capture)
+    if memory_exceeded:
+        stderr += f"\n❌ Spider {', '.join(spider_names)} stopped: memory above {max_rss_mb:.0f} MB\n"
+    reply = {
+        'returncode': os.waitstatus_to_exitcode(status),
+        'stdout': read_capture(stdout_capture),
+        'stderr': stderr,
+        'timed_out': timed_out,
+    }
+    stdout_capture.close()
+    stderr_capture.close()
+    return reply
+
+
+class RunLogCapture(logging.Handler):
+    """Collects the log output of one resident run (what a child would have written to stderr)"""
+
+    def __init__(self, settings):
+        super().__init__(level=settings.get('LOG_LEVEL'))
+        self.setFormatter(logging.Formatter(settings.get('LOG_FORMAT'), settings.get('LOG_DATEFORMAT')))
+        self.buffer = io.StringIO()
+
+    def emit(self, record):
+        try:
+            self.buffer.write(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
+
+    def take(self):
+        text = self.buffer.getvalue()
+        self.buffer = io.StringIO()
+        return text
+
+
+def serve_resident(send):
+    """Resident loop: one reactor for the zygote's lifetime; requests are crawled in-process"""
+    import resource
+
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+    from scrapy.utils.reactor import install_reactor
+
+    settings = get_project_settings()
+    concurrency_cap = settings.getint('CONCURRENT_REQUESTS')
+    install_reactor(settings['TWISTED_REACTOR'])
+    from twisted.internet import defer, reactor
+
+    process = CrawlerProcess(settings, install_root_handler=False)
+    capture = RunLogCapture(settings)
+    logging.root.addHandler(capture)
+    logging.root.setLevel(settings.get('LOG_LEVEL'))
+    logger = logging.getLogger(__name__)
+
+    def run(request):
+        spider_names = request.get('spiders') or [request['spider']]
+        state = {'timed_out': False, 'failed': False}
+        process.bootstrap_failed = False
+        crawlers = []
+        deferreds = []
+        capture.take()
+        share_concurrency(process.settings, concurrency_cap, len(spider_names))
+        for spider_name in spider_names:
+            try:
+                crawler = process.create_crawler(spider_name)
+                deferreds.append(process.crawl(crawler))
+                crawlers.append(crawler)
+            except Exception:
+                logger.exception(f"❌ Spider {spider_name} չհաջողվեց գործարկել")
+                state['failed'] = True
+
+        def expire():
+            state['timed_out'] = True
+            for crawler in crawlers:
+                crawler.stop()
+
+        timer = reactor.callLater(float(request.get('timeout', 120)), expire)
+
+        def finished(results):
+            if timer.active():
+                timer.cancel()
+            for success, failure in results:
+                if not success:
+                    logger.error(failure.getTraceback())
+                    state['failed'] = True
+            send({
+                'returncode': 1 if state['failed'] or process.bootstrap_failed else 0,
+                'stdout': '',
+                'stderr': capture.take(),
+                'timed_out': state['timed_out'],
+                # The crawl ran in this process: its peak RSS (KB on Linux) for the governor
+                'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            })
+
+        defer.DeferredList(deferreds, consumeErrors=True).addCallback(finished)
+
+    def read_requests():
+        for line in sys.stdin:
+            if line.strip():
+                reactor.callFromThread(run, json.loads(line))
+        reactor.callFromThread(reactor.stop)
+
+    threading.Thread(target=read_requests, daemon=True).start()
+    # Installs the DNS resolver and runs the reactor until stdin is closed
+    process.start(stop_after_crawl=False, install_signal_handlers=False)
+    return 0
+
+
+def serve():
+    """Zygote main loop: preload, then one forked child per request line"""
+    # Keep the real stdout for replies only; stray prints from imports go to stderr
+    protocol = os.fdopen(os.dup(1), 'w', encoding='utf-8')
+    os.dup2(2, 1)
+
+    def send(message):
+        protocol.write(json.dumps(message, ensure_ascii=False) + '\n')
+        protocol.flush()
+
+    started = time.monotonic()
+    try:
+        preload()
+    except Exception as error:
+        send({'ready': False, 'error': f"{type(error).__name__}: {error}"})
+        return 1
+    send({
+        'ready': True,
+        'mode': mode(),
+        'pid': os.getpid(),
+        'modules': len(sys.modules),
+        'preload_seconds': round(time.monotonic() - started, 2),
+    })
+    if mode() == 'resident':
+        return serve_resident(send)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        spider_names = request.get('spiders') or [request['spider']]
+        send(run_child(spider_names, float(request.get('timeout', 120)), protocol))
+    return 0
+
+
+# --- monitor side ------------------------------------------------------------------------
+
+class CrawlZygote:
+    """Client for the zygote process; started lazily, recycled by the governor, replaced when it dies"""
+
+    STARTUP_TIMEOUT = 60
+    # Extra time for the reply on top of the child's own timeout (kill + reading captures)
+    REPLY_GRACE = 15
+
+    def __init__(self, project_path, env=None):
+        self.project_path = project_path
+        self.env = env
+        self.process = None
+        self.info = {}
+        self.governor = WorkerGovernor()
+        # Set when the governor retired the zygote after the last run
+        self.retired_reason = None
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'news_scraper.zygote'],
+            cwd=self.project_path,
+            env=self.env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+        )
+        self.info = self._read_reply(self.STARTUP_TIMEOUT)
+        if not self.info.get('ready'):
+            self.close()
+            raise ZygoteError(f"Zygote failed to start: {self.info.get('error')}")
+        self.governor.reset()
+        return self.info
+
+    def _read_reply(self, timeout):
+        ready, _, _ = select.select([self.process.stdout], [], [], timeout)
+        if not ready:
+            self.close()
+            raise ZygoteNoReply(f"No reply from zygote within {timeout:.0f}s")
+        line = self.process.stdout.readline()
+        if not line:
+            self.close()
+            raise ZygoteError("Zygote exited")
+        return json.loads(line)
+
+    def run(self, spider_names, timeout=120):
+        """Run one spider (or a list of them together) in a forked child; same contract as subprocess.run(..., timeout=...)"""
+        if isinstance(spider_names, str):
+            spider_names = [spider_names]
+        if not self.alive():
+            self.start()
+        command = ['news_scraper.zygote', 'crawl', *spider_names]
+        try:
+            self.process.stdin.write(json.dumps({'spiders': list(spider_names), 'timeout': timeout}) + '\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as error:
+            self.close()
+            raise ZygoteError(f"Zygote pipe closed: {error}")
+        # From here the crawl is in flight: a failure is this run's result, not a reason to run the
+        # sites again in a subprocess (that would crawl them twice and double the time spent)
+        try:
+            reply = self._read_reply(timeout + self.REPLY_GRACE)
+        except ZygoteNoReply:
+            raise subprocess.TimeoutExpired(command, timeout)
+        except ZygoteError as error:
+            return subprocess.CompletedProcess(command, 1, '', f"Zygote exited during the crawl: {error}")
+        # Only a resident run reports a peak RSS (the zygote's own). A forked child's memory is
+        # gone with it and CRAWL_CHILD_MAX_RSS_MB bounds it, so fork mode samples the zygote
+        self.retired_reason = self.governor.record_run(self.process.pid, reply.get('max_rss_mb'))
+        if self.retired_reason:
+            # Drained between runs: nothing is in flight, the next run starts a fresh zygote
+            self.close()
+        if reply.get('timed_out'):
+            raise subprocess.TimeoutExpired(command, timeout, reply.get('stdout'), reply.get('stderr'))
+        return subprocess.CompletedProcess(command, reply['returncode'], reply['stdout'], reply['stderr'])
+
+    def close(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except Exception:
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['crawl']:
+        sys.exit(crawl(*sys.argv[2:]))
+    sys.exit(serve())
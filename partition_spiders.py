@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Split the sites into balanced monitor groups from their recorded run costs.
+
+RunCostRecorder (news_scraper/extensions.py) keeps each spider's average run time and
+downloaded bytes. A spider's cost is its run time, or the time its bytes take at
+--bandwidth if that is longer; spiders without history get the median cost. The spiders
+are bin-packed into --groups groups, largest first into the least loaded group, and the
+result is written to spider_groups.json. A monitor started with SPIDER_GROUP=<n> crawls
+only group n.
+
+Usage:
+    python partition_spiders.py --groups 3
+    python partition_spiders.py --groups 3 --dry-run
+"""
+
+import argparse
+import heapq
+import json
+import os
+import statistics
+import sys
+import time
+
+PROJECT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'news_scraper_group1')
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spider_groups.json')
+
+# Cost of a spider when no spider has any history yet (seconds)
+DEFAULT_COST = 30.0
+
+
+def spider_costs(spiders, records, bandwidth):
+    """{spider: expected seconds per run}"""
+    costs = {}
+    for name in spiders:
+        record = records.get(name)
+        if record:
+            costs[name] = max(record.get('duration', 0), record.get('bytes', 0) / bandwidth)
+    fallback = statistics.median(costs.values()) if costs else DEFAULT_COST
+    return {name: costs.get(name, fallback) for name in spiders}, fallback
+
+
+def partition(costs, group_count):
+    """Longest-processing-time-first bin packing: [(total_cost, [spiders])] per group"""
+    heap = [(0.0, index) for index in range(group_count)]
+    groups = [[] for _ in range(group_count)]
+    totals = [0.0] * group_count
+    for name in sorted(costs, key=lambda spider: (-costs[spider], spider)):
+        total, index = heapq.heappop(heap)
+        groups[index].append(name)
+        totals[index] = total + costs[name]
+        heapq.heappush(heap, (totals[index], index))
+    return list(zip(totals, groups))
+
+
+def run(args):
+    sys.path.insert(0, PROJECT_PATH)
+    from news_scraper.budgets import RunCostStore
+    from news_scraper.sites import SITES
+    from news_scraper.storage import redis_client
+
+    spiders = sorted(SITES)
+    records = RunCostStore(redis_client()).load_all()
+    costs, fallback = spider_costs(spiders, records, args.bandwidth)
+    known = sum(1 for name in spiders if name in records)
+    print(f"📏 {len(spiders)} spider, որից {known}-ը ունի պատմություն (մնացածը՝ {fallback:.1f} վրկ)")
+
+    groups = partition(costs, args.groups)
+    assignment = {
+        'generated': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'batch_size': args.batch_size,
+        'groups': [],
+    }
+    for index, (total, names) in enumerate(groups):
+        # Batches of batch_size spiders run concurrently, so a cycle takes about total / batch_size
+        cycle_seconds = total / args.batch_size
+        assignment['groups'].append({
+            'spiders': sorted(names),
+            'cost_seconds': round(total, 1),
+            'expected_cycle_seconds': round(cycle_seconds, 1),
+        })
+        print(f"  SPIDER_GROUP={index}: {len(names)} spider, ~{cycle_seconds:.0f} վրկ/ցիկլ")
+
+    if args.dry_run:
+        print(json.dumps(assignment, ensure_ascii=False, indent=2))
+        return assignment
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(assignment, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    print(f"💾 Խմբերը գրվեցին {args.output}")
+    return assignment
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bin-pack spiders into balanced monitor groups")
+    parser.add_argument('--groups', type=int, default=2, help="number of monitor workers / groups")
+    parser.add_argument('--batch-size', type=int, default=int(os.environ.get('CRAWL_BATCH_SIZE', 4)),
+                        help="spiders crawled together by a monitor (CRAWL_BATCH_SIZE)")
+    parser.add_argument('--bandwidth', type=float, default=2 * 1024 * 1024,
+                        help="bytes per second one spider can download")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--dry-run', action='store_true', help="print the assignment instead of writing it")
+    args = parser.parse_args()
+    if args.groups < 1 or args.batch_size < 1:
+        parser.error("--groups and --batch-size must be at least 1")
+    run(args)
+
+
+if __name__ == "__main__":
+    main()